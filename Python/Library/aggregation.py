@@ -0,0 +1,96 @@
+from datetime import date as _date
+
+__all__ = ['REDUCERS', 'FREQUENCIES', 'period_key', 'group_ranges', 'reduce_column']
+
+def _mean(values):
+    return sum(values) / len(values) if values else None
+
+def _median(values):
+    if not values:
+        return None
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+# Reducers by name, called with the non-missing values of a group; without values, 'sum' and 'count' give 0, the others None
+REDUCERS = {
+    'mean': _mean,
+    'sum': sum,
+    'min': lambda values: min(values) if values else None,
+    'max': lambda values: max(values) if values else None,
+    'median': _median,
+    'count': len,
+    'first': lambda values: values[0] if values else None,
+    'last': lambda values: values[-1] if values else None,
+}
+
+def _week(date):
+    year, week, _ = _date(int(date[:4]), int(date[5:7]), int(date[8:10])).isocalendar()
+    return f"{year}-W{week:02d}"
+
+# Period key of a 'yyyy-MM-dd' date, by frequency: the date, the ISO week ('2024-W01') or the month ('2024-01')
+FREQUENCIES = {
+    'D': lambda date: date,
+    'W': _week,
+    'M': lambda date: date[:7],
+}
+
+def period_key(date, freq):
+    """
+    Get the period holding a date.
+
+    :param date: The date, as a 'yyyy-MM-dd' string.
+    :param freq: 'D' for days, 'W' for ISO weeks or 'M' for months.
+    :return: The period key: the date, the week ('2024-W01') or the month ('2024-01').
+    """
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Invalid freq value, expected 'D', 'W' or 'M': {freq}")
+    return FREQUENCIES[freq](date)
+
+def group_ranges(dates, counts, freq):
+    """
+    Group consecutive records by period.
+
+    :param dates: The date of each day.
+    :param counts: The number of records of each day (1 for daily records).
+    :param freq: 'D', 'W' or 'M' (see `period_key`).
+    :return: A dictionary mapping each period key, in order of first appearance, to the list of
+             (start, stop) position ranges of its records.
+    """
+    if freq not in FREQUENCIES:
+        raise ValueError(f"Invalid freq value, expected 'D', 'W' or 'M': {freq}")
+    key_of = FREQUENCIES[freq]
+    groups = {}
+    start = 0
+    last = None
+    for date, count in zip(dates, counts):
+        key = key_of(date)
+        ranges = groups.setdefault(key, [])
+        if key == last and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], start + count)
+        else:
+            ranges.append((start, start + count))
+        last = key
+        start += count
+    return groups
+
+def reduce_column(column, groups, reducer):
+    """
+    Reduce the values of a column by group, skipping missing values (None or NaN).
+
+    :param column: The column, an array('d') or a list (see `columns.to_column`).
+    :param groups: The position ranges of each group (see `group_ranges`).
+    :param reducer: A reducer name of REDUCERS, or a callable taking the list of non-missing values of a group.
+    :return: A dictionary mapping each group key to its reduced value.
+    """
+    function = REDUCERS.get(reducer) if isinstance(reducer, str) else reducer
+    if function is None:
+        raise ValueError(f"Invalid reducer, expected one of {', '.join(REDUCERS)} or a callable: {reducer}")
+    results = {}
+    for key, ranges in groups.items():
+        if len(ranges) == 1:
+            values = column[ranges[0][0]:ranges[0][1]]
+        else:
+            values = [value for start, stop in ranges for value in column[start:stop]]
+        results[key] = function([value for value in values if value is not None and value == value])
+    return results
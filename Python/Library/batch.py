@@ -0,0 +1,125 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .constants import *
+from .instrumentation import new_session
+from .shared import _take, _untrack, share_weather_data
+from .snapshot import decode_columns, parse_snapshot
+from .weather import Weather
+
+__all__ = ['decode_payload', 'fetch_many']
+
+# Session of the Weather objects computing the derived elements of the payloads, shared as they never fetch
+_DERIVED_SESSION = new_session()
+
+def _add_derived(weather_data, derived):
+    """
+    Compute derived elements over weather data and store them in its days or hours.
+    """
+    weather = Weather(session=_DERIVED_SESSION)
+    weather.set_weather_data(weather_data)
+    for level, functions in derived.items():
+        if level not in (DAYS, HOURS):
+            raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+        days = weather_data.get(DAYS, [])
+        records = days if level == DAYS else [hour for day in days for hour in day.get(HOURS, [])]
+        for element, function in functions.items():
+            for record, value in zip(records, function(weather)):
+                record[element] = None if value is None or value != value else value
+    return weather_data
+
+def decode_payload(content, derived=None):
+    """
+    Decode the JSON body of a response in a worker process, compute the derived elements, and
+    write the result to a new shared memory block in the snapshot format (see `snapshot.dump_snapshot`),
+    columns of floats instead of the dictionaries of every hour.
+
+    :param content: The raw bytes of the response body.
+    :param derived: A dictionary mapping 'days' or 'hours' to a dictionary of derived elements: the
+                    name of each element and a picklable callable computing its values from a
+                    Weather object, one per record, e.g. `functools.partial(indices.heat_index, unit_group='metric')`.
+    :return: A tuple of the name of the shared memory block, to be read and unlinked by the caller,
+             and the size of the snapshot.
+    """
+    weather_data = json.loads(content)
+    if derived:
+        _add_derived(weather_data, derived)
+    block = share_weather_data(weather_data)
+    # the block is owned by the caller from now on, not cleaned up when this process exits
+    _untrack(block)
+    block.close()
+    return block.name, block.size
+
+def _read_block(name, size):
+    """
+    Read a snapshot from a shared memory block written by `decode_payload`, unlinking the block.
+    Nothing is copied but the columns: the hours of each day are decoded from the mapped block on
+    first access, and its memory is freed with the weather data. Returns the weather data and its
+    columns, for the Weather object to use as they are rather than building them from the hours.
+    """
+    buffer = _take(name, size)
+    return parse_snapshot(buffer), {level: decode_columns(buffer, level) for level in (DAYS, HOURS)}
+
+def _decoder(pool, derived):
+    """
+    Make the decoder of the Weather objects of a batch: with a process pool, responses are decoded
+    in its processes and read back from shared memory; otherwise, in the fetching threads.
+    """
+    if pool is None:
+        def decode(content):
+            weather_data = json.loads(content)
+            return _add_derived(weather_data, derived) if derived else weather_data
+    else:
+        def decode(content):
+            return _read_block(*pool.submit(decode_payload, content, derived).result())
+    return decode
+
+def fetch_many(locations, from_date='', to_date='', unit_group='us', include=None, elements='', max_workers=8,
+               processes=0, derived=None, **options):
+    """
+    Fetch the weather data of many locations concurrently, into one Weather object per location.
+
+    Responses are fetched by a pool of threads sharing a pooled session. With `processes`, their
+    bytes are handed to a pool of processes that decode the JSON, compute the derived elements and
+    return the data as compact columns through shared memory, so that decoding is not limited to
+    one core by the GIL. These columns then serve `Weather.get_weather_columns` and the analyses
+    built on it as they are, and the hours of each day are only built from them on first access
+    (see `snapshot.parse_snapshot`).
+
+    :param locations: The locations, or dictionaries of `Weather.fetch_weather_data` arguments (e.g. a
+                      'location' and its own 'from_date' and 'to_date').
+    :param from_date: The default start date of the fetches.
+    :param to_date: The default end date of the fetches.
+    :param unit_group: The default unit group of the fetches.
+    :param include: The default data types to include.
+    :param elements: The default elements to retrieve.
+    :param max_workers: The number of concurrent fetches.
+    :param processes: The number of decoding processes, None for the number of CPUs, or 0 (the default)
+                      to decode in the fetching threads. The processes import the calling module on
+                      platforms starting them with spawn (Windows, macOS), which then needs an
+                      `if __name__ == '__main__':` guard.
+    :param derived: Derived elements computed over the data of each location (see `decode_payload`).
+    :param options: Arguments of the Weather objects (base_url, api_key, projection, budget, hooks, ...).
+    :return: The list of the Weather objects, in the order of the locations.
+    :raises Exception: The first error of the fetches, once all of them are done.
+    """
+    defaults = {'from_date': from_date, 'to_date': to_date, 'unit_group': unit_group, 'include': include, 'elements': elements}
+    options.setdefault('session', new_session())
+    pool = ProcessPoolExecutor(processes) if processes != 0 else None
+    try:
+        decode = _decoder(pool, derived)
+
+        def fetch(request):
+            arguments = dict(defaults, **(request if isinstance(request, dict) else {'location': request}))
+            weather = Weather(decoder=decode, **options)
+            try:
+                weather.fetch_weather_data(**arguments)
+            finally:
+                weather.decoder = None
+            return weather
+        with ThreadPoolExecutor(max_workers) as threads:
+            futures = [threads.submit(fetch, request) for request in locations]
+        return [future.result() for future in futures]
+    finally:
+        if pool is not None:
+            pool.shutdown()
@@ -0,0 +1,188 @@
+import re
+import threading
+import time
+from datetime import datetime
+
+from .constants import DAYS
+
+__all__ = ['QueryBudget', 'BudgetExceededError']
+
+# Number of days returned by a forecast request without dates
+DEFAULT_FORECAST_DAYS = 15
+
+class BudgetExceededError(Exception):
+    """
+    Raised when a request would take the query cost over the configured budget.
+    """
+
+class QueryBudget:
+    """
+    A query cost budget shared by any number of `Weather` objects and threads.
+
+    Before each request the cost is estimated and reserved; the reservation is then settled with
+    the `queryCost` of the response, or released if the request failed. Requests that do not fit in
+    the remaining budget are refused with `BudgetExceededError`, or deferred until the budget period
+    rolls over.
+
+    Example:
+        budget = QueryBudget(limit=1000, period=24 * 3600)
+        weather = Weather(api_key='Your API Key', budget=budget)
+    """
+
+    def __init__(self, limit, period=None, on_exceed='raise', max_wait=None, include_factors=None):
+        """
+        Parameters:
+            limit (float): The maximum query cost per period.
+            period (float): Length of the budget period in seconds, starting at the first request;
+                            None for a budget that never resets.
+            on_exceed (str): 'raise' to refuse the requests over budget, or 'defer' to wait for the next period.
+            max_wait (float): Maximum seconds a deferred request waits before being refused, unlimited if None.
+            include_factors (dict): Cost multiplier of each `include` section (e.g. {'minutes': 4}),
+                                    1 for the sections not listed.
+        """
+        if on_exceed not in ('raise', 'defer'):
+            raise ValueError(f"Invalid on_exceed value, expected 'raise' or 'defer': {on_exceed}")
+        if on_exceed == 'defer' and period is None:
+            raise ValueError("Deferring requests requires a budget period")
+        self.limit = limit
+        self.period = period
+        self.on_exceed = on_exceed
+        self.max_wait = max_wait
+        self.include_factors = include_factors or {}
+        self.__condition = threading.Condition()
+        self.__period_start = None
+        self.__spent = 0.0
+        self.__reserved = 0.0
+
+    @staticmethod
+    def count_days(from_date='', to_date=''):
+        """
+        Count the days requested by a date range of the Timeline API.
+
+        Parameters:
+            from_date (str): Start date (`yyyy-MM-dd`, a datetime or a dynamic period such as 'last30days').
+            to_date (str): End date (`yyyy-MM-dd` or a datetime).
+
+        Returns:
+            int: The number of days; 15 for a forecast request without dates.
+        """
+        if not from_date:
+            return DEFAULT_FORECAST_DAYS
+        period = re.fullmatch(r'(last|next)(\d+)days', from_date)
+        if period:
+            return int(period.group(2))
+        try:
+            start = datetime.strptime(from_date[:10], '%Y-%m-%d')
+        except ValueError:
+            # other dynamic periods, e.g. 'today' or 'yesterday', are single days
+            return 1
+        if not to_date:
+            return 1
+        return max(1, (datetime.strptime(to_date[:10], '%Y-%m-%d') - start).days + 1)
+
+    def estimate(self, from_date='', to_date='', include=DAYS, locations=1):
+        """
+        Estimate the query cost of a request before sending it.
+
+        The estimate is the number of days, times the number of locations, times the largest
+        factor of the included sections.
+
+        Parameters:
+            from_date (str): Start date of the request.
+            to_date (str): End date of the request.
+            include (str): Comma-separated data sections of the request.
+            locations (int): Number of locations requested with these dates.
+
+        Returns:
+            float: The estimated query cost.
+        """
+        factor = max([self.include_factors.get(section, 1) for section in (include or DAYS).split(',')] or [1])
+        return QueryBudget.count_days(from_date, to_date) * locations * factor
+
+    def __roll_period(self, now):
+        if self.__period_start is None:
+            self.__period_start = now
+        elif self.period is not None and now - self.__period_start >= self.period:
+            self.__period_start += (now - self.__period_start) // self.period * self.period
+            self.__spent = 0.0
+
+    def reserve(self, cost):
+        """
+        Reserve an estimated cost before sending a request.
+
+        Parameters:
+            cost (float): The estimated query cost.
+
+        Returns:
+            float: The reserved cost, to pass to `settle` or `release`.
+
+        Raises:
+            BudgetExceededError: If the cost does not fit in the budget (after waiting, in 'defer' mode).
+        """
+        if cost > self.limit:
+            raise BudgetExceededError(f"Estimated query cost {cost} exceeds the whole budget of {self.limit}")
+        deadline = None if self.max_wait is None else time.monotonic() + self.max_wait
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                self.__roll_period(now)
+                if self.__spent + self.__reserved + cost <= self.limit:
+                    self.__reserved += cost
+                    return cost
+                if self.on_exceed == 'raise' or (deadline is not None and now >= deadline):
+                    raise BudgetExceededError(f"Estimated query cost {cost} exceeds the remaining budget of {self.get_remaining()}")
+                # wait for the period to roll over or for a reservation to be released
+                wait = self.__period_start + self.period - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+                self.__condition.wait(max(wait, 0.0))
+
+    def settle(self, reserved, cost):
+        """
+        Replace a reservation by the actual query cost of the response.
+
+        Parameters:
+            reserved (float): The cost returned by `reserve`.
+            cost (float): The `queryCost` of the response, the reserved cost is used if None.
+        """
+        with self.__condition:
+            self.__reserved -= reserved
+            self.__spent += reserved if cost is None else cost
+            self.__condition.notify_all()
+
+    def release(self, reserved):
+        """
+        Cancel a reservation, e.g. when the request failed.
+
+        Parameters:
+            reserved (float): The cost returned by `reserve`.
+        """
+        with self.__condition:
+            self.__reserved -= reserved
+            self.__condition.notify_all()
+
+    def get_spent(self):
+        """
+        Returns:
+            float: The query cost spent in the current period.
+        """
+        with self.__condition:
+            self.__roll_period(time.monotonic())
+            return self.__spent
+
+    def get_remaining(self):
+        """
+        Returns:
+            float: The query cost still available in the current period, net of the pending reservations.
+        """
+        with self.__condition:
+            return self.limit - self.get_spent() - self.__reserved
+
+    def reset(self):
+        """
+        Start a new budget period with nothing spent.
+        """
+        with self.__condition:
+            self.__period_start = None
+            self.__spent = 0.0
+            self.__condition.notify_all()
@@ -0,0 +1,249 @@
+import sys
+from array import array
+
+from .constants import *
+from .lazy import LazyList
+
+__all__ = ['get_records', 'get_default_elements', 'is_numeric_element', 'to_column', 'to_columns', 'diff_weather_data',
+           'intern_records', 'intern_weather_data', 'encode_categorical', 'decode_categorical']
+
+NAN = float('nan')
+
+def get_records(weather_data, level):
+    """
+    Get the records of a level of the weather data.
+
+    :param weather_data: The weather data dictionary.
+    :param level: 'days' for the daily records, or 'hours' for the hourly records of all days.
+    :return: The list of record dictionaries.
+    """
+    if level == DAYS:
+        return weather_data.get(DAYS, [])
+    if level == HOURS:
+        return [hour for day in weather_data.get(DAYS, []) for hour in day.get(HOURS, [])]
+    raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+
+def get_default_elements(level):
+    """
+    Get the elements of the records of a level, as listed in DAYS_Keys and HOURS_Keys.
+
+    :param level: 'days' or 'hours'.
+    :return: The list of element names, without the nested 'hours'.
+    """
+    return [key for key in DAYS_Keys if key != HOURS] if level == DAYS else list(HOURS_Keys)
+
+def is_numeric_element(element, records):
+    """
+    Check if an element holds numbers, from the known element types or else from the first value found.
+
+    :param element: The element name.
+    :param records: The records holding the element.
+    :return: True if the element is numeric, False otherwise.
+    """
+    if element in NUMERIC_Keys:
+        return True
+    if element in STRING_Keys or element in LIST_Keys:
+        return False
+    value = next((record[element] for record in records if record.get(element) is not None), None)
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def to_column(records, element):
+    """
+    Gather the values of an element across records into a column.
+
+    Numeric elements become contiguous float arrays (`array('d')`) with NaN for missing values;
+    other elements (and numeric elements holding values of other types) become lists.
+
+    :param records: The list of record dictionaries.
+    :param element: The element name.
+    :return: The column, an array('d') or a list.
+    """
+    values = [record.get(element) for record in records]
+    if is_numeric_element(element, records):
+        try:
+            return array('d', [NAN if value is None else value for value in values])
+        except TypeError:
+            pass
+    return values
+
+def to_columns(records, elements):
+    """
+    Convert records into columns.
+
+    :param records: The list of record dictionaries.
+    :param elements: The element names to convert.
+    :return: A dictionary mapping each element to its column (see `to_column`).
+    """
+    return {element: to_column(records, element) for element in elements}
+
+def intern_records(records):
+    """
+    Intern the values of the categorical elements (see CATEGORICAL_Keys) of records in place, so that
+    repeated values, e.g. the `conditions` of thousands of hours, share a single string object.
+    Lists (e.g. `stations`) keep their own list object, holding interned strings.
+
+    :param records: The list of record dictionaries.
+    :return: The same list.
+    """
+    intern = sys.intern
+    for record in records:
+        for element in CATEGORICAL_Keys:
+            value = record.get(element)
+            if type(value) is str:
+                record[element] = intern(value)
+            elif type(value) is list:
+                record[element] = [intern(item) if type(item) is str else item for item in value]
+    return records
+
+def intern_weather_data(weather_data):
+    """
+    Intern the categorical values of the days and hours of weather data in place (see `intern_records`).
+    Hours not decoded yet (see `LazyList`) are left as they are.
+
+    :param weather_data: The weather data dictionary.
+    :return: The same dictionary.
+    """
+    days = intern_records(weather_data.get(DAYS, []))
+    for day in days:
+        hours = day.get(HOURS)
+        if isinstance(hours, list) and not (isinstance(hours, LazyList) and not hours.is_materialized()):
+            intern_records(hours)
+    return weather_data
+
+def encode_categorical(values):
+    """
+    Dictionary-encode a column: each distinct value is stored once in a table, and the column
+    becomes the integer codes of its values in the table.
+
+    :param values: The list of values (strings, lists of strings, None...).
+    :return: A tuple of the codes, an array('i'), and the table, a list of the distinct values.
+    """
+    positions = {}
+    table = []
+    codes = array('i')
+    for value in values:
+        key = tuple(value) if isinstance(value, list) else value
+        code = positions.get(key)
+        if code is None:
+            code = positions[key] = len(table)
+            table.append(value)
+        codes.append(code)
+    return codes, table
+
+def decode_categorical(codes, table):
+    """
+    Decode a dictionary-encoded column (see `encode_categorical`). Values repeated in the column are
+    the same object, except lists, copied for each value.
+
+    :param codes: The integer codes.
+    :param table: The list of the distinct values.
+    :return: The list of values.
+    """
+    if any(isinstance(value, list) for value in table):
+        return [list(value) if isinstance(value, list) else value for value in map(table.__getitem__, codes)]
+    return list(map(table.__getitem__, codes))
+
+def _changed_positions(old_column, new_column):
+    """
+    Return the positions where two columns of the same length differ, NaN being equal to NaN.
+    """
+    if isinstance(old_column, array) and isinstance(new_column, array):
+        if old_column.tobytes() == new_column.tobytes():
+            return []
+        return [i for i, (old, new) in enumerate(zip(old_column, new_column)) if old != new and (old == old or new == new)]
+    if old_column == new_column:
+        return []
+    return [i for i, (old, new) in enumerate(zip(old_column, new_column)) if old != new]
+
+def _union_elements(records_lists, exclude=()):
+    """
+    Return the elements found in any of the records, in the order of the first records.
+    """
+    found = set().union(*[record for records in records_lists for record in records])
+    ordered = [element for records in records_lists for record in records[:1] for element in record]
+    return [element for element in dict.fromkeys(ordered + sorted(found - set(ordered))) if element not in exclude]
+
+def _diff_columnar(old_days, new_days, elements):
+    """
+    Diff weather data whose days and hours are the same, comparing whole columns at once.
+    """
+    changes = []
+    levels = [(old_days, new_days, None)]
+    old_hours = [(d, h) for d, day in enumerate(old_days) for h, _ in enumerate(day.get(HOURS, []))]
+    if old_hours:
+        levels.append(([hour for day in old_days for hour in day.get(HOURS, [])],
+                       [hour for day in new_days for hour in day.get(HOURS, [])], old_hours))
+    for old_records, new_records, positions in levels:
+        level_elements = elements or _union_elements([old_records, new_records], (HOURS,))
+        for order, element in enumerate(level_elements):
+            if element == HOURS:
+                continue
+            for i in _changed_positions(to_column(old_records, element), to_column(new_records, element)):
+                day, hour = (i, None) if positions is None else positions[i]
+                changes.append(((day, -1 if hour is None else hour, order), {
+                    'day': old_days[day][DATETIME],
+                    'time': None if hour is None else old_records[i][DATETIME],
+                    'element': element,
+                    'old': old_records[i].get(element),
+                    'new': new_records[i].get(element),
+                }))
+    changes.sort(key=lambda change: change[0])
+    return [change for _, change in changes]
+
+def _diff_records(old_records, new_records, elements, day=None):
+    """
+    Diff records matched by their datetime value, returning the changes of the matched records and
+    the added or removed records (with a None element).
+    """
+    changes = []
+    new_by_datetime = {record.get(DATETIME): record for record in new_records}
+    old_datetimes = set()
+    for old in old_records:
+        key = old.get(DATETIME)
+        old_datetimes.add(key)
+        new = new_by_datetime.get(key)
+        if new is None:
+            changes.append({'day': day or key, 'time': key if day else None, 'element': None, 'old': old, 'new': None})
+            continue
+        if old == new:
+            continue
+        for element in elements or _union_elements([[old, new]], (HOURS,)):
+            if element != HOURS and old.get(element) != new.get(element):
+                changes.append({'day': day or key, 'time': key if day else None, 'element': element,
+                                'old': old.get(element), 'new': new.get(element)})
+        if day is None:
+            changes.extend(_diff_records(old.get(HOURS, []), new.get(HOURS, []), elements, key))
+    for new in new_records:
+        key = new.get(DATETIME)
+        if key not in old_datetimes:
+            changes.append({'day': day or key, 'time': key if day else None, 'element': None, 'old': None, 'new': new})
+    return changes
+
+def diff_weather_data(old_data, new_data, elements=None, columnar=False):
+    """
+    Compare two weather data dictionaries day by day and hour by hour.
+
+    Each change is a dictionary with the 'day' date, the 'time' of the hour (None for daily values),
+    the 'element' name and its 'old' and 'new' values. A day or hour present in only one of the
+    data has a None element, and the whole record as its old or new value.
+
+    Days and hours are matched by their datetime values, and identical records are skipped at once.
+    In columnar mode, for data holding the same days and hours, the comparison instead runs column
+    by column: each element's values are gathered into contiguous arrays compared in one go, and
+    only the columns that differ are walked.
+
+    :param old_data: The reference weather data dictionary.
+    :param new_data: The weather data dictionary compared to it.
+    :param elements: The element names to compare, all the elements found if empty.
+    :param columnar: Whether to compare column by column.
+    :return: The list of changes, ordered by day, then hour, then element.
+    :raises ValueError: If the columnar comparison is requested for data with different days or hours.
+    """
+    old_days, new_days = old_data.get(DAYS, []), new_data.get(DAYS, [])
+    if not columnar:
+        return _diff_records(old_days, new_days, elements)
+    if not ([day.get(DATETIME) for day in old_days] == [day.get(DATETIME) for day in new_days] and
+            all([hour.get(DATETIME) for hour in old.get(HOURS, [])] == [hour.get(DATETIME) for hour in new.get(HOURS, [])]
+                for old, new in zip(old_days, new_days))):
+        raise ValueError("The columnar comparison requires weather data with the same days and hours")
+    return _diff_columnar(old_days, new_days, elements)
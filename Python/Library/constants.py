@@ -1,5 +1,7 @@
 # Define base url for the Visual Crossing API
 BASE_URL = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/"
+# Maximum number of views (element selections, columns...) of the weather data cached by a Weather object
+MAX_CACHED_VIEWS = 64
 # Define weather data parameter constants
 QUERY_COST = 'queryCost'
 LATITUDE = 'latitude'
@@ -56,3 +58,20 @@ DAYS_Keys = [DATETIME, DATETIME_EPOCH, TEMPMAX, TEMPMIN, TEMP, FEELSLIKEMAX, FEE
 HOURS_Keys = [DATETIME, DATETIME_EPOCH, TEMP, FEELSLIKE, DEW, HUMIDITY, PRECIP, PRECIPPROB, PRECIPTYPE, SNOW, SNOWDEPTH, 
              WINDGUST, WINDSPEED, WINDDIR, PRESSURE, CLOUDCOVER, VISIBLILITY, SOLARRADIATION, SOLARENERGY, UVINDEX, SEVERERISK,
              CONDITIONS, ICON, STATIONS, SOURCE]
+
+# Value types of the elements: numbers (stored as float arrays in columnar form), strings and lists of strings
+NUMERIC_Keys = [DATETIME_EPOCH, TEMPMAX, TEMPMIN, TEMP, FEELSLIKEMAX, FEELSLIKEMIN, FEELSLIKE, DEW, HUMIDITY, PRECIP, PRECIPPROB, PRECIPCOVER,
+                SNOW, SNOWDEPTH, WINDGUST, WINDSPEED, WINDDIR, PRESSURE, CLOUDCOVER, VISIBLILITY, SOLARRADIATION, SOLARENERGY, UVINDEX,
+                SEVERERISK, SUNRISE_EPOCH, SUNSET_EPOCH, MONNPHAE]
+STRING_Keys = [DATETIME, SUNRISE, SUNSET, CONDITIONS, DESCRIPTION, ICON, SOURCE]
+LIST_Keys = [PRECIPTYPE, STATIONS]
+# Elements holding whole numbers (epoch seconds) and elements taking few distinct values, worth dictionary-encoding
+INTEGER_Keys = [DATETIME_EPOCH, SUNRISE_EPOCH, SUNSET_EPOCH]
+CATEGORICAL_Keys = [CONDITIONS, DESCRIPTION, ICON, PRECIPTYPE, SOURCE, STATIONS]
+
+# Elements that are always requested when a projection is declared, since the
+# day and hour lookups by date/time string depend on them
+PROJECTION_REQUIRED_Keys = [DATETIME, DATETIME_EPOCH]
+
+# Sources of days whose data no longer changes: historical observations and historical forecasts
+FINAL_SOURCES = ['obs', 'histfcst']
@@ -0,0 +1,132 @@
+import json
+import re
+import threading
+
+__all__ = ['LazyList', 'materialize_weather_data', 'loads_lazy_hours']
+
+_HOURS_START = re.compile(rb'"hours"\s*:\s*\[\s*')
+_HOURS_END = re.compile(rb'\}\s*\]')
+# Serializes the loading of the items, so that concurrent readers all wait for them
+_LOAD_LOCK = threading.RLock()
+
+class LazyList(list):
+    """
+    A list whose items are only built on first use, by a loader called once.
+
+    Every list method materializes the items in place first, after which the object holds them
+    like any list. Code reading the list storage directly without calling its methods, such as the
+    C encoder of `json.dumps`, sees an empty list until then: call `materialize` (or
+    `materialize_weather_data`) before handing the data to such code.
+    """
+    __slots__ = ('_loader',)
+
+    def __init__(self, loader):
+        """
+        :param loader: A callable without arguments returning the items.
+        """
+        list.__init__(self)
+        self._loader = loader
+
+    def is_materialized(self):
+        """
+        :return: True if the items were built.
+        """
+        return self._loader is None
+
+    def materialize(self):
+        """
+        Build the items, if not done yet.
+
+        :return: This list.
+        """
+        if self._loader is not None:
+            with _LOAD_LOCK:
+                loader = self._loader
+                if loader is not None:
+                    list.extend(self, loader())
+                    self._loader = None
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # copied and pickled as a plain list, without the loader
+        return list, (list(self.materialize()),)
+
+def _materializing(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        args = [arg.materialize() if isinstance(arg, LazyList) else arg for arg in args]
+        return method(self.materialize(), *args, **kwargs)
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+for _name in ('__getitem__', '__setitem__', '__delitem__', '__len__', '__iter__', '__reversed__', '__contains__',
+              '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__', '__add__', '__iadd__', '__mul__',
+              '__rmul__', '__imul__', '__repr__', 'append', 'extend', 'insert', 'pop', 'remove', 'index',
+              'count', 'sort', 'reverse', 'clear', 'copy'):
+    setattr(LazyList, _name, _materializing(_name))
+
+def materialize_weather_data(weather_data):
+    """
+    Build the lazily loaded parts of weather data in place.
+
+    :param weather_data: The weather data dictionary.
+    :return: The same dictionary.
+    """
+    for day in weather_data.get('days', []):
+        hours = day.get('hours')
+        if isinstance(hours, LazyList):
+            hours.materialize()
+    return weather_data
+
+def _decode_hours(span, hours_hook):
+    hours = json.loads(span)
+    return hours_hook(hours) if hours_hook is not None else hours
+
+def loads_lazy_hours(content, hours_hook=None):
+    """
+    Decode a JSON weather data payload, leaving the hours of each day undecoded until first used.
+
+    The days are decoded at once; the raw bytes of each day's hours array are located and kept,
+    and replaced by a `LazyList` decoding them on first access. Payloads whose hours cannot be
+    located safely are decoded whole, as `json.loads` would.
+
+    :param content: The JSON payload, as bytes.
+    :param hours_hook: An optional callable applied to each list of hours once decoded, returning the list to keep.
+    :return: The weather data dictionary.
+    """
+    spans = []
+    pieces = []
+    position = 0
+    for start in _HOURS_START.finditer(content):
+        if start.start() < position:
+            break
+        array_start = start.start() + content[start.start():start.end()].index(b'[')
+        if content[start.end():start.end() + 1] == b']':
+            end = start.end() + 1
+        else:
+            match = _HOURS_END.search(content, start.end())
+            if match is None:
+                break
+            end = match.end()
+        pieces.append(content[position:array_start])
+        pieces.append(str(len(spans)).encode())
+        spans.append((array_start, end))
+        position = end
+    else:
+        pieces.append(content[position:])
+        try:
+            weather_data = json.loads(b''.join(pieces))
+            found = 0
+            for day in weather_data.get('days', []):
+                index = day.get('hours')
+                if isinstance(index, int) and not isinstance(index, bool) and index == found:
+                    start, end = spans[index]
+                    day['hours'] = LazyList(lambda start=start, end=end: _decode_hours(content[start:end], hours_hook))
+                    found += 1
+            if found == len(spans):
+                return weather_data
+        except (ValueError, AttributeError):
+            pass
+    return json.loads(content)
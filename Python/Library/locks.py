@@ -0,0 +1,77 @@
+import threading
+from contextlib import contextmanager
+
+__all__ = ['ReadWriteLock']
+
+class ReadWriteLock:
+    """
+    A lock shared by any number of readers, or held by a single writer.
+
+    Waiting writers go before new readers, so that a steady flow of readers cannot starve them.
+    Both sides are reentrant, and the thread holding the write side may also take the read side;
+    a thread holding only the read side cannot take the write side.
+
+    Example:
+        lock = ReadWriteLock()
+        with lock.read():
+            ...
+    """
+
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__readers = {}
+        self.__writer = None
+        self.__writes = 0
+        self.__waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """
+        Hold the read side of the lock in a `with` block, waiting for the writers.
+        """
+        thread = threading.get_ident()
+        with self.__condition:
+            if self.__writer != thread and thread not in self.__readers:
+                while self.__writer is not None or self.__waiting_writers:
+                    self.__condition.wait()
+            self.__readers[thread] = self.__readers.get(thread, 0) + 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                if self.__readers[thread] == 1:
+                    del self.__readers[thread]
+                    if not self.__readers:
+                        self.__condition.notify_all()
+                else:
+                    self.__readers[thread] -= 1
+
+    @contextmanager
+    def write(self):
+        """
+        Hold the write side of the lock in a `with` block, waiting for the readers and the other writer.
+
+        Raises:
+            RuntimeError: If the thread only holds the read side.
+        """
+        thread = threading.get_ident()
+        with self.__condition:
+            if self.__writer != thread:
+                if thread in self.__readers:
+                    raise RuntimeError("Cannot take the write side of a lock while holding its read side")
+                self.__waiting_writers += 1
+                try:
+                    while self.__writer is not None or self.__readers:
+                        self.__condition.wait()
+                finally:
+                    self.__waiting_writers -= 1
+                self.__writer = thread
+            self.__writes += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__writes -= 1
+                if not self.__writes:
+                    self.__writer = None
+                    self.__condition.notify_all()
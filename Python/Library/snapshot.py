@@ -0,0 +1,298 @@
+import json
+import mmap as _mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+from .constants import *
+from .columns import get_default_elements, to_column, intern_records, encode_categorical, decode_categorical
+from .lazy import LazyList
+
+__all__ = ['save_snapshot', 'load_snapshot', 'dump_snapshot', 'parse_snapshot', 'snapshot_columns', 'decode_columns']
+
+MAGIC = b'VCWSNAP1'
+# Magic, then the byte length of the JSON header
+PREAMBLE = struct.Struct('<8sQ')
+ALIGNMENT = 8
+NAN = float('nan')
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def _union_keys(records, exclude=()):
+    return [key for key in dict.fromkeys(key for record in records for key in record) if key not in exclude]
+
+def _encode_level(records, blocks, offset):
+    """
+    Encode records into columns, appending their bytes to the blocks.
+
+    Numeric columns are stored as float64 arrays, categorical columns as int32 codes into a table
+    kept in the header, the other columns as comma-separated JSON values with an index of the
+    start of each value, so that any range of records is decoded alone.
+
+    :return: The level header and the offset following the blocks.
+    """
+    columns = {}
+    absent = {}
+    for element in _union_keys(records, (HOURS,)):
+        column = to_column(records, element)
+        if isinstance(column, array):
+            integers = element in INTEGER_Keys or \
+                all(isinstance(record.get(element), int) for record in records if record.get(element) is not None)
+            data = column.tobytes()
+            kind = 'i' if integers else 'f'
+            columns[element] = {'kind': kind}
+        elif element in CATEGORICAL_Keys:
+            codes, table = encode_categorical(column)
+            data = codes.tobytes()
+            columns[element] = {'kind': 'cat', 'table': table}
+        else:
+            values = [json.dumps(value, separators=(',', ':')).encode('utf-8') for value in column]
+            data = b','.join(values)
+            # start of each value, then the end of the data plus one, as if it ended with a comma
+            starts = array('q', [0])
+            for value in values:
+                starts.append(starts[-1] + len(value) + 1)
+            index = starts.tobytes()
+            columns[element] = {'kind': 'json', 'index': {'offset': offset, 'size': len(index)}}
+            blocks.append((offset, index))
+            offset = _aligned(offset + len(index))
+        columns[element].update(offset=offset, size=len(data))
+        blocks.append((offset, data))
+        offset = _aligned(offset + len(data))
+        missing = [i for i, record in enumerate(records) if element not in record]
+        if missing:
+            absent[element] = missing
+    return {'count': len(records), 'columns': columns, 'absent': absent}, offset
+
+def dump_snapshot(weather_data, file):
+    """
+    Write weather data to a binary file object in the snapshot format.
+
+    The file starts with a magic string and a JSON header holding the top-level elements (timezone,
+    tzoffset, resolvedAddress, stations, ...) and the layout of the columns, followed by the day and
+    hour columns: numeric elements as contiguous, 8-byte aligned float64 arrays, categorical elements
+    (see CATEGORICAL_Keys) as int32 codes into a table, others as JSON lists.
+
+    :param weather_data: The weather data dictionary.
+    :param file: A binary file object open for writing.
+    :return: The number of bytes written.
+    """
+    days = weather_data.get(DAYS, [])
+    hours = [hour for day in days for hour in day.get(HOURS, [])]
+    blocks = []
+    day_level, offset = _encode_level(days, blocks, 0)
+    hour_level, offset = _encode_level(hours, blocks, offset)
+    header = json.dumps({
+        'byteorder': sys.byteorder,
+        'meta': {key: value for key, value in weather_data.items() if key != DAYS},
+        'has_days': DAYS in weather_data,
+        'hour_counts': [len(day[HOURS]) if HOURS in day else -1 for day in days],
+        DAYS: day_level,
+        HOURS: hour_level,
+    }, separators=(',', ':')).encode('utf-8')
+    data_start = _aligned(PREAMBLE.size + len(header))
+    file.write(PREAMBLE.pack(MAGIC, len(header)))
+    file.write(header)
+    position = PREAMBLE.size + len(header)
+    for block_offset, data in blocks:
+        file.write(b'\0' * (data_start + block_offset - position))
+        file.write(data)
+        position = data_start + block_offset + len(data)
+    file.write(b'\0' * (data_start + offset - position))
+    return data_start + offset
+
+def save_snapshot(weather_data, path):
+    """
+    Save weather data to a snapshot file (see `dump_snapshot`).
+
+    :param weather_data: The weather data dictionary.
+    :param path: The path of the file to write.
+    :return: The number of bytes written.
+    """
+    # written beside the file then moved over it, since the hours of data loaded from a memory-mapped
+    # snapshot of the same path are still read from it while writing
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, 'wb') as file:
+            size = dump_snapshot(weather_data, file)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return size
+
+class _Level:
+    """
+    The columns of a level of a snapshot, decoding records from them on demand.
+    """
+    def __init__(self, header, buffer, data_start, swap):
+        self.count = header['count']
+        self.absent = {element: set(positions) for element, positions in header['absent'].items()}
+        self.numeric = {}
+        self.integers = set()
+        self.categorical = {}
+        self.json_blocks = {}
+        for element, column in header['columns'].items():
+            block = buffer[data_start + column['offset']:data_start + column['offset'] + column['size']]
+            if column['kind'] == 'json':
+                index = column['index']
+                starts = buffer[data_start + index['offset']:data_start + index['offset'] + index['size']].cast('q')
+                if swap:
+                    starts = array('q', starts)
+                    starts.byteswap()
+                self.json_blocks[element] = (block, starts)
+                continue
+            if column['kind'] == 'cat':
+                codes = block.cast('i')
+                if swap:
+                    codes = array('i', codes)
+                    codes.byteswap()
+                table = [record[element] for record in intern_records([{element: value} for value in column['table']])]
+                self.categorical[element] = (codes, table)
+                continue
+            values = block.cast('d')
+            if swap:
+                values = array('d', values)
+                values.byteswap()
+            self.numeric[element] = values
+            if column['kind'] == 'i':
+                self.integers.add(element)
+        self.elements = list(header['columns'])
+
+    def records(self, start, stop):
+        """
+        Decode the records between two positions.
+        """
+        columns = []
+        for element in self.elements:
+            if element in self.numeric:
+                values = self.numeric[element][start:stop].tolist()
+                if element in self.integers:
+                    values = [None if value != value else int(value) if value.is_integer() else value for value in values]
+                else:
+                    values = [None if value != value else value for value in values]
+            elif element in self.categorical:
+                codes, table = self.categorical[element]
+                values = decode_categorical(codes[start:stop], table)
+            else:
+                block, starts = self.json_blocks[element]
+                values = json.loads(b'[' + bytes(block[starts[start]:max(starts[stop] - 1, starts[start])]) + b']')
+            columns.append(values)
+        records = [dict(zip(self.elements, values)) for values in zip(*columns)] if columns else [{} for _ in range(start, stop)]
+        for element, positions in self.absent.items():
+            for i in range(start, stop):
+                if i in positions:
+                    del records[i - start][element]
+        return records
+
+    def column(self, element):
+        """
+        Decode the column of an element over all the records, as `to_column` builds it from them.
+        """
+        if element in self.numeric:
+            column = array('d')
+            column.frombytes(memoryview(self.numeric[element]).cast('B'))
+            return column
+        if element in self.categorical:
+            return decode_categorical(*self.categorical[element])
+        if element in self.json_blocks:
+            block, starts = self.json_blocks[element]
+            return json.loads(b'[' + bytes(block[:max(starts[-1] - 1, 0)]) + b']')
+        return to_column([{}] * self.count, element)
+
+def _read_header(buffer):
+    """
+    Read the header of a snapshot.
+
+    :return: A tuple of the buffer as a memoryview of bytes, the header, the offset of the columns
+             and whether their byte order differs from the native one.
+    """
+    buffer = memoryview(buffer).cast('B')
+    magic, header_size = PREAMBLE.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a weather data snapshot")
+    header = json.loads(bytes(buffer[PREAMBLE.size:PREAMBLE.size + header_size]))
+    return buffer, header, _aligned(PREAMBLE.size + header_size), header['byteorder'] != sys.byteorder
+
+def snapshot_columns(buffer, level=HOURS):
+    """
+    Get the numeric columns of a level of a snapshot, as views of the buffer, without copying or
+    decoding the records.
+
+    :param buffer: An object supporting the buffer protocol, holding a snapshot.
+    :param level: 'days' for the daily columns, or 'hours' for the hourly columns of all days.
+    :return: A dictionary mapping each numeric element to its values, a memoryview of floats (NaN for
+             missing values) that stays valid as long as the buffer, or an array('d') copy when the
+             snapshot was written with another byte order.
+    :raises ValueError: If the buffer does not hold a snapshot, or the level is invalid.
+    """
+    if level not in (DAYS, HOURS):
+        raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+    buffer, header, data_start, swap = _read_header(buffer)
+    return _Level(header[level], buffer, data_start, swap).numeric
+
+def decode_columns(buffer, level=HOURS, elements=None):
+    """
+    Decode columns of a level of a snapshot, as `columns.to_column` builds them from the records,
+    without decoding the records: numeric columns are copied into arrays, the others into lists.
+
+    :param buffer: An object supporting the buffer protocol, holding a snapshot.
+    :param level: 'days' for the daily columns, or 'hours' for the hourly columns of all days.
+    :param elements: The elements to decode, those of the records and the default elements of the
+                     level (see `columns.get_default_elements`) if None.
+    :return: A dictionary mapping each element to its column.
+    :raises ValueError: If the buffer does not hold a snapshot, or the level is invalid.
+    """
+    if level not in (DAYS, HOURS):
+        raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+    buffer, header, data_start, swap = _read_header(buffer)
+    columns = _Level(header[level], buffer, data_start, swap)
+    if elements is None:
+        elements = dict.fromkeys(columns.elements + get_default_elements(level))
+    return {element: columns.column(element) for element in elements}
+
+def parse_snapshot(buffer):
+    """
+    Read weather data from a buffer holding a snapshot, such as a memory map, bytes or shared memory.
+
+    The days are decoded at once; the hours of each day are a `LazyList` decoded from the numeric
+    columns, without copying them, on first access. The buffer must stay open while hours remain
+    to be decoded.
+
+    :param buffer: An object supporting the buffer protocol.
+    :return: The weather data dictionary.
+    :raises ValueError: If the buffer does not hold a snapshot.
+    """
+    buffer, header, data_start, swap = _read_header(buffer)
+    days = _Level(header[DAYS], buffer, data_start, swap).records(0, header[DAYS]['count'])
+    hours = _Level(header[HOURS], buffer, data_start, swap)
+    start = 0
+    for day, count in zip(days, header['hour_counts']):
+        if count >= 0:
+            day[HOURS] = LazyList(lambda start=start, stop=start + count: hours.records(start, stop))
+            start += count
+    weather_data = dict(header['meta'])
+    if header['has_days']:
+        weather_data[DAYS] = days
+    return weather_data
+
+def load_snapshot(path, mmap=True):
+    """
+    Load weather data from a snapshot file.
+
+    :param path: The path of the snapshot file.
+    :param mmap: Whether to memory-map the file, so that its pages are only read as the hours are
+                 accessed, instead of reading it whole.
+    :return: The weather data dictionary (see `parse_snapshot`).
+    :raises ValueError: If the file is not a snapshot.
+    """
+    with open(path, 'rb') as file:
+        if mmap:
+            buffer = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+    return parse_snapshot(buffer)
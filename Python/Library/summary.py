@@ -0,0 +1,47 @@
+from array import array
+from heapq import nlargest
+
+__all__ = ['DEFAULT_PERCENTILES', 'summarize_column']
+
+# Percentiles computed by default by the summaries
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+def _percentile(ordered, percentile):
+    # linear interpolation between the closest ranks, as the 'quantile' window statistic
+    position = percentile / 100 * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize_column(values, k=5, percentiles=DEFAULT_PERCENTILES):
+    """
+    Summarize a numeric column in a single sort, skipping missing values (NaN).
+
+    Among equal values, the earliest record comes first, so that the minimum and the maximum are
+    the first records reaching them.
+
+    :param values: The values, an array('d') (see `columns.to_column`).
+    :param k: The number of highest and lowest values to keep.
+    :param percentiles: The percentiles to compute, between 0 and 100.
+    :return: A dictionary with the 'count' of values, the positions of the 'min' and 'max' values
+             (None without values), the positions of the 'top' k and 'bottom' k values, from the most
+             extreme, and the value of each of the 'percentiles' (None without values).
+    :raises ValueError: If the column is not numeric, or a percentile is out of range.
+    """
+    if not isinstance(values, array):
+        raise ValueError("Summaries require a numeric element")
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Invalid percentile, expected a value between 0 and 100: {percentile}")
+    positions = [i for i, value in enumerate(values) if value == value]
+    ascending = sorted(positions, key=values.__getitem__)
+    top = nlargest(k, positions, key=values.__getitem__)
+    ordered = array('d', map(values.__getitem__, ascending))
+    return {
+        'count': len(positions),
+        'min': ascending[0] if ascending else None,
+        'max': top[0] if top else None,
+        'top': top,
+        'bottom': ascending[:k],
+        'percentiles': {percentile: _percentile(ordered, percentile) if ordered else None for percentile in percentiles},
+    }
@@ -0,0 +1,167 @@
+import math
+import random
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from .constants import *
+
+__all__ = ['generate_timeline']
+
+CONDITIONS_BY_ICON = {
+    'clear-day': 'Clear',
+    'partly-cloudy-day': 'Partially cloudy',
+    'cloudy': 'Overcast',
+    'rain': 'Rain, Overcast',
+    'snow': 'Snow, Overcast',
+}
+STATION_IDS = ['KMKC', 'KFOE', 'KTOP', 'KLWC', 'KOJC', 'KIXD', 'KMCI']
+
+def location_coordinates(location):
+    """
+    Resolve a location into coordinates, either parsed from a "lat,lon" string or derived from its name.
+
+    :param location: The location string, as passed to the Timeline API.
+    :return: A tuple (latitude, longitude).
+    """
+    try:
+        latitude, longitude = (float(part) for part in location.split(','))
+        return latitude, longitude
+    except ValueError:
+        checksum = zlib.crc32(location.encode('utf-8'))
+        return round((checksum % 12000) / 100 - 60, 3), round((checksum // 12000 % 36000) / 100 - 180, 3)
+
+def generate_timeline(location, from_date, days=15, hours_per_day=24, include_hours=True, forecast_from=None, seed=0):
+    """
+    Generate a deterministic synthetic Timeline API payload.
+
+    The values follow plausible daily and diurnal cycles and the payload has the same shape and
+    keys (see DAYS_Keys and HOURS_Keys) as a real response, so it can stand in for one in
+    benchmarks and offline tests. The same arguments always produce the same payload.
+
+    :param location: The location string; "lat,lon" strings set the coordinates.
+    :param from_date: The first day of the payload (in `yyyy-MM-dd` format).
+    :param days: The number of days to generate.
+    :param hours_per_day: The number of hourly records per day (1 to 24).
+    :param include_hours: Whether each day carries its `hours` list.
+    :param forecast_from: Days from this date (in `yyyy-MM-dd` format) on are forecasts
+                          ('fcst', 'comb' on the date itself); earlier days are observations.
+    :param seed: Seed mixed with the location to vary the generated values.
+    :return: The payload as a dictionary.
+    """
+    latitude, longitude = location_coordinates(location)
+    tzoffset = float(round(longitude / 15))
+    tz = timezone(timedelta(hours=tzoffset))
+    rng = random.Random(zlib.crc32(location.encode('utf-8')) ^ seed)
+    start = datetime.strptime(from_date, '%Y-%m-%d')
+    step = 24 // max(1, min(hours_per_day, 24))
+
+    day_list = []
+    for day_index in range(days):
+        date = start + timedelta(days=day_index)
+        date_str = date.strftime('%Y-%m-%d')
+        if forecast_from is None or date_str < forecast_from:
+            source = 'obs'
+        else:
+            source = 'comb' if date_str == forecast_from else 'fcst'
+        seasonal = 55 - 25 * math.cos(2 * math.pi * (date.timetuple().tm_yday - 15) / 365)
+        mean_temp = seasonal + rng.gauss(0, 5)
+        wetness = rng.random()
+        icon = 'rain' if wetness > 0.75 else 'cloudy' if wetness > 0.5 else 'partly-cloudy-day' if wetness > 0.25 else 'clear-day'
+        if icon == 'rain' and mean_temp < 32:
+            icon = 'snow'
+        stations = rng.sample(STATION_IDS, 3)
+
+        hours = []
+        for hour in range(0, 24, step):
+            local = date.replace(hour=hour, tzinfo=tz)
+            temp = round(mean_temp - 8 * math.cos(2 * math.pi * (hour - 3) / 24) + rng.gauss(0, 1), 1)
+            humidity = round(min(100.0, max(10.0, 60 + 30 * wetness - (temp - mean_temp) * 2 + rng.gauss(0, 3))), 2)
+            precip = round(rng.expovariate(8), 3) if icon in ('rain', 'snow') and rng.random() < 0.5 else 0.0
+            windspeed = round(abs(rng.gauss(8, 4)), 1)
+            solarradiation = round(max(0.0, 700 * math.sin(math.pi * (hour - 6) / 12)) * (1 - 0.6 * wetness), 1) if 6 <= hour <= 18 else 0.0
+            hours.append({
+                DATETIME: f"{hour:02d}:00:00",
+                DATETIME_EPOCH: int(local.timestamp()),
+                TEMP: temp,
+                FEELSLIKE: round(temp - 0.3 * windspeed if temp < 50 else temp + 0.05 * humidity, 1),
+                HUMIDITY: humidity,
+                DEW: round(temp - (100 - humidity) / 2.8, 1),
+                PRECIP: precip,
+                PRECIPPROB: 100.0 if precip else round(wetness * 40, 1),
+                SNOW: round(precip * 10, 2) if icon == 'snow' else 0.0,
+                SNOWDEPTH: 0.0,
+                PRECIPTYPE: (['snow'] if icon == 'snow' else ['rain']) if precip else None,
+                WINDGUST: round(windspeed * 1.6, 1),
+                WINDSPEED: windspeed,
+                WINDDIR: float(rng.randrange(360)),
+                PRESSURE: round(1015 + rng.gauss(0, 4), 1),
+                VISIBLILITY: round(10 - 6 * wetness, 1),
+                CLOUDCOVER: round(min(100.0, wetness * 110), 1),
+                SOLARRADIATION: solarradiation,
+                SOLARENERGY: round(solarradiation * 0.0036, 1),
+                UVINDEX: float(round(solarradiation / 100)),
+                SEVERERISK: 10.0,
+                CONDITIONS: CONDITIONS_BY_ICON[icon],
+                ICON: icon,
+                STATIONS: stations if source == 'obs' else None,
+                SOURCE: 'obs' if source == 'obs' else 'fcst',
+            })
+
+        temps = [hour[TEMP] for hour in hours]
+        feels = [hour[FEELSLIKE] for hour in hours]
+        precip_total = round(sum(hour[PRECIP] for hour in hours), 3)
+        sunrise = date.replace(hour=6, minute=rng.randrange(60), second=rng.randrange(60), tzinfo=tz)
+        sunset = date.replace(hour=17, minute=rng.randrange(60), second=rng.randrange(60), tzinfo=tz)
+        day = {
+            DATETIME: date_str,
+            DATETIME_EPOCH: int(date.replace(tzinfo=tz).timestamp()),
+            TEMPMAX: max(temps),
+            TEMPMIN: min(temps),
+            TEMP: round(sum(temps) / len(temps), 1),
+            FEELSLIKEMAX: max(feels),
+            FEELSLIKEMIN: min(feels),
+            FEELSLIKE: round(sum(feels) / len(feels), 1),
+            DEW: round(sum(hour[DEW] for hour in hours) / len(hours), 1),
+            HUMIDITY: round(sum(hour[HUMIDITY] for hour in hours) / len(hours), 1),
+            PRECIP: precip_total,
+            PRECIPPROB: max(hour[PRECIPPROB] for hour in hours),
+            PRECIPCOVER: round(100 * sum(1 for hour in hours if hour[PRECIP]) / len(hours), 2),
+            PRECIPTYPE: next((hour[PRECIPTYPE] for hour in hours if hour[PRECIPTYPE]), None),
+            SNOW: round(sum(hour[SNOW] for hour in hours), 2),
+            SNOWDEPTH: 0.0,
+            WINDGUST: max(hour[WINDGUST] for hour in hours),
+            WINDSPEED: max(hour[WINDSPEED] for hour in hours),
+            WINDDIR: hours[0][WINDDIR],
+            PRESSURE: round(sum(hour[PRESSURE] for hour in hours) / len(hours), 1),
+            CLOUDCOVER: hours[0][CLOUDCOVER],
+            VISIBLILITY: hours[0][VISIBLILITY],
+            SOLARRADIATION: round(sum(hour[SOLARRADIATION] for hour in hours) / len(hours), 1),
+            SOLARENERGY: round(sum(hour[SOLARENERGY] for hour in hours) * step, 1),
+            UVINDEX: max(hour[UVINDEX] for hour in hours),
+            SEVERERISK: 10.0,
+            SUNRISE: sunrise.strftime('%H:%M:%S'),
+            SUNRISE_EPOCH: int(sunrise.timestamp()),
+            SUNSET: sunset.strftime('%H:%M:%S'),
+            SUNSET_EPOCH: int(sunset.timestamp()),
+            MONNPHAE: round((day_index * 0.034 + rng.random() * 0.01) % 1, 2),
+            CONDITIONS: CONDITIONS_BY_ICON[icon],
+            DESCRIPTION: f"{CONDITIONS_BY_ICON[icon]} throughout the day.",
+            ICON: icon,
+            STATIONS: stations if source == 'obs' else None,
+            SOURCE: source,
+        }
+        if include_hours:
+            day[HOURS] = hours
+        day_list.append(day)
+
+    return {
+        QUERY_COST: days,
+        LATITUDE: latitude,
+        LONGITUDE: longitude,
+        RESOLVED_ADDRESS: location,
+        ADDRESS: location,
+        TIMEZONE: f"Etc/GMT{-int(tzoffset):+d}" if tzoffset else 'UTC',
+        TZOFFSET: tzoffset,
+        DAYS: day_list,
+        STATIONS: {station: {'id': station, 'name': station, 'distance': 0.0, 'quality': 100} for station in STATION_IDS},
+    }
@@ -1,4 +1,6 @@
-__all__ = ['update_dictionary', 'is_valid_dict', 'extract_subdict_by_keys']
+from .constants import PROJECTION_REQUIRED_Keys
+
+__all__ = ['update_dictionary', 'is_valid_dict', 'extract_subdict_by_keys', 'resolve_projection']
 
 def update_dictionary(original, updates, exclude_keys=[]):
     """
@@ -37,6 +39,33 @@ def extract_subdict_by_keys(original_dict, keys_list):
     # Create a sub-dictionary with keys from keys_list if they exist in original_dict
     return {key: original_dict[key] for key in keys_list if key in original_dict}
 
+def resolve_projection(projection):
+    """
+    Resolve a declared projection into the `include` and `elements` query parameters.
+
+    The projection can be a list of element names, applied to every section, or a dictionary
+    mapping data sections (e.g. 'days', 'hours') to the element names read from each of them.
+    The elements required by the day and hour lookups are always added.
+
+    :param projection: A list of element names or a dictionary of section -> element names.
+    :return: A tuple (include, elements) where include is a comma-separated string of sections
+             (None if the projection does not name any) and elements is a comma-separated string.
+    """
+    if isinstance(projection, dict):
+        include = ','.join(projection.keys()) or None
+        names = [name for section_elements in projection.values() for name in section_elements]
+    elif isinstance(projection, (list, tuple)):
+        include = None
+        names = list(projection)
+    else:
+        raise ValueError(f"Invalid projection, expected a list or a dict: {projection}")
+
+    elements = []
+    for name in PROJECTION_REQUIRED_Keys + names:
+        if name not in elements:
+            elements.append(name)
+    return include, ','.join(elements)
+
 
 if __name__ == "__main__":
     # ***test***
@@ -0,0 +1,212 @@
+import math
+from array import array
+from heapq import heapify, heappop, heappush
+from collections import deque
+
+__all__ = ['WINDOW_STATS', 'window_starts', 'rolling']
+
+NAN = float('nan')
+# Statistics computed over windows
+WINDOW_STATS = ('mean', 'sum', 'min', 'max', 'std', 'median', 'quantile')
+
+def window_starts(epochs, window):
+    """
+    Find the first position of the time window ending at each position.
+
+    :param epochs: The epoch seconds of the records, in increasing order.
+    :param window: The length of the windows in seconds, a window holding the records of the last
+                   `window` seconds up to and including its end; None for expanding windows.
+    :return: An array of the start position of the window of each position.
+    :raises ValueError: If the window is not positive, or the epochs are missing or not in increasing order.
+    """
+    starts = array('q', bytes(8 * len(epochs)))
+    if window is None:
+        return starts
+    if not window > 0:
+        raise ValueError(f"Invalid window, expected a positive number of seconds: {window}")
+    start = 0
+    previous = -math.inf
+    for i, epoch in enumerate(epochs):
+        if not epoch >= previous:
+            raise ValueError("Window statistics require datetimeEpoch values in increasing order")
+        previous = epoch
+        limit = epoch - window
+        while epochs[start] <= limit:
+            start += 1
+        starts[i] = start
+    return starts
+
+def _valid_counts(values):
+    counts = array('q', [0])
+    count = 0
+    for value in values:
+        if value == value:
+            count += 1
+        counts.append(count)
+    return counts
+
+def _sums(values, starts, stat, min_periods, counts):
+    result = array('d')
+    total = squares = 0.0
+    removed = 0
+    for i, value in enumerate(values):
+        if value == value:
+            total += value
+            squares += value * value
+        start = starts[i]
+        while removed < start:
+            value = values[removed]
+            if value == value:
+                total -= value
+                squares -= value * value
+            removed += 1
+        count = counts[i + 1] - counts[start]
+        if count == 0:
+            total = squares = 0.0
+        if count < min_periods or (stat == 'std' and count < 2):
+            result.append(NAN)
+        elif stat == 'sum':
+            result.append(total)
+        elif stat == 'mean':
+            result.append(total / count)
+        else:
+            result.append(math.sqrt(max(squares - total * total / count, 0.0) / (count - 1)))
+    return result
+
+def _extremes(values, starts, stat, min_periods, counts):
+    result = array('d')
+    candidates = deque()
+    for i, value in enumerate(values):
+        if value == value:
+            if stat == 'max':
+                while candidates and values[candidates[-1]] <= value:
+                    candidates.pop()
+            else:
+                while candidates and values[candidates[-1]] >= value:
+                    candidates.pop()
+            candidates.append(i)
+        start = starts[i]
+        while candidates and candidates[0] < start:
+            candidates.popleft()
+        result.append(values[candidates[0]] if counts[i + 1] - counts[start] >= max(min_periods, 1) else NAN)
+    return result
+
+class _SlidingQuantile:
+    """
+    The values of a sliding window split in two heaps with lazy deletion: the lowest values, up to
+    the rank of the quantile, in a max-heap and the others in a min-heap, so that adding, removing
+    and reading the quantile take O(log w) time. A heap is rebuilt from its live entries once it
+    holds more removed entries than live ones, so that both stay within O(w) entries.
+    """
+    def __init__(self, q):
+        self.q = q
+        self.heaps = ([], [])  # low: (-value, position), high: (value, position)
+        self.sizes = [0, 0]
+        self.stale = [0, 0]
+        self.side = {}  # position -> 0 (low) or 1 (high), for the values in the window
+        self.removed = set()
+
+    def __top(self, side):
+        heap = self.heaps[side]
+        while heap and heap[0][1] in self.removed:
+            self.removed.discard(heappop(heap)[1])
+            self.stale[side] -= 1
+        return heap[0] if heap else None
+
+    def __move(self, side):
+        self.__top(side)
+        key, position = heappop(self.heaps[side])
+        heappush(self.heaps[1 - side], (-key, position))
+        self.side[position] = 1 - side
+        self.sizes[side] -= 1
+        self.sizes[1 - side] += 1
+
+    def __compact(self, side):
+        heap = self.heaps[side]
+        live = [entry for entry in heap if entry[1] not in self.removed]
+        self.removed.difference_update(entry[1] for entry in heap if entry[1] in self.removed)
+        heap[:] = live
+        heapify(heap)
+        self.stale[side] = 0
+
+    def add(self, position, value):
+        top = self.__top(0)
+        side = 0 if top is not None and value <= -top[0] else 1
+        heappush(self.heaps[side], (-value, position) if side == 0 else (value, position))
+        self.side[position] = side
+        self.sizes[side] += 1
+
+    def remove(self, position):
+        side = self.side.pop(position)
+        self.sizes[side] -= 1
+        self.stale[side] += 1
+        self.removed.add(position)
+        if self.stale[side] > self.sizes[side]:
+            self.__compact(side)
+
+    def __len__(self):
+        return self.sizes[0] + self.sizes[1]
+
+    def quantile(self):
+        count = len(self)
+        position = self.q * (count - 1)
+        lower = int(position)
+        # the low heap holds the values up to the rank of the lower value
+        while self.sizes[0] > lower + 1:
+            self.__move(0)
+        while self.sizes[0] < lower + 1:
+            self.__move(1)
+        low = -self.__top(0)[0]
+        if lower + 1 >= count:
+            return low
+        return low + (self.__top(1)[0] - low) * (position - lower)
+
+def _quantiles(values, starts, q, min_periods, counts):
+    result = array('d')
+    window = _SlidingQuantile(q)
+    removed = 0
+    for i, value in enumerate(values):
+        if value == value:
+            window.add(i, value)
+        start = starts[i]
+        while removed < start:
+            if values[removed] == values[removed]:
+                window.remove(removed)
+            removed += 1
+        if not len(window) or len(window) < min_periods:
+            result.append(NAN)
+            continue
+        result.append(window.quantile())
+    return result
+
+def rolling(values, epochs, window, stat='mean', min_periods=1, q=0.5):
+    """
+    Compute a statistic over the time window ending at each record, in a single pass.
+
+    Windows are defined by time rather than by a number of records, so that gaps in the data
+    shorten them instead of stretching them. Missing values (NaN) are skipped.
+
+    :param values: The values, an array('d') (see `columns.to_column`).
+    :param epochs: The epoch seconds of the records, in increasing order; unused by expanding windows.
+    :param window: The length of the windows in seconds, None for expanding windows.
+    :param stat: 'mean', 'sum', 'min', 'max', 'std' (sample standard deviation), 'median' or 'quantile'.
+    :param min_periods: The minimum number of values in a window for a result, NaN otherwise.
+    :param q: The quantile computed by 'quantile', between 0 and 1.
+    :return: An array('d') of the statistic of the window ending at each record.
+    :raises ValueError: If the statistic, window or quantile is invalid, or the epochs are not in increasing order.
+    """
+    if stat not in WINDOW_STATS:
+        raise ValueError(f"Invalid stat value, expected one of {', '.join(WINDOW_STATS)}: {stat}")
+    if not 0 <= q <= 1:
+        raise ValueError(f"Invalid quantile, expected a value between 0 and 1: {q}")
+    if window is None:
+        epochs = values
+    elif len(values) != len(epochs):
+        raise ValueError("The values and epochs have different lengths")
+    starts = window_starts(epochs, window)
+    counts = _valid_counts(values)
+    if stat in ('mean', 'sum', 'std'):
+        return _sums(values, starts, stat, min_periods, counts)
+    if stat in ('min', 'max'):
+        return _extremes(values, starts, stat, min_periods, counts)
+    return _quantiles(values, starts, 0.5 if stat == 'median' else q, min_periods, counts)
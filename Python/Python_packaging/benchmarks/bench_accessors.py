@@ -0,0 +1,83 @@
+from .common import DAYS, loaded_weather
+
+class HourlyData:
+    """
+    Flattening of the hourly records, from the cached views and rebuilt.
+    """
+    def setup(self):
+        self.weather = loaded_weather()
+
+    def time_get_weather_hourly_data(self):
+        self.weather.get_weather_hourly_data()
+
+    def time_get_weather_hourly_data_elements(self):
+        self.weather.get_weather_hourly_data(['temp', 'precip'])
+
+    def time_get_weather_daily_data_elements(self):
+        self.weather.get_weather_daily_data(['tempmax', 'tempmin'])
+
+    # the views above are cached after the first call: these rebuild them on each call
+    def time_get_weather_hourly_data_cold(self):
+        self.weather.mark_modified()
+        self.weather.get_weather_hourly_data()
+
+    def time_get_weather_hourly_data_elements_cold(self):
+        self.weather.mark_modified()
+        self.weather.get_weather_hourly_data(['temp', 'precip'])
+
+class DayAccess:
+    """
+    Lookups of a single day, by date string and by index, over every day of the payload.
+    """
+    def setup(self):
+        self.weather = loaded_weather()
+        self.dates = [day['datetime'] for day in self.weather.get_weather_daily_data()]
+
+    def time_get_tempmax_on_day_by_string(self):
+        for date in self.dates:
+            self.weather.get_tempmax_on_day(date)
+
+    def time_get_tempmax_on_day_by_index(self):
+        for index in range(DAYS):
+            self.weather.get_tempmax_on_day(index)
+
+    def time_get_hourlyData_on_day_by_string(self):
+        for date in self.dates:
+            self.weather.get_hourlyData_on_day(date, ['temp'])
+
+    def time_get_temp_at_datetime_by_string(self):
+        for date in self.dates:
+            self.weather.get_temp_at_datetime(date, '12:00:00')
+
+class Datetimes:
+    """
+    Conversion of the day and hour datetimes to datetime objects.
+    """
+    def setup(self):
+        self.weather = loaded_weather()
+
+    def time_get_daily_datetimes(self):
+        self.weather.get_daily_datetimes()
+
+    def time_get_hourly_datetimes(self):
+        self.weather.get_hourly_datetimes()
+
+class Setters:
+    """
+    Updates of single values, by date string and by index, over every day of the payload.
+    """
+    def setup(self):
+        self.weather = loaded_weather()
+        self.dates = [day['datetime'] for day in self.weather.get_weather_daily_data()]
+
+    def time_set_tempmax_on_day_by_string(self):
+        for date in self.dates:
+            self.weather.set_tempmax_on_day(date, 80.0)
+
+    def time_set_tempmax_on_day_by_index(self):
+        for index in range(DAYS):
+            self.weather.set_tempmax_on_day(index, 80.0)
+
+    def time_set_temp_at_datetime_by_string(self):
+        for date in self.dates:
+            self.weather.set_temp_at_datetime(date, '12:00:00', 70.0)
@@ -0,0 +1,21 @@
+from weather import Weather
+
+from .common import FROM_DATE, TO_DATE, location_names, start_stub_server
+
+class FetchSuite:
+    """
+    Fetch and decode of the synthetic payloads from a local stub endpoint.
+    """
+    def setup(self):
+        self.server = start_stub_server()
+        self.weather = Weather(base_url=self.server.base_url, api_key='bench')
+        self.locations = location_names()
+        for location in self.locations:  # warm up the server-side response cache
+            self.weather.fetch_weather_data(location, FROM_DATE, TO_DATE, include='hours')
+
+    def teardown(self):
+        self.server.stop()
+
+    def time_fetch_weather_data(self):
+        for location in self.locations:
+            self.weather.fetch_weather_data(location, FROM_DATE, TO_DATE, include='hours')
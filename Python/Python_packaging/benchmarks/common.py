@@ -0,0 +1,44 @@
+import os
+from datetime import datetime, timedelta
+
+from weather import Weather
+from weather.stub_server import StubTimelineServer
+from weather.synthetic import generate_timeline
+
+# Payload size of the benchmarks: days x hours per day x locations, overridable from the environment
+# (or the command line of benchmarks.run)
+DAYS = int(os.environ.get('WEATHER_BENCH_DAYS', 90))
+HOURS_PER_DAY = int(os.environ.get('WEATHER_BENCH_HOURS', 24))
+LOCATIONS = int(os.environ.get('WEATHER_BENCH_LOCATIONS', 4))
+FROM_DATE = '2023-01-01'
+TO_DATE = (datetime.strptime(FROM_DATE, '%Y-%m-%d') + timedelta(days=DAYS - 1)).strftime('%Y-%m-%d')
+
+def location_names(count=None):
+    """
+    Return the names of the benchmark locations.
+    """
+    return [f"{38.0 + index * 0.5},{-95.0 + index * 0.5}" for index in range(LOCATIONS if count is None else count)]
+
+def synthetic_payload(location, days=None):
+    """
+    Return the synthetic Timeline payload of a benchmark location.
+    """
+    return generate_timeline(location, FROM_DATE, days=DAYS if days is None else days, hours_per_day=HOURS_PER_DAY)
+
+def loaded_weather(location=None):
+    """
+    Return a Weather object loaded with a synthetic payload.
+    """
+    weather = Weather()
+    weather.set_weather_data(synthetic_payload(location or location_names(1)[0]))
+    return weather
+
+def start_stub_server():
+    """
+    Start a local Timeline stub endpoint.
+
+    :return: The started StubTimelineServer; call its stop() method when done.
+    """
+    server = StubTimelineServer(hours_per_day=HOURS_PER_DAY, today=FROM_DATE)
+    server.start()
+    return server
@@ -0,0 +1,102 @@
+"""
+Run the benchmark suite.
+
+Benchmarks follow the asv conventions: each `bench_*` module holds classes whose `time_*`
+methods are timed after calling the optional `setup` method (and before `teardown`).
+
+Usage (from the Python_packaging directory):
+    python -m benchmarks.run [--days N] [--hours N] [--locations N] [--filter TEXT]
+                             [--save results.json] [--compare baseline.json] [--threshold 1.25]
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import timeit
+
+def discover(name_filter=''):
+    """
+    Yield (name, class, method name) for every benchmark matching the filter.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module_info in sorted(pkgutil.iter_modules([directory]), key=lambda info: info.name):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method_name in sorted(name for name in vars(cls) if name.startswith('time_')):
+                name = f"{module_info.name}.{class_name}.{method_name}"
+                if name_filter in name:
+                    yield name, cls, method_name
+
+def time_benchmark(cls, method_name, repeat):
+    """
+    Time one benchmark method and return the best duration of a single call in seconds.
+    """
+    suite = cls()
+    if hasattr(suite, 'setup'):
+        suite.setup()
+    try:
+        timer = timeit.Timer(getattr(suite, method_name))
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+    finally:
+        if hasattr(suite, 'teardown'):
+            suite.teardown()
+
+def format_duration(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the hot paths of the weather package.')
+    parser.add_argument('--days', type=int, help='days per location payload')
+    parser.add_argument('--hours', type=int, help='hourly records per day')
+    parser.add_argument('--locations', type=int, help='locations fetched by the fetch benchmarks')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions, the best one is reported')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare against the results saved in this JSON file')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio reported as a regression')
+    args = parser.parse_args(argv)
+
+    # the sizes are read by benchmarks.common at import time
+    for option, variable in ((args.days, 'WEATHER_BENCH_DAYS'), (args.hours, 'WEATHER_BENCH_HOURS'),
+                             (args.locations, 'WEATHER_BENCH_LOCATIONS')):
+        if option is not None:
+            os.environ[variable] = str(option)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+
+    from .common import DAYS, HOURS_PER_DAY, LOCATIONS
+    print(f"payload: {DAYS} days x {HOURS_PER_DAY} hours, {LOCATIONS} locations")
+    results, regressions = {}, []
+    for name, cls, method_name in discover(args.filter):
+        results[name] = time_benchmark(cls, method_name, args.repeat)
+        line = f"{name:<70} {format_duration(results[name])}"
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            line += f"  x{ratio:.2f}"
+            if ratio > args.threshold:
+                regressions.append(name)
+                line += '  REGRESSION'
+        print(line)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'size': {'days': DAYS, 'hours': HOURS_PER_DAY, 'locations': LOCATIONS}, 'results': results},
+                      file, indent=2)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
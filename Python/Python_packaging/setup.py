@@ -12,10 +12,15 @@ setup(
     install_requires=[
         'requests',  # Ensure you list all necessary packages here
     ],
+    extras_require={
+        'compression': ['brotli', 'zstandard'],  # br and zstd transfer encodings
+        'opentelemetry': ['opentelemetry-api'],  # instrumentation.OpenTelemetryHook
+        'parquet': ['pyarrow'],  # export.write_parquet_dataset
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',  # multiprocessing.shared_memory, contextlib.nullcontext
 )
@@ -0,0 +1,44 @@
+# test_aggregation.py
+import unittest
+from weather import Weather
+from weather.aggregation import period_key
+from weather.synthetic import generate_timeline
+
+class TestAggregation(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-30', days=10))
+
+    def test_period_key(self):
+        self.assertEqual(period_key('2024-01-01', 'D'), '2024-01-01')
+        self.assertEqual(period_key('2024-12-30', 'W'), '2025-W01')
+        self.assertEqual(period_key('2024-02-29', 'M'), '2024-02')
+        with self.assertRaises(ValueError):
+            period_key('2024-02-29', 'Y')
+
+    def test_aggregate(self):
+        hours = self.weather.get_hourlyData_on_day('2024-02-01')
+        daily = self.weather.aggregate('hours', 'D', {'temp': 'mean', 'precip': 'sum', 'windgust': 'max'})
+        self.assertEqual(len(daily), 10)
+        self.assertAlmostEqual(daily['2024-02-01']['temp'], sum(hour['temp'] for hour in hours) / 24)
+        self.assertAlmostEqual(daily['2024-02-01']['precip'], sum(hour['precip'] for hour in hours))
+        self.assertEqual(daily['2024-02-01']['windgust'], max(hour['windgust'] for hour in hours))
+
+        monthly = self.weather.aggregate('days', 'M', {'tempmax': 'max', 'datetime': 'count', 'temp': lambda values: len(values)})
+        self.assertEqual(list(monthly), ['2024-01', '2024-02'])
+        self.assertEqual(monthly['2024-01']['datetime'], 2)
+        self.assertEqual(monthly['2024-02']['temp'], 8)
+        self.assertEqual(list(self.weather.aggregate('hours', 'W')), ['2024-W05', '2024-W06'])
+
+        self.weather.set_temp_at_datetime('2024-02-01', 0, None)
+        self.assertAlmostEqual(self.weather.aggregate('hours', 'D', {'temp': 'mean'})['2024-02-01']['temp'],
+                               sum(hour['temp'] for hour in hours[1:]) / 23)
+        # periods without values
+        empty = {reducer: self.weather.aggregate('days', 'M', {'missing': reducer})['2024-01']['missing']
+                 for reducer in ('sum', 'count', 'max')}
+        self.assertEqual(empty, {'sum': 0, 'count': 0, 'max': None})
+        with self.assertRaises(ValueError):
+            self.weather.aggregate('hours', 'D', {'temp': 'average'})
+
+if __name__ == "__main__":
+    unittest.main()
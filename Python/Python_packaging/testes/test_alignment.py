@@ -0,0 +1,42 @@
+# test_alignment.py
+import math
+import unittest
+from weather import Weather
+from weather.alignment import align_locations, hour_epochs
+from weather.synthetic import generate_timeline
+
+class TestAlignment(unittest.TestCase):
+    def setUp(self):
+        self.kansas = Weather()
+        self.kansas.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=2))
+        self.delhi = generate_timeline('Delhi', '2024-01-02', days=2)
+        for day in self.delhi['days']:
+            for hour in day['hours']:
+                hour['datetimeEpoch'] -= 1800
+
+    def test_hour_epochs(self):
+        data = self.kansas.get_weather_data()
+        epochs = list(hour_epochs(data))
+        del data['days'][0]['hours'][3]['datetimeEpoch']
+        self.assertEqual(list(hour_epochs(data)), epochs)
+
+    def test_align_locations(self):
+        aligned = align_locations([self.kansas, self.delhi], ['temp'])
+        kansas_epochs = [hour['datetimeEpoch'] for hour in self.kansas.get_weather_hourly_data()]
+        self.assertEqual(aligned['datetimeEpoch'][0], min(kansas_epochs[0], self.delhi['days'][0]['hours'][0]['datetimeEpoch'] + 1800))
+        temp = aligned['temp']
+        self.assertEqual(temp.shape, (len(aligned['datetimeEpoch']), 2))
+        row = list(aligned['datetimeEpoch']).index(kansas_epochs[30])
+        self.assertEqual(temp[row, 0], self.kansas.get_temp_at_datetime(1, 6))
+        delhi_row = list(aligned['datetimeEpoch']).index(self.delhi['days'][0]['hours'][0]['datetimeEpoch'] + 1800)
+        self.assertEqual(temp[delhi_row, 1], self.delhi['days'][0]['hours'][0]['temp'])
+        self.assertTrue(math.isnan(temp[0, 1]))
+
+        inner = align_locations([self.kansas, self.delhi], ['temp'], how='inner')
+        self.assertLess(len(inner['datetimeEpoch']), len(aligned['datetimeEpoch']))
+        self.assertFalse(any(math.isnan(value) for value in inner['temp'].obj))
+        with self.assertRaises(ValueError):
+            align_locations([self.kansas], ['temp'], how='left')
+
+if __name__ == "__main__":
+    unittest.main()
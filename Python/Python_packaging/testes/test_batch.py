@@ -0,0 +1,57 @@
+# test_batch.py
+import unittest
+import requests
+from functools import partial
+from unittest.mock import patch
+from weather import Weather
+from weather.batch import fetch_many
+from weather.columns import to_column
+from weather.indices import heat_index
+from weather.lazy import LazyList
+from weather.stub_server import StubTimelineServer
+
+class TestBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubTimelineServer(api_key='KEY', today='2024-01-02')
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_fetch_many(self):
+        locations = ['38.9,-95.6', {'location': 'Denver', 'from_date': '2024-01-01', 'to_date': '2024-01-02'}]
+        derived = {'hours': {'heatindex': partial(heat_index, level='hours')}}
+        for processes in (0, 2):
+            weathers = fetch_many(locations, '2023-12-30', '2024-01-05', include='days,hours', processes=processes,
+                                  derived=derived, base_url=self.server.base_url, api_key='KEY')
+            # the columns decoded by the processes are read without building the hours
+            with patch('weather.weather.to_column', wraps=to_column) as built:
+                columns = weathers[0].get_weather_columns('hours', ['temp', 'heatindex'])
+            self.assertEqual(len(columns['temp']), 7 * 24)
+            self.assertEqual(built.call_count, 0 if processes else 2)
+            expected = Weather(base_url=self.server.base_url, api_key='KEY')
+            expected.fetch_weather_data('Denver', '2024-01-01', '2024-01-02', include='days,hours')
+            self.assertEqual(len(weathers[0].get_weather_daily_data()), 7)
+            self.assertEqual(weathers[1].get_temp_at_datetime(1, 5), expected.get_temp_at_datetime(1, 5))
+            self.assertEqual(list(weathers[1].get_weather_columns('hours', ['heatindex'])['heatindex']),
+                             list(heat_index(expected)))
+            self.assertEqual(isinstance(weathers[0].get_weather_data()['days'][0]['hours'], LazyList), processes != 0)
+            weathers[0].fetch_weather_data('Denver')
+
+        # the decoded columns are cached like the others, within the size of the cache
+        with patch('weather.weather.MAX_CACHED_VIEWS', 16):
+            weather, = fetch_many(['Denver'], include='days,hours', processes=1, base_url=self.server.base_url, api_key='KEY')
+        self.assertEqual(len(weather._Weather__views), 16)
+
+        # processes are opt-in
+        with patch('weather.batch.ProcessPoolExecutor') as pool:
+            fetch_many(['Denver'], base_url=self.server.base_url, api_key='KEY')
+        pool.assert_not_called()
+
+        with self.assertRaises(requests.HTTPError):
+            fetch_many(['Denver'], processes=0, base_url=self.server.base_url, api_key='WRONG')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# test_budget.py
+import time
+import unittest
+from weather import Weather, QueryBudget, BudgetExceededError
+from weather.stub_server import StubTimelineServer
+
+class TestQueryBudget(unittest.TestCase):
+    def test_estimate(self):
+        budget = QueryBudget(100, include_factors={'minutes': 4})
+        self.assertEqual(budget.estimate(), 15)
+        self.assertEqual(budget.estimate('2024-01-01', '2024-01-31', locations=2), 62)
+        self.assertEqual(budget.estimate('last7days', include='days,minutes'), 28)
+        self.assertEqual(budget.estimate('2024-01-01T12:00:00'), 1)
+
+    def test_reserve(self):
+        budget = QueryBudget(10)
+        reserved = budget.reserve(6)
+        with self.assertRaises(BudgetExceededError):
+            budget.reserve(6)
+        budget.settle(reserved, 4)
+        self.assertEqual(budget.get_spent(), 4)
+        budget.release(budget.reserve(6))
+        self.assertEqual(budget.get_remaining(), 6)
+
+    def test_defer(self):
+        budget = QueryBudget(2, period=0.2, on_exceed='defer', max_wait=1)
+        budget.settle(budget.reserve(2), 2)
+        start = time.monotonic()
+        budget.reserve(1)
+        self.assertGreater(time.monotonic() - start, 0.1)
+        budget = QueryBudget(2, period=10, on_exceed='defer', max_wait=0.05)
+        budget.reserve(2)
+        with self.assertRaises(BudgetExceededError):
+            budget.reserve(1)
+
+    def test_shared_by_fetches(self):
+        budget = QueryBudget(5)
+        with StubTimelineServer() as server:
+            first, second = Weather(base_url=server.base_url, budget=budget), Weather(base_url=server.base_url, budget=budget)
+            first.fetch_weather_data('A', '2024-01-01', '2024-01-03')
+            with self.assertRaises(BudgetExceededError):
+                second.fetch_weather_data('B', '2024-01-01', '2024-01-03')
+            second.fetch_weather_data('B', '2024-01-01', '2024-01-02')
+            self.assertEqual(server.stats['requests'], 2)
+        self.assertEqual(budget.get_remaining(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
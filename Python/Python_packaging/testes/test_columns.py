@@ -0,0 +1,83 @@
+# test_columns.py
+import copy
+import math
+import unittest
+from array import array
+from weather import Weather
+from weather.columns import intern_records, encode_categorical, decode_categorical
+from weather.synthetic import generate_timeline
+
+class TestColumns(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_timeline('38.9,-95.6', '2024-01-01', days=3)
+        self.weather = Weather()
+        self.weather.set_weather_data(self.data)
+
+    def test_get_weather_columns(self):
+        columns = self.weather.get_weather_columns(elements=['temp', 'preciptype', 'conditions'])
+        self.assertIsInstance(columns['temp'], array)
+        self.assertEqual(list(columns['temp']), [hour['temp'] for hour in self.weather.get_weather_hourly_data()])
+        self.assertEqual(len(columns['preciptype']), 72)
+        self.data['days'][1]['tempmax'] = None
+        self.assertTrue(math.isnan(self.weather.get_weather_columns('days', ['tempmax'])['tempmax'][1]))
+
+    def test_diff(self):
+        other = copy.deepcopy(self.data)
+        other['days'][1]['hours'][5]['temp'] = 100.0
+        other['days'][2]['tempmax'] = None
+        expected = [
+            {'day': '2024-01-02', 'time': '05:00:00', 'element': 'temp', 'old': self.data['days'][1]['hours'][5]['temp'], 'new': 100.0},
+            {'day': '2024-01-03', 'time': None, 'element': 'tempmax', 'old': self.data['days'][2]['tempmax'], 'new': None},
+        ]
+        self.assertEqual(self.weather.diff(other), expected)
+        self.assertEqual(self.weather.diff(other, columnar=True), expected)
+        self.assertEqual(self.weather.diff(other, ['tempmax']), expected[1:])
+
+        del other['days'][0]
+        changes = self.weather.diff(other)
+        self.assertEqual((changes[0]['day'], changes[0]['element'], changes[0]['new']), ('2024-01-01', None, None))
+        with self.assertRaises(ValueError):
+            self.weather.diff(other, columnar=True)
+
+    def test_cached_views(self):
+        hours = self.weather.get_weather_hourly_data()
+        self.assertIsInstance(hours, tuple)
+        self.assertIs(self.weather.get_weather_hourly_data(), hours)
+        temps = self.weather.get_weather_hourly_data(['temp'])
+        self.assertIs(self.weather.get_weather_hourly_data(['temp']), temps)
+        self.assertIs(self.weather.get_weather_daily_data(), self.weather.get_weather_daily_data())
+        version = self.weather.get_data_version()
+
+        self.weather.set_temp_at_datetime(0, 0, -40)
+        self.assertGreater(self.weather.get_data_version(), version)
+        self.assertIsNot(self.weather.get_weather_hourly_data(['temp']), temps)
+        self.assertEqual(self.weather.get_weather_hourly_data(['temp'])[0], {'temp': -40})
+        self.assertEqual(self.weather.get_weather_columns(elements=['temp'])['temp'][0], -40)
+
+        copies = self.weather.get_weather_hourly_data(copy=True)
+        self.assertIsInstance(copies, list)
+        copies[0]['temp'] = 100
+        self.assertEqual(self.weather.get_temp_at_datetime(0, 0), -40)
+
+        self.data['days'][0]['hours'][0]['temp'] = 20
+        self.weather.mark_modified()
+        self.assertEqual(self.weather.get_weather_columns(elements=['temp'])['temp'][0], 20)
+
+    def test_categorical(self):
+        records = [{'conditions': ''.join(['Partially ', 'cloudy']), 'stations': ['KMCI', 'KTOP']},
+                   {'conditions': ''.join(['Partially ', 'cloudy']), 'stations': ['KMCI', 'KTOP']},
+                   {'conditions': None, 'stations': ['KMCI']}]
+        self.assertIsNot(records[0]['conditions'], records[1]['conditions'])
+        intern_records(records)
+        self.assertIs(records[0]['conditions'], records[1]['conditions'])
+        self.assertIsNot(records[0]['stations'], records[1]['stations'])
+        self.assertIs(records[0]['stations'][0], records[2]['stations'][0])
+
+        codes, table = encode_categorical([record['stations'] for record in records])
+        self.assertEqual((list(codes), table), ([0, 0, 1], [['KMCI', 'KTOP'], ['KMCI']]))
+        values = decode_categorical(codes, table)
+        self.assertEqual(values, [record['stations'] for record in records])
+        self.assertIsNot(values[0], values[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# test_export.py
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from weather import Weather
+from weather.synthetic import generate_timeline
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=2))
+
+    def test_write_csv(self):
+        output = io.StringIO()
+        self.assertEqual(self.weather.write_csv(output, elements=['temp', 'stations']), 48)
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0], ['date', 'temp', 'stations'])
+        hour = self.weather.get_data_at_datetime('2024-01-02', '01:00:00')
+        self.assertEqual(rows[26], ['2024-01-02', str(hour['temp']), ','.join(hour['stations'])])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'days.csv')
+            self.assertEqual(self.weather.write_csv(path, level='days'), 2)
+            with open(path, newline='') as file:
+                self.assertEqual(next(csv.reader(file))[:3], ['datetime', 'datetimeEpoch', 'tempmax'])
+
+    def test_write_ndjson(self):
+        output = io.StringIO()
+        self.assertEqual(self.weather.write_ndjson(output), 48)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records[25], dict(self.weather.get_data_at_datetime(1, 1), date='2024-01-02'))
+
+        output = io.StringIO()
+        self.weather.write_ndjson(output, level='days', elements=['tempmax'])
+        self.assertEqual(output.getvalue().splitlines()[0], json.dumps({'tempmax': self.weather.get_tempmax_on_day(0)}, separators=(',', ':')))
+
+    def test_write_parquet_dataset(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        from weather.export import write_parquet_dataset
+        other = Weather()
+        other.set_weather_data(generate_timeline('Denver', '2024-01-31', days=2))
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(write_parquet_dataset([self.weather, other], directory), 96)
+            self.assertEqual(self.weather.write_parquet(directory), 48)
+            dataset = ds.dataset(directory, format='parquet', partitioning='hive')
+            self.assertEqual(len(dataset.files), 3)
+            table = dataset.to_table(filter=(ds.field('month') == 2))
+            self.assertEqual(table.num_rows, 24)
+            self.assertEqual(table.schema.field('datetimeEpoch').type, pa.int64())
+            self.assertEqual(table.schema.field('temp').type, pa.float64())
+            self.assertTrue(pa.types.is_dictionary(table.schema.field('conditions').type))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+# test_gaps.py
+import math
+import unittest
+from weather import Weather
+from weather.gaps import find_gaps, regularize
+from weather.synthetic import generate_timeline
+
+class TestGaps(unittest.TestCase):
+    def test_find_gaps(self):
+        report = find_gaps([0, 3600, 3600, 14400, 10800, 16200])
+        self.assertEqual(report['gaps'], [(3600, 14400, 2)])
+        self.assertEqual(report['duplicates'], [2])
+        self.assertEqual(report['unordered'], [4])
+        self.assertEqual(report['irregular'], [5])
+
+    def test_regularize(self):
+        epochs = [0, 3600, 3600, 14400, 18000]
+        values = [0.0, 1.0, 2.0, None, 10.0]
+        grid, columns = regularize(epochs, {'temp': values})
+        self.assertEqual(list(grid), [0, 3600, 7200, 10800, 14400, 18000])
+        self.assertEqual(list(columns['temp']), [0.0, 2.0, 4.0, 6.0, 8.0, 10.0])
+        _, columns = regularize(epochs, {'temp': values}, method='nearest')
+        self.assertEqual(list(columns['temp']), [0.0, 2.0, 2.0, 2.0, 10.0, 10.0])
+        _, columns = regularize(epochs, {'temp': values}, max_gap=3 * 3600)
+        self.assertEqual(list(columns['temp'])[:2], [0.0, 2.0])
+        self.assertTrue(all(math.isnan(value) for value in columns['temp'][2:5]))
+        with self.assertRaises(ValueError):
+            regularize(epochs, {'temp': values}, method='cubic')
+
+    def test_weather_regularize(self):
+        weather = Weather()
+        weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=2))
+        hours = weather.get_hourlyData_on_day(0)
+        del hours[5]
+        weather.set_temp_at_datetime(0, 2, None)
+        weather.mark_modified()
+        self.assertEqual(weather.find_gaps()['gaps'], [(hours[4]['datetimeEpoch'], hours[5]['datetimeEpoch'], 1)])
+        regular = weather.regularize(['temp'])
+        self.assertEqual(len(regular['datetimeEpoch']), 48)
+        self.assertAlmostEqual(regular['temp'][5], (hours[4]['temp'] + hours[5]['temp']) / 2)
+        self.assertAlmostEqual(regular['temp'][2], (hours[1]['temp'] + hours[3]['temp']) / 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# test_indices.py
+import math
+import unittest
+from weather import Weather
+from weather.indices import degree_days, accumulated_precip, wind_chill, heat_index, solar_energy_total
+from weather.synthetic import generate_timeline
+
+class TestIndices(unittest.TestCase):
+    def setUp(self):
+        self.weathers = []
+        for location in ('38.9,-95.6', 'Denver'):
+            weather = Weather()
+            weather.set_weather_data(generate_timeline(location, '2024-01-01', days=5))
+            self.weathers.append(weather)
+        self.weather = self.weathers[0]
+
+    def test_degree_days(self):
+        day = self.weather.get_data_on_day(2)
+        mean = (day['tempmax'] + day['tempmin']) / 2
+        self.assertAlmostEqual(degree_days(self.weather)[2], max(65 - mean, 0))
+        self.assertAlmostEqual(degree_days(self.weather, 'cooling', base=20)[2], max(mean - 20, 0))
+        self.assertAlmostEqual(degree_days(self.weather, 'growing', base=10, cap=30)[2],
+                               max((min(day['tempmax'], 30) + max(day['tempmin'], 10)) / 2 - 10, 0))
+        self.assertEqual([len(values) for values in degree_days(self.weathers)], [5, 5])
+        self.weather.set_tempmax_on_day(0, None)
+        self.assertTrue(math.isnan(degree_days(self.weather)[0]))
+        with self.assertRaises(ValueError):
+            degree_days(self.weather, 'freezing')
+
+    def test_accumulated_precip(self):
+        precip = [day['precip'] for day in self.weather.get_weather_daily_data()]
+        self.assertAlmostEqual(accumulated_precip(self.weather)[-1], sum(precip))
+        self.assertAlmostEqual(accumulated_precip(self.weather, 'hours')[-1],
+                               sum(hour['precip'] for hour in self.weather.get_weather_hourly_data()))
+
+    def test_feels_like(self):
+        self.weather.set_temp_at_datetime(0, 0, 5.0)
+        self.weather.set_windspeed_at_datetime(0, 0, 20.0)
+        self.weather.set_temp_at_datetime(0, 1, 96.0)
+        self.weather.set_humidity_at_datetime(0, 1, 65.0)
+        self.assertAlmostEqual(wind_chill(self.weather)[0], -15.4, 1)
+        self.assertAlmostEqual(heat_index(self.weather)[1], 121.2, 0)
+        self.weather.set_temp_at_datetime(0, 0, -10.0)
+        self.weather.set_windspeed_at_datetime(0, 0, 30.0)
+        self.assertAlmostEqual(wind_chill(self.weather, 'metric')[0], -19.5, 0)
+        with self.assertRaises(ValueError):
+            heat_index(self.weather, 'imperial')
+
+    def test_solar_energy_total(self):
+        total = sum(day['solarenergy'] for day in self.weather.get_weather_daily_data())
+        self.assertAlmostEqual(solar_energy_total(self.weathers)[0], total)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# test_locks.py
+import itertools
+import sys
+import threading
+import time
+import unittest
+from weather import Weather
+from weather.constants import MAX_CACHED_VIEWS
+from weather.locks import ReadWriteLock
+from weather.stub_server import StubTimelineServer
+from weather.synthetic import generate_timeline
+
+class TestLocks(unittest.TestCase):
+    def test_read_write_lock(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def write():
+            with lock.write():
+                events.append('write')
+
+        with lock.read():
+            with lock.read():
+                writer = threading.Thread(target=write)
+                writer.start()
+                time.sleep(0.05)
+                events.append('read')
+            with self.assertRaises(RuntimeError):
+                with lock.write():
+                    pass
+        writer.join()
+        self.assertEqual(events, ['read', 'write'])
+        with lock.write():
+            with lock.read(), lock.write():
+                events.append('nested')
+        self.assertEqual(events[-1], 'nested')
+
+    def test_thread_safe_weather(self):
+        with StubTimelineServer(api_key='KEY', today='2024-01-02') as server:
+            weather = Weather(base_url=server.base_url, api_key='KEY', thread_safe=True)
+            weather.fetch_weather_data('Test', '2024-01-01', '2024-01-03', include='days,hours')
+            errors = []
+            counts = set()
+            stop = threading.Event()
+
+            def read():
+                try:
+                    while not stop.is_set():
+                        hours = weather.get_weather_hourly_data()
+                        counts.add(len(hours))
+                        weather.get_temp_at_datetime(0, 5)
+                        weather.query('hours', 'temp > 0')
+                except Exception as e:
+                    errors.append(e)
+            readers = [threading.Thread(target=read) for _ in range(4)]
+            for reader in readers:
+                reader.start()
+            for i in range(5):
+                weather.fetch_weather_data('Test', '2024-01-01', '2024-01-0%d' % (3 + i % 2), include='days,hours')
+                weather.set_temp_at_datetime(0, 5, i)
+            stop.set()
+            for reader in readers:
+                reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(counts, {72, 96})
+        self.assertEqual(weather.get_temp_at_datetime(0, 5), 4)
+
+    def test_full_view_cache(self):
+        weather = Weather(thread_safe=True)
+        weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=1))
+        pairs = [list(pair) for pair in itertools.combinations(['temp', 'tempmax', 'tempmin', 'humidity', 'dew',
+                                                                 'precip', 'windspeed', 'pressure', 'cloudcover'], 2)]
+        errors = []
+
+        def read():
+            try:
+                for _ in range(20):
+                    for elements in pairs:
+                        weather.get_weather_daily_data(elements)
+            except Exception as e:
+                errors.append(e)
+        # more views than the cache holds, evicted and added back by all the readers at once
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            readers = [threading.Thread(target=read) for _ in range(8)]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(weather._Weather__views), MAX_CACHED_VIEWS)
+
+if __name__ == "__main__":
+    unittest.main()
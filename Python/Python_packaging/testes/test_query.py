@@ -0,0 +1,51 @@
+# test_query.py
+import unittest
+from weather import Weather
+from weather.query import parse_predicate
+from weather.synthetic import generate_timeline
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=5))
+        self.hours = self.weather.get_weather_hourly_data()
+
+    def test_parse_predicate(self):
+        self.assertEqual(parse_predicate("temp > 30 and not preciptype contains 'snow'"),
+                         ('and', ('compare', '>', ('field', 'temp'), ('const', 30.0)),
+                          ('not', ('contains', ('field', 'preciptype'), ('const', 'snow')))))
+        for invalid in ('temp >', 'temp > 30 and', '(temp > 30', 'temp ~ 30', 'temp 30'):
+            with self.assertRaises(ValueError):
+                parse_predicate(invalid)
+
+    def test_query(self):
+        self.weather.set_preciptype_at_datetime(1, 3, ['rain', 'snow'])
+        self.weather.set_windgust_at_datetime(2, 4, None)
+        matches = self.weather.query('hours', 'temp > 30 and humidity > 70 or preciptype contains "snow"')
+        expected = [hour for hour in self.hours if hour['temp'] > 30 and hour['humidity'] > 70
+                    or 'snow' in (hour['preciptype'] or [])]
+        self.assertEqual(matches, expected)
+        self.assertIn(self.weather.get_data_at_datetime(1, 3), matches)
+
+        rows = self.weather.query('hours', 'windgust >= 20 and not (winddir < 180)', ['windgust'])
+        expected = [hour for hour in self.hours if hour['windgust'] is not None and hour['windgust'] >= 20 and hour['winddir'] >= 180]
+        self.assertEqual([row['windgust'] for row in rows], [hour['windgust'] for hour in expected])
+        self.assertEqual(set(rows[0]), {'date', 'datetime', 'windgust'})
+        self.assertEqual(self.weather.query('hours', 'windgust == null', ['windgust']),
+                         [{'date': '2024-01-03', 'datetime': '04:00:00', 'windgust': None}])
+        self.assertEqual(len(self.weather.query('days', 'tempmin < tempmax')), 5)
+        self.assertEqual(len(self.weather.query('days')), 5)
+        with self.assertRaises(ValueError):
+            self.weather.query('hours', 'tmp > 30')
+
+    def test_pushdown(self):
+        # selective left sides evaluate the right sides at their matching positions only
+        maximum = max(hour['temp'] for hour in self.hours)
+        matches = self.weather.query('hours', f'temp > {maximum - 5} and not (humidity < 50 or windgust == null)')
+        expected = [hour for hour in self.hours if hour['temp'] > maximum - 5
+                    and not (hour['humidity'] < 50 or hour['windgust'] is None)]
+        self.assertEqual(matches, expected)
+        self.assertEqual(self.weather.query('hours', 'temp > 1000 and humidity > 0'), [])
+
+if __name__ == "__main__":
+    unittest.main()
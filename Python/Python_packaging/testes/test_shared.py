@@ -0,0 +1,76 @@
+# test_shared.py
+import math
+import os
+import subprocess
+import sys
+import unittest
+from multiprocessing import get_context
+import weather
+from weather import Weather
+from weather.shared import SharedWeatherData, _take, _untrack
+from weather.snapshot import parse_snapshot
+from weather.synthetic import generate_timeline
+
+def total_temp(name):
+    with SharedWeatherData(name) as shared:
+        return math.fsum(shared.columns('hours')['temp'])
+
+class TestShared(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=3))
+
+    def test_share_and_attach(self):
+        block = self.weather.share()
+        try:
+            attached = Weather()
+            attachment = attached.attach_shared(block.name)
+            self.assertEqual(attached.get_temp_at_datetime(1, 5), self.weather.get_temp_at_datetime(1, 5))
+            self.assertEqual(attached.get_weather_data(), self.weather.get_weather_data())
+            columns = attachment.columns('days')
+            self.assertTrue(columns['tempmax'].readonly)
+            self.assertEqual(list(columns['tempmax']), list(self.weather.get_weather_columns('days', ['tempmax'])['tempmax']))
+            del columns
+            attached.clear_weather_data()
+            attachment.close()
+
+            with get_context().Pool(1) as pool:
+                total = pool.apply(total_temp, (block.name,))
+            self.assertAlmostEqual(total, math.fsum(hour['temp'] for hour in self.weather.get_weather_hourly_data()))
+        finally:
+            block.close()
+            block.unlink()
+        with self.assertRaises(FileNotFoundError):
+            SharedWeatherData(block.name)
+
+    def test_attach_from_independent_process(self):
+        block = self.weather.share()
+        try:
+            script = ("from weather.shared import SharedWeatherData\n"
+                      f"with SharedWeatherData({block.name!r}) as shared:\n"
+                      "    print(len(shared.columns('hours')['temp']))")
+            environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(weather.__file__)))
+            result = subprocess.run([sys.executable, '-c', script], env=environment, capture_output=True, text=True, check=True)
+            self.assertEqual(result.stdout.strip(), '72')
+            self.assertNotIn('resource_tracker', result.stderr)
+            # the block outlives the process that attached to it
+            with SharedWeatherData(block.name) as shared:
+                self.assertEqual(len(shared.columns('days')['tempmax']), 3)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_take(self):
+        block = self.weather.share()
+        name, size = block.name, block.size
+        _untrack(block)
+        block.close()
+        # the block is unlinked at once, its memory stays mapped for the data read from it
+        buffer = _take(name, size)
+        with self.assertRaises(FileNotFoundError):
+            SharedWeatherData(name)
+        self.assertTrue(buffer.readonly)
+        self.assertEqual(parse_snapshot(buffer)['days'][1]['hours'], self.weather.get_hourlyData_on_day(1))
+
+if __name__ == "__main__":
+    unittest.main()
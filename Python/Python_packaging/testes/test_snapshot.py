@@ -0,0 +1,82 @@
+# test_snapshot.py
+import copy
+import io
+import json
+import os
+import tempfile
+import unittest
+from weather import Weather
+from weather.lazy import LazyList
+from weather.snapshot import decode_columns, dump_snapshot
+from weather.synthetic import generate_timeline
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_timeline('38.9,-95.6', '2024-01-01', days=3, forecast_from='2024-01-02')
+        self.data['days'][0]['hours'][0]['preciptype'] = ['rain', 'snow']
+        del self.data['days'][1]['hours'][2]['uvindex']
+        self.data['days'][2]['hours'][3]['temp'] = None
+        self.weather = Weather()
+        self.weather.set_weather_data(copy.deepcopy(self.data))
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'weather.snap')
+            self.assertEqual(self.weather.save_snapshot(path), os.path.getsize(path))
+            for mmap in (True, False):
+                loaded = Weather()
+                loaded.load_snapshot(path, mmap=mmap)
+                self.assertIsInstance(loaded.get_hourlyData_on_day(0), LazyList)
+                self.assertEqual(loaded.get_temp_at_datetime('2024-01-02', '05:00:00'), self.weather.get_temp_at_datetime(1, 5))
+                self.assertFalse(loaded.get_hourlyData_on_day(2).is_materialized())
+                self.assertEqual(json.loads(json.dumps(loaded.get_weather_data())), self.data)
+            self.assertIsInstance(loaded.get_datetimeEpoch_at_datetime(0, 0), int)
+            self.assertIsNone(loaded.get_temp_at_datetime(2, 3))
+
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(b'{"days": []}' + b' ' * 32)
+        try:
+            with self.assertRaises(ValueError):
+                Weather().load_snapshot(file.name)
+        finally:
+            os.remove(file.name)
+
+    def test_save_over_loaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'weather.snap')
+            self.data['days'][0]['hours'][1]['datetimeEpoch'] = float(self.data['days'][0]['hours'][1]['datetimeEpoch'])
+            self.weather.set_weather_data(copy.deepcopy(self.data))
+            self.weather.save_snapshot(path)
+            loaded = Weather()
+            loaded.load_snapshot(path)
+            self.assertEqual(loaded.get_conditions_at_datetime(2, 4), self.weather.get_conditions_at_datetime(2, 4))
+            self.assertIsInstance(loaded.get_datetimeEpoch_at_datetime(0, 1), int)
+            loaded.set_temp_on_day(0, -40)
+            # the hours of the other days are still read from the mapped file while it is replaced
+            loaded.save_snapshot(path)
+            self.assertEqual(os.listdir(directory), ['weather.snap'])
+            reloaded = Weather()
+            reloaded.load_snapshot(path)
+            self.assertEqual(reloaded.get_temp_on_day(0), -40)
+            self.assertEqual(reloaded.get_weather_hourly_data(), self.weather.get_weather_hourly_data())
+
+    def test_decode_columns(self):
+        for day in self.data['days']:
+            day.pop('solarenergy')
+            for hour in day['hours']:
+                hour.pop('solarenergy')
+        self.weather.set_weather_data(copy.deepcopy(self.data))
+        file = io.BytesIO()
+        dump_snapshot(self.data, file)
+        for level in ('days', 'hours'):
+            # elements absent from every record are decoded like the others
+            columns = decode_columns(file.getvalue(), level)
+            self.assertIn('solarenergy', columns)
+            expected = self.weather.get_weather_columns(level, list(columns))
+            for element, column in columns.items():
+                self.assertIs(type(column), type(expected[element]))
+                self.assertEqual([None if value != value else value for value in column],
+                                 [None if value != value else value for value in expected[element]])
+
+if __name__ == "__main__":
+    unittest.main()
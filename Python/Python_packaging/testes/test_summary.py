@@ -0,0 +1,72 @@
+# test_summary.py
+import unittest
+from unittest import mock
+from weather import Weather
+from weather.summary import summarize_column
+from weather.synthetic import generate_timeline
+from array import array
+
+NAN = float('nan')
+
+class TestSummary(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-07-01', days=10))
+
+    def test_summarize_column(self):
+        summary = summarize_column(array('d', [3.0, NAN, 7.0, 1.0, 7.0, 5.0]), k=2, percentiles=(0, 50, 100))
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual((summary['min'], summary['max']), (3, 2))
+        self.assertEqual(summary['top'], [2, 4])
+        self.assertEqual(summary['bottom'], [3, 0])
+        self.assertEqual(summary['percentiles'], {0: 1.0, 50: 5.0, 100: 7.0})
+        empty = summarize_column(array('d', [NAN]))
+        self.assertEqual((empty['min'], empty['top'], empty['percentiles'][50]), (None, [], None))
+        with self.assertRaises(ValueError):
+            summarize_column(['a', 'b'])
+        with self.assertRaises(ValueError):
+            summarize_column(array('d'), percentiles=(101,))
+
+    def test_get_summary(self):
+        days = self.weather.get_weather_daily_data()
+        hottest = max(days, key=lambda day: day['tempmax'])
+        summary = self.weather.get_summary('days', ['tempmax'], k=3)['tempmax']
+        self.assertEqual(summary['max'], {'datetime': hottest['datetime'], 'tempmax': hottest['tempmax']})
+        self.assertEqual([day['tempmax'] for day in summary['top']],
+                         sorted((day['tempmax'] for day in days), reverse=True)[:3])
+        self.assertEqual(summary['count'], 10)
+
+        gust = self.weather.get_summary('hours', ['windgust'])['windgust']['max']
+        self.assertEqual(gust['windgust'], max(hour['windgust'] for hour in self.weather.get_weather_hourly_data()))
+        self.assertEqual(self.weather.get_data_at_datetime(gust['date'], gust['datetime'])['windgust'], gust['windgust'])
+
+        # setters invalidate the summaries
+        self.weather.set_tempmax_on_day(3, 150.0)
+        summary = self.weather.get_summary('days', ['tempmax'])['tempmax']
+        self.assertEqual(summary['max'], {'datetime': days[3]['datetime'], 'tempmax': 150.0})
+        self.assertIn('precip', self.weather.get_summary('hours'))
+        with self.assertRaises(ValueError):
+            self.weather.get_summary('days', ['conditions'])
+
+    def test_summaries_cached(self):
+        # every element of both levels outnumbers the cached views, summaries are still computed once
+        with mock.patch('weather.weather.summarize_column', wraps=summarize_column) as summarize:
+            first = (self.weather.get_summary('days'), self.weather.get_summary('hours'))
+            calls = summarize.call_count
+            self.assertEqual((self.weather.get_summary('days'), self.weather.get_summary('hours')), first)
+            self.assertEqual(summarize.call_count, calls)
+            self.weather.set_precip_on_day(0, 9.0)
+            self.assertEqual(self.weather.get_summary('days', ['precip'])['precip']['max']['precip'], 9.0)
+            self.assertEqual(summarize.call_count, calls + 1)
+            # only the summaries of the set element are recomputed
+            self.weather.set_temp_at_datetime(0, 3, 99.0)
+            self.weather.get_summary('days')
+            hours = self.weather.get_summary('hours')
+            self.assertEqual(hours['temp']['max']['temp'], 99.0)
+            self.assertEqual(summarize.call_count, calls + 2)
+            self.weather.mark_modified()
+            self.weather.get_summary('days')
+            self.assertEqual(summarize.call_count, calls + 2 + len(first[0]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 # test_utils.py
 import unittest
-from weather import update_dictionary, is_valid_dict, extract_subdict_by_keys
+from weather import update_dictionary, is_valid_dict, extract_subdict_by_keys, resolve_projection
 
 class TestUtils(unittest.TestCase):
     def test_update_dictionary(self):
@@ -25,5 +25,12 @@ class TestUtils(unittest.TestCase):
         sub_dict = extract_subdict_by_keys(original_dict, keys_list)
         self.assertEqual(sub_dict, {'name': 'John Doe', 'email': 'johndoe@example.com'})
 
+    def test_resolve_projection(self):
+        self.assertEqual(resolve_projection(['temp', 'precip', 'temp']), (None, 'datetime,datetimeEpoch,temp,precip'))
+        self.assertEqual(resolve_projection({'days': ['tempmax'], 'hours': ['temp', 'datetime']}),
+                         ('days,hours', 'datetime,datetimeEpoch,tempmax,temp'))
+        with self.assertRaises(ValueError):
+            resolve_projection('temp')
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+# test_watchlist.py
+import os
+import tempfile
+import time
+import unittest
+import requests
+from weather.stub_server import StubTimelineServer
+from weather.watchlist import ForecastWatchlist
+
+class TestWatchlist(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubTimelineServer(api_key='KEY', today='2024-01-02')
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_refresh_in_background(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ForecastWatchlist(interval=0.2, jitter=0.2, max_concurrency=2, cache_dir=cache_dir,
+                                   base_url=self.server.base_url, api_key='KEY') as watchlist:
+                watchlist.add('38.9,-95.6', include='days,hours')
+                watchlist.add('Denver')
+                self.assertTrue(watchlist.wait(5))
+                first = watchlist.get('Denver')
+                self.assertEqual(len(first.get_weather_daily_data()), 15)
+                deadline = time.monotonic() + 5
+                while watchlist.get('Denver') is first and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                self.assertIsNot(watchlist.get('Denver'), first)
+                watchlist.remove('Denver')
+                self.assertEqual(watchlist.get_locations(), ['38.9,-95.6'])
+            self.assertIsNone(watchlist.get('Denver'))
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # a new watchlist serves the saved data before its first refresh
+            warm = ForecastWatchlist(interval=60, cache_dir=cache_dir, base_url=self.server.base_url, api_key='KEY')
+            warm.add('38.9,-95.6', include='days,hours')
+            self.assertEqual(warm.get('38.9,-95.6').get_weather_hourly_data(),
+                             watchlist.get('38.9,-95.6').get_weather_hourly_data())
+            self.assertGreater(warm.get_status('38.9,-95.6')['next_refresh_in'], 30)
+
+    def test_replaced_while_refreshing(self):
+        server = StubTimelineServer(api_key='KEY', today='2024-01-02', latency=0.3)
+        server.start()
+        try:
+            with ForecastWatchlist(interval=60, base_url=server.base_url, api_key='KEY') as watchlist:
+                watchlist.add('Denver')
+                time.sleep(0.1)  # the first refresh is running
+                watchlist.add('Denver', include='days,hours')
+                self.assertTrue(watchlist.wait(5))
+                deadline = time.monotonic() + 5
+                while not watchlist.get('Denver').get_weather_hourly_data() and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                self.assertEqual(len(watchlist.get('Denver').get_weather_hourly_data()), 15 * 24)
+                self.assertGreater(watchlist.get_status('Denver')['next_refresh_in'], 30)
+        finally:
+            server.stop()
+
+    def test_failed_refresh(self):
+        watchlist = ForecastWatchlist(interval=60, retry_interval=30, base_url=self.server.base_url, api_key='WRONG')
+        watchlist.add('Denver')
+        with self.assertRaises(requests.HTTPError):
+            watchlist.refresh('Denver')
+        status = watchlist.get_status('Denver')
+        self.assertIsInstance(status['error'], requests.HTTPError)
+        self.assertEqual(status['failures'], 1)
+        self.assertLessEqual(status['next_refresh_in'], 30)
+        self.assertIsNone(watchlist.get('Denver'))
+        with self.assertRaises(ValueError):
+            ForecastWatchlist(interval=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# test_weather.py
+import unittest
+import requests
+from weather import Weather
+from weather.instrumentation import new_session
+from weather.lazy import LazyList
+from weather.stub_server import StubTimelineServer
+
+class TestWeather(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubTimelineServer(api_key='KEY', today='2024-01-02')
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_fetch_projection(self):
+        weather = Weather(base_url=self.server.base_url, api_key='KEY', projection={'hours': ['temp']})
+        weather.fetch_weather_data('Test', '2024-01-01', '2024-01-02')
+        self.assertEqual(self.server.last_request['params']['include'], 'hours')
+        self.assertEqual(self.server.last_request['params']['elements'], 'datetime,datetimeEpoch,temp')
+        self.assertEqual(set(weather.get_hourlyData_on_day(0)[0]), {'datetime', 'datetimeEpoch', 'temp'})
+        with weather.projected(None):
+            weather.fetch_weather_data('Test', '2024-01-01', '2024-01-02')
+        self.assertEqual(self.server.last_request['params']['include'], 'days')
+        self.assertEqual(weather.projection, {'hours': ['temp']})
+
+    def test_fetch_response_stats(self):
+        weather = Weather(base_url=self.server.base_url, api_key='KEY')
+        self.assertEqual(weather.fetch_weather_data('Test', '2024-01-01', '2024-01-03')['queryCost'], 3)
+        stats = weather.get_response_stats()
+        self.assertEqual(stats['status'], 200)
+        self.assertEqual(stats['content_encoding'], 'gzip')
+        self.assertLess(stats['compressed_bytes'], stats['decompressed_bytes'])
+
+    def test_fetch_hooks(self):
+        events = []
+        weather = Weather(base_url=self.server.base_url, api_key='KEY', hooks=[events.append])
+        weather.fetch_weather_data('Test', '2024-01-01', '2024-01-02', include='hours')
+        self.assertEqual(weather.get_temp_at_datetime('2024-01-02', '01:00:00'), weather.get_temp_at_datetime(1, 1))
+        self.assertEqual(events[0]['query_cost'], 2)
+        self.assertEqual(events[0]['status'], 200)
+        self.assertNotIn('key', events[0]['params'])
+        self.assertEqual(set(events[0]['timings']), {'connect', 'ttfb', 'download', 'decode', 'index', 'total'})
+
+        weather.remove_fetch_hook(events.append)
+        weather.add_fetch_hook(lambda event: events.append(event['error']))
+        weather.api_key = 'WRONG'
+        with self.assertRaises(requests.HTTPError) as raised:
+            weather.fetch_weather_data('Test')
+        self.assertIsInstance(events[1], requests.HTTPError)
+        # the failed response does not hold its connection
+        self.assertTrue(raised.exception.response.raw.closed)
+
+    def test_close(self):
+        with Weather(base_url=self.server.base_url, api_key='KEY') as weather:
+            weather.fetch_weather_data('Test')
+            adapter = weather.session.get_adapter(self.server.base_url)
+            self.assertEqual(len(adapter.poolmanager.pools), 1)
+        self.assertEqual(len(adapter.poolmanager.pools), 0)
+        self.assertEqual(len(weather.get_weather_daily_data()), 15)
+
+        # a session given to the object is left to its owner
+        session = new_session()
+        with Weather(base_url=self.server.base_url, api_key='KEY', session=session) as weather:
+            weather.fetch_weather_data('Test')
+        self.assertEqual(len(session.get_adapter(self.server.base_url).poolmanager.pools), 1)
+        session.close()
+
+    def test_refresh(self):
+        weather = Weather(base_url=self.server.base_url, api_key='KEY')
+        with self.assertRaises(ValueError):
+            weather.refresh()
+        weather.fetch_weather_data('Test', '2023-12-30', '2024-01-05', include='hours')
+        observed = weather.get_data_on_day('2024-01-01')
+        weather.set_temp_on_day('2024-01-03', -100)
+        weather.refresh()
+        self.assertEqual((self.server.last_request['from_date'], self.server.last_request['to_date']), ('2024-01-02', '2024-01-05'))
+        self.assertEqual(self.server.last_request['params']['include'], 'hours')
+        self.assertIs(weather.get_data_on_day('2024-01-01'), observed)
+        self.assertNotEqual(weather.get_temp_on_day('2024-01-03'), -100)
+        self.assertEqual(len(weather.get_weather_daily_data()), 7)
+        self.assertEqual(weather.get_queryCost(), 4)
+
+        # final days between the others are not refetched
+        final = dict(weather.get_data_on_day('2024-01-04'), source='obs')
+        weather.set_data_on_day('2024-01-04', final)
+        events = []
+        weather.add_fetch_hook(events.append)
+        weather.refresh()
+        self.assertEqual([(event['from_date'], event['to_date']) for event in events],
+                         [('2024-01-02', '2024-01-03'), ('2024-01-05', '2024-01-05')])
+        self.assertIs(weather.get_data_on_day('2024-01-04'), final)
+        self.assertEqual(len(weather.get_weather_daily_data()), 7)
+
+    def test_duplicate_dates(self):
+        weather = Weather()
+        weather.set_weather_data({'days': [{'datetime': '2024-01-01', 'temp': 1}, {'datetime': '2024-01-01', 'temp': 2}]})
+        self.assertEqual(weather.get_temp_on_day('2024-01-01'), 1)
+
+    def test_lazy_hours(self):
+        eager = Weather(base_url=self.server.base_url, api_key='KEY')
+        eager.fetch_weather_data('Test', '2024-01-01', '2024-01-03', include='days,hours')
+        weather = Weather(base_url=self.server.base_url, api_key='KEY', lazy_hours=True)
+        weather.fetch_weather_data('Test', '2024-01-01', '2024-01-03', include='days,hours')
+        hours = [day['hours'] for day in weather.get_weather_daily_data()]
+        self.assertTrue(all(isinstance(day_hours, LazyList) and not day_hours.is_materialized() for day_hours in hours))
+        self.assertEqual(weather.get_temp_at_datetime('2024-01-02', '05:00:00'), eager.get_temp_at_datetime(1, 5))
+        self.assertEqual([day_hours.is_materialized() for day_hours in hours], [False, True, False])
+        self.assertEqual(weather.get_weather_hourly_data(), eager.get_weather_hourly_data())
+        self.assertEqual(weather.get_weather_data(), eager.get_weather_data())
+
+    def test_stub_server(self):
+        weather = Weather(base_url=self.server.base_url, api_key='KEY')
+        forecast = weather.fetch_weather_data('38.9,-95.6', unit_group='metric')
+        self.assertEqual(len(forecast['days']), 15)
+        self.assertEqual([day['source'] for day in forecast['days'][:2]], ['comb', 'fcst'])
+        self.assertEqual(weather.fetch_weather_data('38.9,-95.6'), weather.fetch_weather_data('38.9,-95.6'))
+        with self.assertRaises(requests.HTTPError):
+            Weather(base_url=self.server.base_url, api_key='WRONG').fetch_weather_data('Test')
+
+        with StubTimelineServer(error_rate=1.0) as failing:
+            with self.assertRaises(requests.HTTPError):
+                Weather(base_url=failing.base_url).fetch_weather_data('Test')
+            self.assertEqual(failing.stats['errors'], 1)
+        with StubTimelineServer(rate_limit=1) as throttled:
+            weather = Weather(base_url=throttled.base_url)
+            weather.fetch_weather_data('Test')
+            with self.assertRaises(requests.HTTPError):
+                weather.fetch_weather_data('Test')
+            self.assertEqual(throttled.stats['throttled'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# test_windows.py
+import math
+import random
+import statistics
+import unittest
+from weather import Weather
+from weather.synthetic import generate_timeline
+from weather.windows import _SlidingQuantile, rolling
+
+class TestWindows(unittest.TestCase):
+    def setUp(self):
+        self.weather = Weather()
+        self.weather.set_weather_data(generate_timeline('38.9,-95.6', '2024-01-01', days=4))
+        self.hours = self.weather.get_weather_hourly_data()
+
+    def naive(self, element, window, function):
+        values = [hour[element] for hour in self.hours]
+        epochs = [hour['datetimeEpoch'] for hour in self.hours]
+        return [function([v for v, e in zip(values, epochs) if epochs[i] - window * 3600 < e <= epochs[i]])
+                for i in range(len(values))]
+
+    def test_rolling(self):
+        for stat, function in (('sum', sum), ('mean', statistics.fmean), ('max', max), ('min', min), ('median', statistics.median)):
+            expected = self.naive('windgust', 24, function)
+            for value, reference in zip(self.weather.rolling('windgust', 24, stat), expected):
+                self.assertAlmostEqual(value, reference)
+        std = self.weather.rolling('temp', 6, 'std')
+        self.assertTrue(math.isnan(std[0]))
+        self.assertAlmostEqual(std[10], statistics.stdev(hour['temp'] for hour in self.hours[5:11]))
+        self.assertEqual(self.weather.expanding('temp', 'max')[-1], max(hour['temp'] for hour in self.hours))
+        self.assertAlmostEqual(self.weather.expanding('temp', 'quantile', q=0.9)[-1],
+                               statistics.quantiles([hour['temp'] for hour in self.hours], n=10, method='inclusive')[-1])
+
+    def test_gaps_and_missing_values(self):
+        nan = float('nan')
+        values = [1.0, nan, 3.0, 4.0, 5.0]
+        epochs = [0, 3600, 7200, 36000, 39600]
+        self.assertEqual(list(rolling(values, epochs, 3 * 3600, 'sum')), [1.0, 1.0, 4.0, 4.0, 9.0])
+        self.assertEqual(list(rolling(values, epochs, 3 * 3600, 'max')), [1.0, 1.0, 3.0, 4.0, 5.0])
+        self.assertTrue(math.isnan(rolling(values, epochs, 3 * 3600, 'mean', min_periods=2)[0]))
+        with self.assertRaises(ValueError):
+            rolling(values, [0, 1, 2, 1, 0], 3600)
+        with self.assertRaises(ValueError):
+            rolling(values, epochs, 3600, 'variance')
+        with self.assertRaises(ValueError):
+            rolling(values, epochs, 0)
+
+    def test_quantile(self):
+        generator = random.Random(4)
+        values = [float(generator.randint(0, 20)) if generator.random() > 0.1 else float('nan') for _ in range(300)]
+        epochs = list(range(0, 300 * 60, 60))
+        for q in (0.0, 0.25, 0.5, 0.9, 1.0):
+            result = rolling(values, epochs, 25 * 60, 'quantile', q=q)
+            for i in range(len(values)):
+                window = sorted(v for v in values[max(i - 24, 0):i + 1] if v == v)
+                position = q * (len(window) - 1)
+                lower = int(position)
+                expected = window[lower] + (window[min(lower + 1, len(window) - 1)] - window[lower]) * (position - lower)
+                self.assertAlmostEqual(result[i], expected)
+
+    def test_quantile_memory(self):
+        # the removed values of a monotonic series never reach the top of their heap
+        for step in (1.0, -1.0):
+            window = _SlidingQuantile(0.5)
+            for i in range(2000):
+                window.add(i, i * step)
+                if i >= 24:
+                    window.remove(i - 24)
+                window.quantile()
+                self.assertLessEqual(len(window.heaps[0]) + len(window.heaps[1]), 4 * 25)
+            self.assertLessEqual(len(window.removed), 2 * 25)
+
+if __name__ == "__main__":
+    unittest.main()
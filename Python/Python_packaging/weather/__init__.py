@@ -1,4 +1,5 @@
 from .weather import Weather
-from .utils import update_dictionary, is_valid_dict, extract_subdict_by_keys
+from .budget import QueryBudget, BudgetExceededError
+from .utils import update_dictionary, is_valid_dict, extract_subdict_by_keys, resolve_projection
 
-__all__ = ['Weather', 'update_dictionary', 'is_valid_dict', 'extract_subdict_by_keys']
+__all__ = ['Weather', 'QueryBudget', 'BudgetExceededError', 'update_dictionary', 'is_valid_dict', 'extract_subdict_by_keys', 'resolve_projection']
@@ -0,0 +1,92 @@
+import calendar
+from array import array
+from datetime import datetime
+
+from .constants import *
+
+__all__ = ['hour_epochs', 'align_locations']
+
+NAN = float('nan')
+
+def hour_epochs(weather_data):
+    """
+    Get the UTC epoch seconds of the hours of weather data, from their `datetimeEpoch`, or else from
+    their local date and time and the `tzoffset` of the hour or of the location.
+
+    :param weather_data: The weather data dictionary.
+    :return: An array('d') of the epoch of each hour, NaN when it cannot be determined.
+    """
+    epochs = array('d')
+    default_offset = weather_data.get(TZOFFSET)
+    for day in weather_data.get(DAYS, []):
+        for hour in day.get(HOURS, []):
+            epoch = hour.get(DATETIME_EPOCH)
+            if epoch is None:
+                offset = hour.get(TZOFFSET, default_offset)
+                try:
+                    local = datetime.strptime(f"{day[DATETIME]} {hour[DATETIME]}", '%Y-%m-%d %H:%M:%S')
+                    epoch = calendar.timegm(local.timetuple()) - offset * 3600
+                except (KeyError, TypeError, ValueError):
+                    epoch = NAN
+            epochs.append(epoch)
+    return epochs
+
+def align_locations(weathers, elements, step=3600, how='outer'):
+    """
+    Align the hourly series of several locations onto a common UTC time grid.
+
+    The grid starts on a multiple of `step` and each hour is placed at the nearest grid time (the
+    later one when halfway), so that locations with half-hour time zone offsets line up with the
+    others; where several hours fall on the same grid time the last one is kept.
+
+    :param weathers: The Weather objects (or weather data dictionaries) of the locations.
+    :param elements: The numeric element names to align.
+    :param step: The interval of the grid, in seconds.
+    :param how: 'outer' for a grid covering the hours of any location, or 'inner' for the hours
+                covered by every location.
+    :return: A dictionary with the grid epochs under 'datetimeEpoch' (an array('q')), the names of
+             the 'locations' (resolved addresses), and for each element a 2-D memoryview of
+             floats [time x location] (NaN where a location has no value), backed by a flat array('d').
+    :raises ValueError: If `how` is invalid.
+    """
+    if how not in ('outer', 'inner'):
+        raise ValueError(f"Invalid how value, expected 'outer' or 'inner': {how}")
+    series = []
+    for weather in weathers:
+        weather_data = weather.get_weather_data() if hasattr(weather, 'get_weather_data') else weather
+        location = weather_data.get(RESOLVED_ADDRESS) or weather_data.get(ADDRESS)
+        hours = [hour for day in weather_data.get(DAYS, []) for hour in day.get(HOURS, [])]
+        epochs = hour_epochs(weather_data)
+        valid = [epoch for epoch in epochs if epoch == epoch]
+        series.append((location, hours, epochs, (min(valid), max(valid)) if valid else None))
+
+    spans = [span for _, _, _, span in series if span is not None]
+    if not spans or (how == 'inner' and len(spans) < len(series)):
+        start, end = 0, -step
+    elif how == 'outer':
+        start, end = min(span[0] for span in spans), max(span[1] for span in spans)
+    else:
+        start, end = max(span[0] for span in spans), min(span[1] for span in spans)
+    origin = int((start + step / 2) // step) * step
+    rows = max(int((end - origin + step / 2) // step) + 1, 0)
+    columns = len(series)
+    grid = array('q', range(origin, origin + rows * step, step))
+
+    result = {DATETIME_EPOCH: grid, 'locations': [location for location, _, _, _ in series]}
+    matrices = {element: array('d', [NAN]) * (rows * columns) for element in elements}
+    for j, (_, hours, epochs, _) in enumerate(series):
+        slots = []
+        for i, epoch in enumerate(epochs):
+            if epoch == epoch:
+                slot = int((epoch - origin + step / 2) // step)
+                if 0 <= slot < rows:
+                    slots.append((i, slot * columns + j))
+        for element in elements:
+            matrix = matrices[element]
+            for i, position in slots:
+                value = hours[i].get(element)
+                if value is not None:
+                    matrix[position] = value
+    for element, matrix in matrices.items():
+        result[element] = memoryview(matrix).cast('B').cast('d', [rows, columns]) if rows * columns else memoryview(matrix)
+    return result
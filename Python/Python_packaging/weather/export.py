@@ -0,0 +1,170 @@
+import csv
+import json
+import os
+from contextlib import contextmanager
+
+from .constants import *
+from .columns import get_default_elements
+
+__all__ = ['write_csv', 'write_ndjson', 'write_parquet_dataset']
+
+# Column holding the date of each hourly row, since the hourly `datetime` only holds the time
+DATE = 'date'
+# Partition columns of the Parquet datasets
+LOCATION = 'location'
+YEAR = 'year'
+MONTH = 'month'
+WRITE_BUFFER_SIZE = 1 << 20
+
+@contextmanager
+def _open_output(path_or_file, newline=None):
+    """
+    Open a path for buffered writing, or pass a file object through unchanged.
+    """
+    if isinstance(path_or_file, (str, bytes, os.PathLike)):
+        with open(path_or_file, 'w', encoding='utf-8', newline=newline, buffering=WRITE_BUFFER_SIZE) as file:
+            yield file
+    else:
+        yield path_or_file
+
+def iter_rows(weather_data, level, elements):
+    """
+    Iterate over the day or hour records of the weather data without building a list of them.
+
+    :param weather_data: The weather data dictionary.
+    :param level: 'days' or 'hours'.
+    :param elements: The element names to keep, every element (except the nested hours) if empty.
+    :return: An iterator of (date, record) tuples; the record is the stored dictionary when no elements are given.
+    """
+    if level not in (DAYS, HOURS):
+        raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+    for day in weather_data.get(DAYS, []):
+        records = [day] if level == DAYS else day.get(HOURS, [])
+        for record in records:
+            if elements:
+                yield day.get(DATETIME), {key: record.get(key) for key in elements}
+            elif level == DAYS:
+                yield day.get(DATETIME), {key: value for key, value in record.items() if key != HOURS}
+            else:
+                yield day.get(DATETIME), record
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ','.join(str(item) for item in value)
+    return value
+
+def write_csv(weather_data, path_or_file, level=HOURS, elements=None):
+    """
+    Write the day or hour records of the weather data as CSV, one row per record.
+
+    Rows are streamed from the stored records; hourly rows start with a 'date' column holding
+    the date of their day. Lists (e.g. `stations`) are written comma-separated and missing values empty.
+
+    :param weather_data: The weather data dictionary.
+    :param path_or_file: The path of the file to write, or a text file object.
+    :param level: 'days' or 'hours'.
+    :param elements: The element names of the columns, those of DAYS_Keys or HOURS_Keys if empty.
+    :return: The number of rows written.
+    """
+    elements = list(elements or get_default_elements(level))
+    count = 0
+    with _open_output(path_or_file, newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(([DATE] if level == HOURS else []) + elements)
+        for date, record in iter_rows(weather_data, level, elements):
+            values = [_csv_value(record[key]) for key in elements]
+            writer.writerow([date] + values if level == HOURS else values)
+            count += 1
+    return count
+
+def write_ndjson(weather_data, path_or_file, level=HOURS, elements=None):
+    """
+    Write the day or hour records of the weather data as newline-delimited JSON, one object per record.
+
+    Records are streamed from the stored ones; hourly objects get a 'date' key holding the date of their day.
+
+    :param weather_data: The weather data dictionary.
+    :param path_or_file: The path of the file to write, or a text file object.
+    :param level: 'days' or 'hours'.
+    :param elements: The element names to write, every element of the records (except nested hours) if empty.
+    :return: The number of records written.
+    """
+    encoder = json.JSONEncoder(separators=(',', ':'))
+    count = 0
+    with _open_output(path_or_file) as file:
+        for date, record in iter_rows(weather_data, level, elements):
+            if level == HOURS:
+                file.write('{"date":' + encoder.encode(date) + (',' if record else '') + encoder.encode(record)[1:] + '\n')
+            else:
+                file.write(encoder.encode(record) + '\n')
+            count += 1
+    return count
+
+def _arrow_type(pa, element):
+    """
+    Return the Arrow type of an element's column: integers for epochs, floats for the other numeric
+    elements, dictionary-encoded strings (or lists of them) for categorical elements.
+    """
+    if element in INTEGER_Keys:
+        return pa.int64()
+    if element in NUMERIC_Keys:
+        return pa.float64()
+    if element in LIST_Keys:
+        return pa.list_(pa.dictionary(pa.int32(), pa.string()) if element in CATEGORICAL_Keys else pa.string())
+    if element in CATEGORICAL_Keys:
+        return pa.dictionary(pa.int32(), pa.string())
+    if element in STRING_Keys:
+        return pa.string()
+    return None  # inferred from the values
+
+def write_parquet_dataset(weather_data_list, root_path, level=HOURS, elements=None):
+    """
+    Write the day or hour records of one or more locations into a Parquet dataset, partitioned
+    by location, year and month (`location=.../year=.../month=.../*.parquet`, Hive style).
+
+    Epochs are stored as 64-bit integers, the other numeric elements as doubles, and the
+    categorical elements (`conditions`, `description`, `icon`, `preciptype`, `source`, `stations`)
+    are dictionary-encoded. Requires the optional `pyarrow` package (the `parquet` extra).
+
+    :param weather_data_list: A weather data dictionary or Weather object, or a list of them.
+    :param root_path: The directory of the dataset; the partitions written are replaced, the others kept.
+    :param level: 'days' or 'hours'.
+    :param elements: The element names of the columns, those of DAYS_Keys or HOURS_Keys if empty.
+    :return: The number of rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("write_parquet_dataset requires the pyarrow package: pip install weather[parquet]")
+
+    if not isinstance(weather_data_list, (list, tuple)):
+        weather_data_list = [weather_data_list]
+    elements = list(elements or get_default_elements(level))
+    names = ([DATE] if level == HOURS else []) + elements
+    columns = {name: [] for name in names + [LOCATION, YEAR, MONTH]}
+    for weather_data in weather_data_list:
+        if hasattr(weather_data, 'get_weather_data'):
+            weather_data = weather_data.get_weather_data()
+        location = weather_data.get(RESOLVED_ADDRESS) or weather_data.get(ADDRESS) or ''
+        for date, record in iter_rows(weather_data, level, elements):
+            if level == HOURS:
+                columns[DATE].append(date)
+            for element in elements:
+                columns[element].append(record[element])
+            columns[LOCATION].append(location)
+            columns[YEAR].append(int(date[:4]))
+            columns[MONTH].append(int(date[5:7]))
+
+    arrays = {name: pa.array(columns[name], type=_arrow_type(pa, name) if name != DATE else pa.string())
+              for name in names}
+    arrays[LOCATION] = pa.array(columns[LOCATION], type=pa.string())
+    arrays[YEAR] = pa.array(columns[YEAR], type=pa.int16())
+    arrays[MONTH] = pa.array(columns[MONTH], type=pa.int8())
+    table = pa.table(arrays)
+    partitioning = ds.partitioning(pa.schema([(LOCATION, pa.string()), (YEAR, pa.int16()), (MONTH, pa.int8())]), flavor='hive')
+    ds.write_dataset(table, root_path, format='parquet', partitioning=partitioning,
+                     existing_data_behavior='delete_matching')
+    return table.num_rows
@@ -0,0 +1,103 @@
+from array import array
+
+__all__ = ['FILL_METHODS', 'find_gaps', 'regularize']
+
+NAN = float('nan')
+# Methods filling the missing values of a regular grid
+FILL_METHODS = ('linear', 'nearest', None)
+
+def find_gaps(epochs, step=3600):
+    """
+    Scan the epochs of a series for gaps and duplicates.
+
+    :param epochs: The epoch seconds of the records.
+    :param step: The expected interval between records, in seconds.
+    :return: A dictionary with the 'gaps', a list of (epoch before, epoch after, number of missing
+             records) tuples; the 'duplicates', positions of records with the epoch of the previous
+             one; the 'unordered', positions of records earlier than the previous one; and the
+             'irregular', positions of records not on the step grid of the first record.
+    """
+    report = {'gaps': [], 'duplicates': [], 'unordered': [], 'irregular': []}
+    if not len(epochs):
+        return report
+    origin = previous = epochs[0]
+    for i in range(1, len(epochs)):
+        epoch = epochs[i]
+        interval = epoch - previous
+        if interval == 0:
+            report['duplicates'].append(i)
+        elif interval < 0:
+            report['unordered'].append(i)
+        elif interval > step:
+            report['gaps'].append((previous, epoch, -(-interval // step) - 1))
+        if (epoch - origin) % step:
+            report['irregular'].append(i)
+        previous = max(previous, epoch)
+    return report
+
+def _fill(values, method, max_gap, step):
+    """
+    Fill the NaN values of a regular series in place, from the nearest valid values before and after.
+    """
+    count = len(values)
+    previous = array('q', bytes(8 * count))
+    last = -1
+    for i in range(count):
+        if values[i] == values[i]:
+            last = i
+        previous[i] = last
+    following = -1
+    for i in range(count - 1, -1, -1):
+        value = values[i]
+        if value == value:
+            following = i
+            continue
+        before = previous[i]
+        if before < 0 or following < 0 or (max_gap is not None and (following - before) * step > max_gap):
+            continue
+        if method == 'linear':
+            values[i] = values[before] + (values[following] - values[before]) * (i - before) / (following - before)
+        else:
+            values[i] = values[before] if i - before <= following - i else values[following]
+    return values
+
+def regularize(epochs, columns, step=3600, method='linear', max_gap=None):
+    """
+    Resample series onto a regular grid from their first to their last epoch, filling the missing
+    records and values.
+
+    Records off the grid are ignored and, among duplicates, the last record is kept. Missing
+    values, from gaps or null fields, are then filled by linear interpolation or with the nearest
+    value in time, in two passes over each column.
+
+    :param epochs: The epoch seconds of the records.
+    :param columns: A dictionary of the numeric columns (array('d') or lists of numbers and None) of the records.
+    :param step: The interval of the grid, in seconds.
+    :param method: 'linear', 'nearest', or None to leave the missing values as NaN.
+    :param max_gap: The maximum span, in seconds, between the values a missing value is filled from;
+                    longer gaps are left as NaN. Unlimited if None.
+    :return: A tuple of the grid epochs, an array('q'), and a dictionary of the regular columns, arrays('d').
+    :raises ValueError: If the method is invalid.
+    """
+    if method not in FILL_METHODS:
+        raise ValueError(f"Invalid method value, expected 'linear', 'nearest' or None: {method}")
+    valid = [(epoch, i) for i, epoch in enumerate(epochs) if epoch == epoch]
+    if not valid:
+        return array('q'), {element: array('d') for element in columns}
+    origin = valid[0][0]
+    end = max(epoch for epoch, _ in valid)
+    size = int((end - origin) // step) + 1
+    grid = array('q', range(int(origin), int(origin) + size * step, step))
+    slots = {}
+    for epoch, i in valid:
+        offset = epoch - origin
+        if offset >= 0 and offset % step == 0:
+            slots[int(offset // step)] = i
+    regular = {}
+    for element, column in columns.items():
+        values = array('d', [NAN]) * size
+        for slot, i in slots.items():
+            value = column[i]
+            values[slot] = NAN if value is None else value
+        regular[element] = values if method is None else _fill(values, method, max_gap, step)
+    return grid, regular
@@ -0,0 +1,174 @@
+import math
+from array import array
+
+from .constants import *
+
+__all__ = ['degree_days', 'accumulated_precip', 'wind_chill', 'heat_index', 'solar_energy_total']
+
+NAN = float('nan')
+DEGREE_DAY_KINDS = ('heating', 'cooling', 'growing')
+# Conversions of each unit group's temperature to and from Fahrenheit, and of its wind speed to mph
+_TO_FAHRENHEIT = {
+    'us': lambda t: t,
+    'metric': lambda t: t * 1.8 + 32,
+    'uk': lambda t: t * 1.8 + 32,
+    'base': lambda t: (t - 273.15) * 1.8 + 32,
+}
+_FROM_FAHRENHEIT = {
+    'us': lambda t: t,
+    'metric': lambda t: (t - 32) / 1.8,
+    'uk': lambda t: (t - 32) / 1.8,
+    'base': lambda t: (t - 32) / 1.8 + 273.15,
+}
+_TO_MPH = {'us': 1.0, 'metric': 1 / 1.609344, 'uk': 1.0, 'base': 3600 / 1609.344}
+
+def _for_each(weathers, compute):
+    """
+    Apply a computation to a Weather object, or to each of a list of them.
+    """
+    if isinstance(weathers, (list, tuple)):
+        return [compute(weather) for weather in weathers]
+    return compute(weathers)
+
+def _columns(weather, level, elements):
+    columns = weather.get_weather_columns(level, elements)
+    return [columns[element] for element in elements]
+
+def _check_unit_group(unit_group):
+    if unit_group not in _TO_FAHRENHEIT:
+        raise ValueError(f"Invalid unit_group value, expected 'us', 'metric', 'uk' or 'base': {unit_group}")
+
+def degree_days(weathers, kind='heating', base=65.0, cap=86.0):
+    """
+    Compute the degree days of each day from its maximum and minimum temperatures.
+
+    Heating (cooling) degree days are the difference between the base and the mean temperature of
+    the day when it is lower (higher). Growing degree days use the maximum temperature capped at
+    `cap` and the minimum temperature raised to `base`. The defaults are in Fahrenheit, the
+    temperatures of the 'us' unit group; pass bases in the unit group of the data otherwise
+    (e.g. base=18 for 'metric' heating degree days, base=10 and cap=30 for growing degree days).
+
+    :param weathers: A Weather object, or a list of them.
+    :param kind: 'heating', 'cooling' or 'growing'.
+    :param base: The base temperature.
+    :param cap: The temperature above which growth does not increase, for growing degree days.
+    :return: An array('d') of the degree days of each day (NaN when a temperature is missing), or a list of them.
+    :raises ValueError: If the kind is invalid.
+    """
+    if kind not in DEGREE_DAY_KINDS:
+        raise ValueError(f"Invalid kind value, expected 'heating', 'cooling' or 'growing': {kind}")
+
+    def compute(weather):
+        tempmax, tempmin = _columns(weather, DAYS, [TEMPMAX, TEMPMIN])
+        if kind == 'heating':
+            return array('d', [max(base - (high + low) / 2, 0.0) if high == high and low == low else NAN
+                               for high, low in zip(tempmax, tempmin)])
+        if kind == 'cooling':
+            return array('d', [max((high + low) / 2 - base, 0.0) if high == high and low == low else NAN
+                               for high, low in zip(tempmax, tempmin)])
+        return array('d', [max((min(high, cap) + max(low, base)) / 2 - base, 0.0) if high == high and low == low else NAN
+                           for high, low in zip(tempmax, tempmin)])
+    return _for_each(weathers, compute)
+
+def accumulated_precip(weathers, level=DAYS):
+    """
+    Compute the precipitation accumulated since the first day (or hour), missing values counting as none.
+
+    :param weathers: A Weather object, or a list of them.
+    :param level: 'days' for the daily data, or 'hours' for the hourly data.
+    :return: An array('d') of the accumulated precipitation at each record, or a list of them.
+    """
+    def compute(weather):
+        total = 0.0
+        result = array('d')
+        for value in _columns(weather, level, [PRECIP])[0]:
+            if value == value:
+                total += value
+            result.append(total)
+        return result
+    return _for_each(weathers, compute)
+
+def _wind_chill(temp, speed):
+    """
+    The wind chill of the National Weather Service, in Fahrenheit from Fahrenheit and mph, defined
+    for temperatures up to 50F and wind speeds from 3 mph; the temperature otherwise.
+    """
+    if temp > 50 or speed < 3:
+        return temp
+    factor = speed ** 0.16
+    return 35.74 + 0.6215 * temp - 35.75 * factor + 0.4275 * temp * factor
+
+def wind_chill(weathers, unit_group='us', level=HOURS):
+    """
+    Compute the wind chill of each hour (or day) from its temperature and wind speed, using the
+    formula of the US National Weather Service. Outside of its domain (temperatures above 50F or
+    wind speeds below 3 mph), the wind chill is the temperature.
+
+    :param weathers: A Weather object, or a list of them.
+    :param unit_group: The unit group of the data ('us', 'metric', 'uk' or 'base').
+    :param level: 'hours' for the hourly data, or 'days' for the daily data.
+    :return: An array('d') of the wind chill of each record, in the unit group of the data, or a list of them.
+    :raises ValueError: If the unit group is invalid.
+    """
+    _check_unit_group(unit_group)
+    to_fahrenheit, from_fahrenheit, to_mph = _TO_FAHRENHEIT[unit_group], _FROM_FAHRENHEIT[unit_group], _TO_MPH[unit_group]
+
+    def compute(weather):
+        temp, windspeed = _columns(weather, level, [TEMP, WINDSPEED])
+        return array('d', [from_fahrenheit(_wind_chill(to_fahrenheit(t), w * to_mph)) if t == t and w == w else NAN
+                           for t, w in zip(temp, windspeed)])
+    return _for_each(weathers, compute)
+
+def _heat_index(temp, humidity):
+    """
+    The heat index of the National Weather Service, in Fahrenheit from Fahrenheit and relative humidity.
+    """
+    simple = 0.5 * (temp + 61.0 + (temp - 68.0) * 1.2 + humidity * 0.094)
+    if (simple + temp) / 2 < 80:
+        return simple
+    index = (-42.379 + 2.04901523 * temp + 10.14333127 * humidity - 0.22475541 * temp * humidity
+             - 0.00683783 * temp * temp - 0.05481717 * humidity * humidity + 0.00122874 * temp * temp * humidity
+             + 0.00085282 * temp * humidity * humidity - 0.00000199 * temp * temp * humidity * humidity)
+    if humidity < 13 and 80 <= temp <= 112:
+        index -= (13 - humidity) / 4 * math.sqrt((17 - abs(temp - 95)) / 17)
+    elif humidity > 85 and 80 <= temp <= 87:
+        index += (humidity - 85) / 10 * (87 - temp) / 5
+    return index
+
+def heat_index(weathers, unit_group='us', level=HOURS):
+    """
+    Compute the heat index of each hour (or day) from its temperature and relative humidity, using
+    the Rothfusz regression of the US National Weather Service (and its simpler formula below 80F).
+
+    :param weathers: A Weather object, or a list of them.
+    :param unit_group: The unit group of the data ('us', 'metric', 'uk' or 'base').
+    :param level: 'hours' for the hourly data, or 'days' for the daily data.
+    :return: An array('d') of the heat index of each record, in the unit group of the data, or a list of them.
+    :raises ValueError: If the unit group is invalid.
+    """
+    _check_unit_group(unit_group)
+    to_fahrenheit, from_fahrenheit = _TO_FAHRENHEIT[unit_group], _FROM_FAHRENHEIT[unit_group]
+
+    def compute(weather):
+        temp, humidity = _columns(weather, level, [TEMP, HUMIDITY])
+        return array('d', [from_fahrenheit(_heat_index(to_fahrenheit(t), h)) if t == t and h == h else NAN
+                           for t, h in zip(temp, humidity)])
+    return _for_each(weathers, compute)
+
+def solar_energy_total(weathers):
+    """
+    Compute the total solar energy received over all the days, from the daily `solarenergy`
+    (MJ/m2), or from the hourly `solarradiation` (W/m2) of the days without it.
+
+    :param weathers: A Weather object, or a list of them.
+    :return: The total solar energy in MJ/m2, or a list of them.
+    """
+    def compute(weather):
+        total = 0.0
+        for day in weather.get_weather_daily_data():
+            energy = day.get(SOLARENERGY)
+            if energy is None:
+                energy = sum(hour.get(SOLARRADIATION) or 0.0 for hour in day.get(HOURS, [])) * 3600 / 1e6
+            total += energy
+        return total
+    return _for_each(weathers, compute)
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+__all__ = ['TimedHTTPAdapter', 'new_session', 'OpenTelemetryHook']
+
+_connect_timer = threading.local()
+
+def reset_connect_time():
+    """
+    Reset the connection setup time recorded for the current thread.
+    """
+    _connect_timer.seconds = 0.0
+
+def get_connect_time():
+    """
+    Return the seconds spent opening connections (DNS resolution, TCP and TLS handshakes) by the
+    current thread since the last reset; 0.0 when a pooled connection was reused.
+    """
+    return getattr(_connect_timer, 'seconds', 0.0)
+
+class _TimedConnectionMixin:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.seconds = get_connect_time() + time.perf_counter() - start
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    A requests transport adapter whose connections record their setup time, read back with `get_connect_time`.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+def new_session():
+    """
+    Create the requests session used by default to fetch weather data, with connection pooling
+    and connection setup timing.
+
+    :return: A requests.Session object.
+    """
+    session = requests.Session()
+    adapter = TimedHTTPAdapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class OpenTelemetryHook:
+    """
+    A fetch hook recording each fetch as an OpenTelemetry span.
+
+    The span covers the whole fetch and carries the status, query cost, byte counts and phase
+    timings as attributes. Requires the optional `opentelemetry-api` package (the `opentelemetry` extra).
+
+    Example:
+        weather.add_fetch_hook(OpenTelemetryHook())
+    """
+    def __init__(self, tracer=None, span_name='weather.fetch'):
+        """
+        Parameters:
+            tracer (opentelemetry.trace.Tracer): The tracer creating the spans, the global tracer of this module by default.
+            span_name (str): The name of the spans.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("OpenTelemetryHook requires the opentelemetry-api package: pip install weather[opentelemetry]")
+        self.trace = trace
+        self.tracer = tracer or trace.get_tracer(__name__)
+        self.span_name = span_name
+
+    def __call__(self, event):
+        started_at = int(event['started_at'] * 1e9)
+        span = self.tracer.start_span(self.span_name, start_time=started_at)
+        span.set_attribute('weather.location', event['location'])
+        for name in ('status', 'query_cost', 'compressed_bytes', 'decompressed_bytes', 'cache_hit'):
+            if event[name] is not None:
+                span.set_attribute(f"weather.{name}", event[name])
+        for phase, seconds in event['timings'].items():
+            span.set_attribute(f"weather.timing.{phase}", seconds)
+        if event['error'] is not None:
+            span.record_exception(event['error'])
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, str(event['error'])))
+        span.end(end_time=started_at + int(event['timings'].get('total', 0.0) * 1e9))
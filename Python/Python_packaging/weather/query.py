@@ -0,0 +1,262 @@
+import operator
+import re
+from array import array
+
+__all__ = ['parse_predicate', 'predicate_fields', 'evaluate_predicate', 'mask_positions']
+
+# Tokens of the predicates: strings, numbers, comparison operators, parentheses and words
+_TOKEN = re.compile(r"""\s*(?:(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"""
+                    r"""|(?P<operator><=|>=|==|!=|<|>|=)|(?P<paren>[()])|(?P<word>[A-Za-z_]\w*))""")
+_COMPARISONS = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    '==': operator.eq, '=': operator.eq, '!=': operator.ne,
+}
+# Comparison of a constant to the values, for `constant op value` evaluated as `value flipped-op constant`
+_FLIPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '=': '==', '!=': '!='}
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'none': None}
+_KEYWORDS = {'and', 'or', 'not', 'contains'}
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise ValueError(f"Invalid predicate at position {position}: {text[position:]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        elif kind == 'number':
+            value = float(value)
+        elif kind == 'word' and value.lower() in _KEYWORDS:
+            kind, value = 'keyword', value.lower()
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+class _Parser:
+    """
+    A recursive descent parser of predicates:
+
+        predicate  := conjunction ('or' conjunction)*
+        conjunction := negation ('and' negation)*
+        negation   := 'not' negation | '(' predicate ')' | comparison
+        comparison := operand (('<'|'<='|'>'|'>='|'=='|'!=') operand | 'contains' operand)
+        operand    := field | number | string | true | false | null
+    """
+    def __init__(self, text):
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        token = self.peek()
+        if token[0] is None or (kind is not None and token[0] != kind) or (value is not None and token[1] != value):
+            expected = value or kind or 'a token'
+            raise ValueError(f"Invalid predicate, expected {expected} at token {self.position + 1}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        node = self.predicate()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Invalid predicate, unexpected {self.peek()[1]!r} at token {self.position + 1}")
+        return node
+
+    def predicate(self):
+        node = self.conjunction()
+        while self.peek() == ('keyword', 'or'):
+            self.take()
+            node = ('or', node, self.conjunction())
+        return node
+
+    def conjunction(self):
+        node = self.negation()
+        while self.peek() == ('keyword', 'and'):
+            self.take()
+            node = ('and', node, self.negation())
+        return node
+
+    def negation(self):
+        if self.peek() == ('keyword', 'not'):
+            self.take()
+            return ('not', self.negation())
+        if self.peek() == ('paren', '('):
+            self.take()
+            node = self.predicate()
+            self.take('paren', ')')
+            return node
+        return self.comparison()
+
+    def operand(self):
+        kind, value = self.take()
+        if kind in ('number', 'string'):
+            return ('const', value)
+        if kind == 'word':
+            if value.lower() in _CONSTANTS:
+                return ('const', _CONSTANTS[value.lower()])
+            return ('field', value)
+        raise ValueError(f"Invalid predicate, expected a field or a value at token {self.position}")
+
+    def comparison(self):
+        left = self.operand()
+        kind, value = self.peek()
+        if (kind, value) == ('keyword', 'contains'):
+            self.take()
+            return ('contains', left, self.operand())
+        if kind != 'operator':
+            raise ValueError(f"Invalid predicate, expected a comparison at token {self.position + 1}")
+        self.take()
+        return ('compare', value, left, self.operand())
+
+def parse_predicate(text):
+    """
+    Parse a predicate such as `temp > 30 and humidity > 70` or `preciptype contains 'snow'`.
+
+    Predicates compare fields (element names) to numbers, quoted strings, true, false, null or other
+    fields with <, <=, >, >=, == (or =) and !=, test list or string fields with `contains`, and
+    combine these with `and`, `or`, `not` and parentheses.
+
+    :param text: The predicate.
+    :return: The syntax tree, made of tuples.
+    :raises ValueError: If the predicate is invalid.
+    """
+    return _Parser(text).parse()
+
+def predicate_fields(node):
+    """
+    :param node: A syntax tree returned by `parse_predicate`.
+    :return: The set of the fields used by the predicate.
+    """
+    if node[0] == 'field':
+        return {node[1]}
+    if node[0] == 'const':
+        return set()
+    return set().union(*[predicate_fields(child) for child in node[1:] if isinstance(child, tuple)])
+
+def _to_mask(flags):
+    # one byte per row, 1 when the row matches, read as an integer so that masks combine with bitwise operators
+    return int.from_bytes(bytearray(flags), 'little')
+
+def _matches(function, value, other):
+    """
+    Compare two values, missing values (None or NaN) being equal to each other and to nothing else,
+    and values of incomparable types not matching.
+    """
+    if value != value:
+        value = None
+    if other != other:
+        other = None
+    if value is None or other is None:
+        return function(value, other) if function in (operator.eq, operator.ne) else False
+    try:
+        return bool(function(value, other))
+    except TypeError:
+        return False
+
+def _compare(op, values, constant):
+    """
+    Compare each value to a constant, as fast as possible for float arrays.
+    """
+    if isinstance(values, array) and isinstance(constant, (int, float)) and not isinstance(constant, bool):
+        # `value op constant` is `constant flipped-op value`, a bound method mapped in C over the array
+        method = getattr(float(constant), {'<': '__gt__', '<=': '__ge__', '>': '__lt__', '>=': '__le__',
+                                           '==': '__eq__', '=': '__eq__', '!=': '__ne__'}[op])
+        return map(method, values)
+    function = _COMPARISONS[op]
+    return (_matches(function, value, constant) for value in values)
+
+def _contains(value, item):
+    try:
+        return value is not None and value == value and item in value
+    except TypeError:
+        return False
+
+def evaluate_predicate(node, get_column, count):
+    """
+    Evaluate a predicate over columns as a mask of the matching rows.
+
+    Comparisons are evaluated over whole columns. The right side of `and` is only evaluated for the
+    rows matching its left side: over the columns when many rows match, or else just at the
+    positions of these rows, and not at all when none does; `or` likewise skips its right side when
+    every row matches its left side. Missing values (None or NaN) are only equal to null, and never
+    lower or greater than anything.
+
+    :param node: A syntax tree returned by `parse_predicate`.
+    :param get_column: A callable returning the column (array('d') or list) of a field.
+    :param count: The number of rows.
+    :return: The mask, an integer holding a byte set to 1 for each matching row (see `mask_positions`).
+    """
+    all_rows = int.from_bytes(b'\x01' * count, 'little')
+
+    def values_of(operand, positions):
+        if operand[0] == 'const':
+            return [operand[1]] * (count if positions is None else len(positions))
+        column = get_column(operand[1])
+        if positions is None:
+            return column
+        if isinstance(column, array):
+            return array('d', map(column.__getitem__, positions))
+        return list(map(column.__getitem__, positions))
+
+    def to_mask(flags, positions):
+        if positions is None:
+            return _to_mask(flags)
+        buffer = bytearray(count)
+        for position, flag in zip(positions, flags):
+            if flag:
+                buffer[position] = 1
+        return int.from_bytes(buffer, 'little')
+
+    def evaluate(node, scope, positions):
+        # scope: the mask of the rows to evaluate; positions: their positions, None for all rows
+        kind = node[0]
+        if kind == 'and':
+            left = evaluate(node[1], scope, positions)
+            if not left:
+                return 0
+            if left == scope:
+                return evaluate(node[2], scope, positions)
+            matching = mask_positions(left, count)
+            if len(matching) * 4 > count:
+                return left & evaluate(node[2], scope, positions)
+            return evaluate(node[2], left, matching)
+        if kind == 'or':
+            left = evaluate(node[1], scope, positions)
+            return left | evaluate(node[2], scope, positions) if left != scope else left
+        if kind == 'not':
+            return evaluate(node[1], scope, positions) ^ scope
+        if kind == 'contains':
+            _, subject, item = node
+            return to_mask(map(_contains, values_of(subject, positions), values_of(item, positions)), positions)
+        if kind == 'compare':
+            _, op, left, right = node
+            if left[0] == 'const' and right[0] == 'field':
+                op, left, right = _FLIPPED[op], right, left
+            if left[0] == 'const':
+                return scope if _matches(_COMPARISONS[op], left[1], right[1]) else 0
+            if right[0] == 'const':
+                return to_mask(_compare(op, values_of(left, positions), right[1]), positions) & scope
+            function = _COMPARISONS[op]
+            return to_mask(map(lambda value, other: _matches(function, value, other),
+                               values_of(left, positions), values_of(right, positions)), positions) & scope
+        raise ValueError(f"Invalid predicate node: {node!r}")
+    return evaluate(node, all_rows, None)
+
+def mask_positions(mask, count):
+    """
+    :param mask: A mask returned by `evaluate_predicate`.
+    :param count: The number of rows.
+    :return: The list of the positions of the matching rows.
+    """
+    flags = mask.to_bytes(count, 'little')
+    positions = []
+    position = flags.find(1)
+    while position != -1:
+        positions.append(position)
+        position = flags.find(1, position + 1)
+    return positions
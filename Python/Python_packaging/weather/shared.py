@@ -0,0 +1,152 @@
+import io
+import mmap
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import _posixshmem
+except ImportError:  # Windows
+    _posixshmem = None
+
+from .constants import *
+from .snapshot import dump_snapshot, parse_snapshot, snapshot_columns
+
+__all__ = ['share_weather_data', 'SharedWeatherData']
+
+def share_weather_data(weather_data, name=None):
+    """
+    Copy weather data into a new shared memory block, in the snapshot format (see
+    `snapshot.dump_snapshot`), for other processes to attach to with `SharedWeatherData`.
+
+    The block belongs to the caller, who closes it once done with it and unlinks it once no
+    process needs to attach to it anymore (`block.close()` and `block.unlink()`).
+
+    :param weather_data: The weather data dictionary.
+    :param name: The name of the block, a random one if None.
+    :return: The multiprocessing.shared_memory.SharedMemory block; pass its `name` to the other processes.
+    """
+    file = io.BytesIO()
+    size = dump_snapshot(weather_data, file)
+    block = shared_memory.SharedMemory(name=name, create=True, size=size)
+    block.buf[:size] = file.getbuffer()
+    return block
+
+def _map(name):
+    """
+    Map a POSIX shared memory block read-only, without registering it with the resource tracker of
+    this process: attaching with SharedMemory registers the block (before Python 3.13), which the
+    tracker of an independent process then unlinks when that process exits, while the owner still
+    uses it.
+    """
+    descriptor = _posixshmem.shm_open('/' + name, os.O_RDONLY)
+    try:
+        return mmap.mmap(descriptor, os.fstat(descriptor).st_size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(descriptor)
+
+def _attach(name):
+    """
+    Attach to a shared memory block without tracking it (see `_map`). Returns the mapping, to be
+    closed, and a read-only memoryview of it, to be released first.
+    """
+    if _posixshmem is None:
+        # named blocks are not tracked on Windows
+        block = shared_memory.SharedMemory(name=name)
+        return block, block.buf.toreadonly()
+    mapping = _map(name)
+    return mapping, memoryview(mapping)
+
+def _untrack(block):
+    """
+    Hand a block created by this process over to another one: the resource tracker of this process
+    no longer unlinks it when the process exits.
+    """
+    if _posixshmem is not None:
+        resource_tracker.unregister('/' + block.name, 'shared_memory')
+
+def _take(name, size):
+    """
+    Take over a shared memory block handed over by another process (see `_untrack`): unlink it at
+    once, its memory then being freed once the returned read-only memoryview of its first size
+    bytes, and the views made from it, are released.
+    """
+    if _posixshmem is None:
+        # on Windows the block is freed when its last handle is closed, so it is copied
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            return memoryview(bytes(block.buf[:size]))
+        finally:
+            block.close()
+    mapping = _map(name)
+    _posixshmem.shm_unlink('/' + name)
+    return memoryview(mapping)[:size]
+
+class SharedWeatherData:
+    """
+    A read-only attachment to weather data shared by another process with `share_weather_data`.
+
+    Nothing is copied on attach: the numeric columns are views of the shared memory, and the hours
+    of each day are decoded from them on first access. The columns and the weather data must not
+    be used once the attachment is closed, and closing it raises BufferError while they are still
+    referenced.
+
+    Example:
+        with SharedWeatherData(name) as shared:
+            temps = shared.columns('hours')['temp']
+    """
+    def __init__(self, name):
+        """
+        Parameters:
+            name (str): The name of the shared memory block.
+
+        Raises:
+            FileNotFoundError: If there is no block with this name.
+            ValueError: If the block does not hold a snapshot.
+        """
+        self.__block, self.__buffer = _attach(name)
+        try:
+            self.__weather_data = parse_snapshot(self.__buffer)
+        except ValueError:
+            self.__buffer.release()
+            self.__block.close()
+            raise
+
+    def get_weather_data(self):
+        """
+        Get the shared weather data.
+
+        Returns:
+            dict: The weather data dictionary, whose hours are decoded from the shared columns on first access.
+        """
+        return self.__weather_data
+
+    def columns(self, level=HOURS):
+        """
+        Get the numeric columns of the shared weather data, without copying them.
+
+        Parameters:
+            level (str): 'days' for the daily columns, or 'hours' for the hourly columns of all days.
+
+        Returns:
+            dict: A dictionary mapping each numeric element to a read-only memoryview of its values as
+                  floats (NaN for missing values), like the columns of `Weather.get_weather_columns`.
+
+        Raises:
+            ValueError: If the level is invalid.
+        """
+        return snapshot_columns(self.__buffer, level)
+
+    def close(self):
+        """
+        Detach from the shared memory block, leaving it to the process that shared it, which stays in
+        charge of unlinking it even if this process exits first.
+        """
+        self.__weather_data = None
+        self.__buffer.release()
+        self.__block.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
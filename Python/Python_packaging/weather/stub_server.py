@@ -0,0 +1,269 @@
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .constants import *
+from .synthetic import generate_timeline
+
+__all__ = ['StubTimelineServer']
+
+# Conversions of the (US unit) synthetic values for the other unit groups, as (keys, factor, offset)
+METRIC_CONVERSIONS = [
+    ([TEMP, TEMPMAX, TEMPMIN, FEELSLIKE, FEELSLIKEMAX, FEELSLIKEMIN, DEW], 5 / 9, -32 * 5 / 9),
+    ([PRECIP], 25.4, 0),
+    ([SNOW, SNOWDEPTH], 2.54, 0),
+    ([WINDSPEED, WINDGUST, VISIBLILITY], 1.609344, 0),
+]
+UK_CONVERSIONS = METRIC_CONVERSIONS[:3] + [([VISIBLILITY], 1.609344, 0)]
+
+def convert_units(record, unit_group):
+    """
+    Convert the values of a synthetic record, generated in US units, to the requested unit group.
+    """
+    conversions = {'metric': METRIC_CONVERSIONS, 'uk': UK_CONVERSIONS, 'base': METRIC_CONVERSIONS}.get(unit_group, [])
+    for keys, factor, offset in conversions:
+        for key in keys:
+            if isinstance(record.get(key), (int, float)):
+                value = record[key] * factor + offset
+                record[key] = round(value + 273.15, 1) if unit_group == 'base' and offset else round(value, 2)
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+class _TimelineHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # headers and body are written separately on kept-alive connections
+
+    def do_GET(self):
+        stub = self.server.stub
+        status, body, headers = stub.handle(self.path, self.headers.get('Accept-Encoding', ''))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.stub.verbose:
+            super().log_message(format, *args)
+
+class StubTimelineServer:
+    """
+    A local HTTP server mimicking the Visual Crossing Timeline endpoint, for offline and load tests.
+
+    It answers `{path}/{location}/{from}/{to}` requests with deterministic synthetic data (see
+    `weather.synthetic.generate_timeline`), honouring the `unitGroup`, `include`, `elements` and
+    `key` query parameters, and can inject latency, server errors and throttling.
+
+    Attributes:
+        base_url (str): The base URL to give to `Weather`, available once started.
+        stats (dict): Counters of the 'requests', 'errors' (injected 500s), 'throttled' (429s) and 'rejected' (400/401) responses.
+        last_request (dict): The location, dates and query parameters of the last request.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, path='/VisualCrossingWebServices/rest/services/timeline',
+                 latency=0.0, latency_jitter=0.0, error_rate=0.0, rate_limit=None, api_key=None,
+                 forecast_days=15, hours_per_day=24, today=None, seed=0, cache_size=128, verbose=False):
+        """
+        Configure the stub server.
+
+        Parameters:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for any free port.
+            path (str): Path prefix of the Timeline endpoint.
+            latency (float): Seconds added before answering each request.
+            latency_jitter (float): Maximum random seconds added on top of the latency.
+            error_rate (float): Probability (0 to 1) of answering with an HTTP 500 error.
+            rate_limit (float): Maximum requests per second before answering HTTP 429, unlimited if None.
+            api_key (str): Key required in the `key` parameter, any key is accepted if None.
+            forecast_days (int): Days returned when only the location is given.
+            hours_per_day (int): Hourly records generated per day.
+            today (str): Date (in `yyyy-MM-dd` format) days are forecasts from, the current date if None.
+            seed (int): Seed of the synthetic data and of the injected errors and latencies.
+            cache_size (int): Number of encoded responses kept so repeated requests skip the generation.
+            verbose (bool): Whether to log each request to stderr.
+        """
+        self.host = host
+        self.port = port
+        self.path = path.rstrip('/')
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.api_key = api_key
+        self.forecast_days = forecast_days
+        self.hours_per_day = hours_per_day
+        self.today = today
+        self.seed = seed
+        self.cache_size = cache_size
+        self.verbose = verbose
+        self.base_url = None
+        self.stats = {'requests': 0, 'errors': 0, 'throttled': 0, 'rejected': 0}
+        self.last_request = {}
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__tokens = rate_limit
+        self.__refilled_at = time.monotonic()
+        self.__server = None
+        self.__responses = {}
+
+    def start(self):
+        """
+        Start serving in a background thread.
+
+        Returns:
+            str: The base URL of the endpoint.
+        """
+        self.__server = _ThreadingHTTPServer((self.host, self.port), _TimelineHandler)
+        self.__server.stub = self
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        self.base_url = f"http://{self.host}:{self.__server.server_port}{self.path}"
+        return self.base_url
+
+    def stop(self):
+        """
+        Stop serving and release the port.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __take_token(self):
+        """
+        Consume a token of the rate limiter, returning False when the request must be throttled.
+        """
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self.__tokens = min(self.rate_limit, self.__tokens + (now - self.__refilled_at) * self.rate_limit)
+        self.__refilled_at = now
+        if self.__tokens < 1:
+            return False
+        self.__tokens -= 1
+        return True
+
+    def handle(self, request_path, accept_encoding=''):
+        """
+        Build the response to a request.
+
+        Parameters:
+            request_path (str): The path and query string of the request.
+            accept_encoding (str): The `Accept-Encoding` header of the request.
+
+        Returns:
+            tuple: The HTTP status, the body bytes and a dictionary of headers.
+        """
+        url = urlsplit(request_path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        with self.__lock:
+            self.stats['requests'] += 1
+            throttled = not self.__take_token()
+            failed = not throttled and self.__random.random() < self.error_rate
+            delay = self.latency + self.__random.random() * self.latency_jitter
+        if delay:
+            time.sleep(delay)
+
+        if throttled:
+            return self.__error(429, 'Too many requests', 'throttled', {'Retry-After': '1'})
+        if failed:
+            return self.__error(500, 'Internal server error', 'errors')
+        if not url.path.startswith(self.path + '/'):
+            return self.__error(400, f"Unknown endpoint: {url.path}", 'rejected')
+        if self.api_key is not None and query.get('key') != self.api_key:
+            return self.__error(401, 'No account found with API key', 'rejected')
+
+        segments = [unquote(segment) for segment in url.path[len(self.path) + 1:].split('/')] + ['', '']
+        location, from_date, to_date = segments[:3]
+        try:
+            today = self.today or date.today().strftime('%Y-%m-%d')
+            if not from_date:
+                from_date = today
+                days = self.forecast_days
+            else:
+                start = datetime.strptime(from_date, '%Y-%m-%d')
+                end = datetime.strptime(to_date, '%Y-%m-%d') if to_date else start
+                days = (end - start).days + 1
+            if not location or days < 1:
+                raise ValueError(request_path)
+        except ValueError:
+            return self.__error(400, f"Invalid location or dates: {request_path}", 'rejected')
+
+        self.last_request = {'location': location, 'from_date': from_date, 'to_date': to_date, 'params': query}
+        compress = 'gzip' in accept_encoding
+        cache_key = (url.path, url.query, today, compress)
+        cached = self.__responses.get(cache_key)
+        if cached is not None:
+            return cached
+        include = query.get('include', DAYS).split(',')
+        payload = generate_timeline(location, from_date, days=days, hours_per_day=self.hours_per_day,
+                                    include_hours=HOURS in include, forecast_from=today, seed=self.seed)
+        payload[QUERY_COST] = days
+        unit_group = query.get('unitGroup', 'us')
+        elements = [element for element in query.get('elements', '').split(',') if element]
+        for day in payload[DAYS]:
+            for hour in day.get(HOURS, []):
+                convert_units(hour, unit_group)
+            convert_units(day, unit_group)
+            if elements:
+                if HOURS in day:
+                    day[HOURS] = [{key: hour[key] for key in elements if key in hour} for hour in day[HOURS]]
+                for key in [key for key in day if key not in elements and key != HOURS]:
+                    del day[key]
+        if DAYS not in include and HOURS not in include:
+            del payload[DAYS]
+
+        body = json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        if compress:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        with self.__lock:
+            if len(self.__responses) >= self.cache_size > 0:
+                del self.__responses[next(iter(self.__responses))]
+            if self.cache_size > 0:
+                self.__responses[cache_key] = (200, body, headers)
+        return 200, body, headers
+
+    def __error(self, status, message, counter, headers=None):
+        with self.__lock:
+            self.stats[counter] += 1
+        return status, message.encode('utf-8'), dict({'Content-Type': 'text/plain'}, **(headers or {}))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve a synthetic Visual Crossing Timeline endpoint.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to each response')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='maximum random seconds added on top')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='probability of an HTTP 500 answer')
+    parser.add_argument('--rate-limit', type=float, help='requests per second before HTTP 429 answers')
+    parser.add_argument('--api-key', help='required API key')
+    parser.add_argument('--today', help='first forecast date (yyyy-MM-dd)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubTimelineServer(args.host, args.port, latency=args.latency, latency_jitter=args.latency_jitter,
+                                error_rate=args.error_rate, rate_limit=args.rate_limit, api_key=args.api_key,
+                                today=args.today, seed=args.seed, verbose=True)
+    print(f"Serving the Timeline stub at {server.start()}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,296 @@
+import heapq
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from .instrumentation import new_session
+from .weather import Weather
+
+__all__ = ['ForecastWatchlist']
+
+# Extension of the snapshot files of the watched locations
+SNAPSHOT_EXTENSION = '.snap'
+
+class ForecastWatchlist:
+    """
+    Keeps the weather data of a set of locations fresh in memory, refreshing each of them in the
+    background on an interval, so that reads never wait for a request.
+
+    Each refresh fetches into a new Weather object that replaces the previous one once complete:
+    reads return the latest complete data without taking any lock, and a Weather object returned
+    by `get` is never modified by the refreshes. The refreshes share a pooled session and at most
+    `max_concurrency` of them run at once; their times are spread by a random jitter so that the
+    locations do not all refresh together. With a cache directory, each refresh is also saved as a
+    snapshot, loaded back on start so that reads are served before the first refresh.
+
+    Example:
+        watchlist = ForecastWatchlist(interval=1800, api_key='Your API Key', cache_dir='forecasts')
+        watchlist.add('Denver', include='days,hours')
+        watchlist.start()
+        weather = watchlist.get('Denver')  # None until the first refresh
+    """
+
+    def __init__(self, interval=3600, jitter=0.1, max_concurrency=4, retry_interval=60, cache_dir=None, **options):
+        """
+        Parameters:
+            interval (float): Seconds between the refreshes of each location.
+            jitter (float): Maximum random change of each interval, as a fraction of it.
+            max_concurrency (int): Maximum number of refreshes running at once.
+            retry_interval (float): Seconds before retrying a failed refresh, at most the interval.
+            cache_dir (str): Optional directory where the data of each location is saved as a snapshot.
+            options: Arguments of the Weather objects (base_url, api_key, projection, budget, hooks, ...).
+                     They share a pooled session unless one is given.
+
+        Raises:
+            ValueError: If the interval, jitter or maximum concurrency is invalid.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid interval, expected a positive number of seconds: {interval}")
+        if not 0 <= jitter < 1:
+            raise ValueError(f"Invalid jitter, expected a fraction between 0 and 1: {jitter}")
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency, expected at least 1: {max_concurrency}")
+        self.interval = interval
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.retry_interval = min(retry_interval, interval)
+        self.cache_dir = cache_dir
+        options.setdefault('session', new_session())
+        self.options = options
+        self.__condition = threading.Condition()
+        self.__arguments = {}
+        self.__latest = {}
+        self.__status = {}
+        self.__due = {}
+        self.__schedule = []
+        self.__running = set()
+        self.__scheduler = None
+        self.__executor = None
+        self.__stopping = False
+
+    def add(self, location, from_date='', to_date='', unit_group='us', include=None, elements=''):
+        """
+        Watch a location, refreshed as soon as possible, or replace the fetch arguments of a watched one.
+
+        Parameters:
+            location (str): The location, also the key of its data.
+            from_date (str): Start date of the fetches, the next 15 days if empty.
+            to_date (str): End date of the fetches.
+            unit_group (str): Unit system of the fetches ('us', 'metric', 'uk' or 'base').
+            include (str): Data types to include (e.g., 'days,hours').
+            elements (str): Specific weather elements to retrieve.
+        """
+        with self.__condition:
+            self.__arguments[location] = {'from_date': from_date, 'to_date': to_date, 'unit_group': unit_group,
+                                          'include': include, 'elements': elements}
+            self.__status.setdefault(location, {'updated_at': None, 'error': None, 'failures': 0})
+            due = time.monotonic()
+            if self.cache_dir and location not in self.__latest:
+                due = self.__load_cached(location)
+            self.__set_due(location, due)
+
+    def remove(self, location):
+        """
+        Stop watching a location and forget its data.
+
+        Parameters:
+            location (str): The location.
+        """
+        with self.__condition:
+            self.__arguments.pop(location, None)
+            self.__latest.pop(location, None)
+            self.__status.pop(location, None)
+            self.__due.pop(location, None)
+
+    def get_locations(self):
+        """
+        Returns:
+            list: The watched locations.
+        """
+        return list(self.__arguments)
+
+    def get(self, location):
+        """
+        Get the latest weather data of a location, without waiting.
+
+        Parameters:
+            location (str): The location.
+
+        Returns:
+            Weather: The Weather object of the last complete refresh, not to be modified, or None before the first.
+        """
+        return self.__latest.get(location)
+
+    def get_status(self, location):
+        """
+        Get the refresh status of a location.
+
+        Parameters:
+            location (str): The location.
+
+        Returns:
+            dict: The time of the last successful refresh ('updated_at', epoch seconds, None before the
+                  first), the 'error' of the last refresh (None if it succeeded), the number of successive
+                  'failures', and the seconds until the next refresh ('next_refresh_in').
+
+        Raises:
+            KeyError: If the location is not watched.
+        """
+        with self.__condition:
+            status = dict(self.__status[location])
+            due = self.__due.get(location)
+            status['next_refresh_in'] = None if due is None else max(due - time.monotonic(), 0.0)
+            return status
+
+    def start(self):
+        """
+        Start refreshing the locations in the background.
+        """
+        with self.__condition:
+            if self.__scheduler is not None:
+                return
+            self.__stopping = False
+            self.__executor = ThreadPoolExecutor(self.max_concurrency)
+            self.__scheduler = threading.Thread(target=self.__run, name='ForecastWatchlist', daemon=True)
+            self.__scheduler.start()
+
+    def stop(self):
+        """
+        Stop refreshing the locations, waiting for the refreshes in progress. The latest data stays readable.
+        """
+        with self.__condition:
+            scheduler = self.__scheduler
+            if scheduler is None:
+                return
+            self.__stopping = True
+            self.__condition.notify_all()
+        scheduler.join()
+        self.__executor.shutdown()
+        with self.__condition:
+            self.__scheduler = self.__executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def wait(self, timeout=None):
+        """
+        Wait until every watched location has data.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait, unlimited if None.
+
+        Returns:
+            bool: True if every location has data, False if the timeout expired first.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: all(location in self.__latest for location in self.__arguments), timeout)
+
+    def refresh(self, location):
+        """
+        Refresh a location now, in the calling thread, and reschedule its next refresh.
+
+        Parameters:
+            location (str): The watched location.
+
+        Returns:
+            Weather: The refreshed Weather object.
+
+        Raises:
+            KeyError: If the location is not watched.
+            Exception: The error of the fetch.
+        """
+        arguments = self.__arguments[location]
+        weather = Weather(**self.options)
+        try:
+            weather.fetch_weather_data(location, **arguments)
+            if self.cache_dir:
+                self.__save_cached(location, weather)
+        except Exception as e:
+            with self.__condition:
+                if location in self.__status:
+                    status = self.__status[location]
+                    status['error'] = e
+                    status['failures'] += 1
+                    self.__set_due(location, time.monotonic() + self.retry_interval)
+            raise
+        with self.__condition:
+            if self.__arguments.get(location) is arguments:
+                self.__latest[location] = weather
+                self.__status[location].update(updated_at=time.time(), error=None, failures=0)
+                self.__set_due(location, time.monotonic() + self.__next_interval())
+            elif location in self.__arguments:
+                # replaced during the fetch: refreshed again at once with the new arguments
+                self.__set_due(location, time.monotonic())
+        return weather
+
+    def __next_interval(self):
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def __set_due(self, location, due):
+        """
+        Schedule the next refresh of a location, replacing the scheduled one. Called with the condition held.
+        """
+        self.__due[location] = due
+        heapq.heappush(self.__schedule, (due, location))
+        self.__condition.notify_all()
+
+    def __run(self):
+        """
+        Submit the refreshes as they become due, until stopped.
+        """
+        with self.__condition:
+            while not self.__stopping:
+                now = time.monotonic()
+                while self.__schedule and self.__schedule[0][0] <= now:
+                    due, location = heapq.heappop(self.__schedule)
+                    # entries of removed locations, or replaced by a later schedule, are skipped,
+                    # and so are those of running locations, rescheduled once their refresh ends
+                    if self.__due.get(location) != due or location in self.__running:
+                        continue
+                    del self.__due[location]
+                    self.__running.add(location)
+                    self.__executor.submit(self.__refresh_in_background, location)
+                timeout = self.__schedule[0][0] - now if self.__schedule else None
+                self.__condition.wait(timeout)
+
+    def __refresh_in_background(self, location):
+        try:
+            self.refresh(location)
+        except Exception:
+            pass  # recorded in the status of the location, and retried
+        finally:
+            with self.__condition:
+                self.__running.discard(location)
+
+    def __cache_path(self, location):
+        return os.path.join(self.cache_dir, quote(location, safe='') + SNAPSHOT_EXTENSION)
+
+    def __save_cached(self, location, weather):
+        """
+        Save the data of a location, replacing its snapshot file at once.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        weather.save_snapshot(self.__cache_path(location))
+
+    def __load_cached(self, location):
+        """
+        Load the snapshot of a location, if any, and get the time its next refresh is due.
+        Called with the condition held.
+        """
+        path = self.__cache_path(location)
+        try:
+            weather = Weather(**self.options)
+            weather.load_snapshot(path, mmap=False)
+            modified = os.path.getmtime(path)
+        except (OSError, ValueError):
+            return time.monotonic()
+        self.__latest[location] = weather
+        self.__status[location]['updated_at'] = modified
+        return time.monotonic() + max(self.interval - (time.time() - modified), 0.0)
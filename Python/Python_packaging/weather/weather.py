@@ -1,8 +1,29 @@
-import requests
+import copy as _copy
+import functools
+import inspect
+import threading
+import time
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 
-from utils import extract_subdict_by_keys
-from constants import *
+from .utils import update_dictionary, extract_subdict_by_keys, resolve_projection
+from .constants import *
+from .instrumentation import new_session, reset_connect_time, get_connect_time
+from .columns import get_default_elements, to_column, diff_weather_data, intern_records, intern_weather_data
+from .lazy import materialize_weather_data, loads_lazy_hours
+from .aggregation import group_ranges, reduce_column
+from .windows import rolling
+from .query import parse_predicate, predicate_fields, evaluate_predicate, mask_positions
+from .summary import DEFAULT_PERCENTILES, summarize_column
+from .locks import ReadWriteLock
+from . import export, gaps, shared, snapshot
+
+# Public methods of thread-safe Weather objects called without their lock; fetches only take it to store their data
+UNLOCKED_METHODS = ('fetch_weather_data', 'refresh', 'projected', 'close', 'add_fetch_hook', 'remove_fetch_hook',
+                    'get_response_stats', 'get_data_version')
+# Public methods of thread-safe Weather objects changing the weather data, besides the set_*, update_* and clear_* methods
+WRITING_METHODS = ('load_snapshot', 'attach_shared', 'mark_modified')
 
 # Class to interact with the Visual Crossing Weather API
 class Weather:
@@ -12,50 +33,464 @@ class Weather:
     Attributes:
         base_url (str): Base URL of the API.
         api_key (str): API key for accessing the API.
+        projection (list|dict): Elements (and optionally data sections) the caller will read, sent to the API on fetch.
+        session (requests.Session): HTTP session used to fetch, pooling connections across fetches.
+        budget (QueryBudget): Query cost budget the fetches are charged to, possibly shared with other objects.
+        lazy_hours (bool): Whether the hours of fetched days are decoded on first access instead of at once.
+        decoder (callable): Decodes the raw bytes of responses into weather data, instead of the JSON decoder.
+        thread_safe (bool): Whether the methods of this object can be called from several threads at once.
         __weather_data (dict): Internal storage for weather data.
     """
     
-    def __init__(self, base_url=BASE_URL, api_key=''):
+    def __init__(self, base_url=BASE_URL, api_key='', projection=None, session=None, hooks=None, budget=None,
+                 lazy_hours=False, decoder=None, thread_safe=False):
         """
         Initialize the Weather object with base URL and API key.
 
         Parameters:
             base_url (str): Base URL of the weather API.
             api_key (str): API key for the weather API.
+            projection (list|dict): Optional list of elements that will be read, or a dictionary mapping
+                data sections ('days', 'hours', ...) to the elements read from them. When set, fetches only
+                request these elements and sections instead of the full payload.
+            session (requests.Session): Optional HTTP session to fetch with, a new pooled session by default,
+                closed by `close`.
+            hooks (list): Optional callables called with an event dictionary after each fetch (see `add_fetch_hook`).
+            budget (QueryBudget): Optional query cost budget; fetches estimated to exceed it are refused or deferred.
+            lazy_hours (bool): Whether to decode the days of fetched data at once but keep the raw bytes of each
+                day's hours, decoded the first time the hours of that day are accessed.
+            decoder (callable): Optional callable decoding the raw bytes of responses into weather data, e.g. in
+                another process (see `batch.fetch_many`); lazy_hours is ignored when set. It may also return a
+                tuple of the weather data and columns of it ({'days': {element: column}, 'hours': ...}, see
+                `get_weather_columns`), which then serve the columnar reads without building the records.
+            thread_safe (bool): Whether to guard the weather data with a readers-writer lock, so that one object can
+                serve many threads: any number of them read at once, while changes wait for the reads in progress
+                and hold off new ones. Fetches run without the lock and only take it to swap in the fetched data,
+                so readers are not blocked by the requests.
         """
         self.base_url = base_url
         self.api_key = api_key
+        self.projection = projection
+        self.session = session or new_session()
+        self.__owns_session = session is None
+        self.budget = budget
+        self.lazy_hours = lazy_hours
+        self.decoder = decoder
         self.__weather_data = {}
+        self.__response_stats = {}
+        self.__day_index = {}
+        self.__last_fetch = {}
+        self.__fetch_hooks = list(hooks or [])
+        self.__version = 0
+        self.__views = {}
+        self.__views_mutex = threading.Lock()
+        self.__summaries = {}
+        self.__lock = None
+        if thread_safe:
+            self.__lock = ReadWriteLock()
+            self.__make_thread_safe()
+
+    def __make_thread_safe(self):
+        """
+        Replace the public methods of this object by ones holding its lock: the write side for the
+        methods changing the weather data (see WRITING_METHODS), the read side for the others, but
+        for the methods of UNLOCKED_METHODS.
+        """
+        for name in dir(type(self)):
+            if name.startswith('_') or name in UNLOCKED_METHODS or not inspect.isfunction(inspect.getattr_static(type(self), name)):
+                continue
+            writing = name.startswith(('set_', 'update_', 'clear_')) or name in WRITING_METHODS
+            setattr(self, name, self.__locked(getattr(self, name), self.__lock.write if writing else self.__lock.read))
 
-    def fetch_weather_data(self, location, from_date='', to_date='', unit_group='us', include='days', elements=''):
+    @staticmethod
+    def __locked(method, side):
+        @functools.wraps(method)
+        def locked(*args, **kwargs):
+            with side():
+                return method(*args, **kwargs)
+        return locked
+
+    def __reading(self):
+        return self.__lock.read() if self.__lock is not None else nullcontext()
+
+    def __writing(self):
+        return self.__lock.write() if self.__lock is not None else nullcontext()
+
+    @contextmanager
+    def projected(self, projection):
+        """
+        Temporarily declare the projection used by the fetches made inside a `with` block.
+
+        Parameters:
+            projection (list|dict): Elements, or section -> elements dictionary, that will be read.
+
+        Returns:
+            Weather: This object, with the projection restored when the block exits.
+        """
+        previous = self.projection
+        self.projection = projection
+        try:
+            yield self
+        finally:
+            self.projection = previous
+
+    def close(self):
+        """
+        Close the HTTP session of this object if it created it, releasing its pooled connections.
+        A session given to the constructor is left open, for its owner to close. The weather data
+        stays readable, and a later fetch opens new connections.
+        """
+        if self.__owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fetch_weather_data(self, location, from_date='', to_date='', unit_group='us', include=None, elements=''):
         """
         Fetch weather data for a specified location and date range.
 
         If the unit_group is not specified, it will fetch the data based on US system.
         If only location paramter is given, it will fetch the next 15 days forecasting weather data
+        If a projection is declared, it provides `elements` and `include` unless they are given explicitly.
+        The response is requested with every transfer encoding the installed decoders support
+        (gzip and deflate, plus br and zstd when brotli and zstandard are installed), and its sizes
+        are reported by `get_response_stats`. The fetch hooks are called once the fetch completes or fails.
+        The repeated values of the categorical elements (conditions, icon, stations, ...) of the decoded
+        data are interned, so that they share a single object.
+        If a budget is set, the estimated cost is reserved before sending the request and the actual
+        `queryCost` of the response is charged to it.
 
         Parameters:
             location (str): Location for which weather data is requested.
             from_date (str): Start date of the weather data period (in `yyyy-MM-dd` format).
             to_date (str): End date of the weather data period (in `yyyy-MM-dd` format).
             unit_group (str): Unit system for the weather data ('us', 'metric', 'uk' or 'base').
-            include (str): Data types to include (e.g., 'days', 'hours').
+            include (str): Data types to include (e.g., 'days', 'hours'), 'days' by default.
             elements (str): Specific weather elements to retrieve.
 
         Returns:
             dict: The weather data as a dictionary.
+
+        Raises:
+            BudgetExceededError: If the estimated cost does not fit in the budget.
         """
+        if self.projection:
+            projected_include, projected_elements = resolve_projection(self.projection)
+            include = include or projected_include
+            elements = elements or projected_elements
         params = {
             'unitGroup': unit_group,
-            'include': include,
+            'include': include or DAYS,
             'key': self.api_key,
             'elements': elements
         }
-        response = requests.get(f"{self.base_url}/{location}/{from_date}/{to_date}", params=params)
-        response.raise_for_status()  # Will raise an exception for HTTP error codes
-        self.__weather_data = response.json()
+        self.__last_fetch = {'location': location, 'from_date': from_date, 'to_date': to_date, 'params': params}
+        return self.__request(location, from_date, to_date, params)
+
+    def refresh(self):
+        """
+        Refetch the days whose data can still change and merge them into the stored weather data.
+
+        Days whose source is final (historical observations or forecasts, see `FINAL_SOURCES`) are
+        left untouched; each run of consecutive other days (forecasts, today's combined data,
+        statistical forecasts or days without a source) is refetched with the parameters of the last
+        `fetch_weather_data` call, one request per run. The refetched days replace the stored ones
+        with the same date, and the other top-level values (e.g. `queryCost`, of the last request)
+        are updated.
+
+        Returns:
+            dict: The merged weather data as a dictionary.
+
+        Raises:
+            ValueError: If no weather data was fetched before.
+            BudgetExceededError: If the estimated cost does not fit in the budget.
+        """
+        if not self.__last_fetch:
+            raise ValueError("refresh() requires weather data fetched with fetch_weather_data()")
+        runs = []
+        with self.__reading():
+            final = True
+            for day in self.__weather_data.get(DAYS, []):
+                if day.get(SOURCE) in FINAL_SOURCES:
+                    final = True
+                elif final:
+                    runs.append([day[DATETIME], day[DATETIME]])
+                    final = False
+                else:
+                    runs[-1][1] = day[DATETIME]
+        params = dict(self.__last_fetch['params'], key=self.api_key)
+        for from_date, to_date in runs:
+            self.__request(self.__last_fetch['location'], from_date, to_date, params, merge=True)
         return self.__weather_data
 
+    def __request(self, location, from_date, to_date, params, merge=False):
+        """
+        Send a request to the API and store the weather data of the response, charging the budget
+        and calling the fetch hooks.
+
+        Parameters:
+            location (str): Location for which weather data is requested.
+            from_date (str): Start date of the weather data period.
+            to_date (str): End date of the weather data period.
+            params (dict): Query parameters of the request.
+            merge (bool): Whether to merge the days of the response into the stored weather data
+                          instead of replacing it.
+
+        Returns:
+            dict: The stored weather data as a dictionary.
+        """
+        event = {
+            'location': location, 'from_date': from_date, 'to_date': to_date,
+            'params': {key: value for key, value in params.items() if key != 'key'},
+            'started_at': time.time(), 'status': None, 'cache_hit': False, 'query_cost': None,
+            'compressed_bytes': None, 'decompressed_bytes': None, 'timings': {}, 'error': None,
+        }
+        timings = event['timings']
+        start = time.perf_counter()
+        reserved = None
+        try:
+            if self.budget is not None:
+                reserved = self.budget.reserve(self.budget.estimate(from_date, to_date, params['include']))
+            reset_connect_time()
+            response = self.session.get(f"{self.base_url}/{location}/{from_date}/{to_date}", params=params,
+                                        headers={'Accept-Encoding': DEFAULT_ACCEPT_ENCODING}, stream=True)
+            headers_at = time.perf_counter()
+            timings['connect'] = get_connect_time()
+            timings['ttfb'] = headers_at - start - timings['connect']
+            event['status'] = response.status_code
+            event['cache_hit'] = getattr(response, 'from_cache', False)
+            try:
+                response.raise_for_status()  # Will raise an exception for HTTP error codes
+                content = response.content
+            finally:
+                # streamed: an unread response would hold its connection, kept alive by the raised error
+                response.close()
+            downloaded_at = time.perf_counter()
+            timings['download'] = downloaded_at - headers_at
+            self.__response_stats = {
+                'status': response.status_code,
+                'content_encoding': response.headers.get('Content-Encoding', 'identity'),
+                'compressed_bytes': Weather.get_wire_bytes(response, content),
+                'decompressed_bytes': len(content),
+            }
+            event['compressed_bytes'] = self.__response_stats['compressed_bytes']
+            event['decompressed_bytes'] = self.__response_stats['decompressed_bytes']
+
+            columns = None
+            if self.decoder is not None:
+                data = self.decoder(content)
+                if isinstance(data, tuple):
+                    data, columns = data
+            else:
+                data = loads_lazy_hours(content, intern_records) if self.lazy_hours else response.json()
+            intern_weather_data(data)
+            decoded_at = time.perf_counter()
+            timings['decode'] = decoded_at - downloaded_at
+            event['query_cost'] = data.get(QUERY_COST)
+            if reserved is not None:
+                self.budget.settle(reserved, event['query_cost'])
+                reserved = None
+
+            with self.__writing():
+                self.__touch()
+                if merge:
+                    self.__merge_days(data)
+                else:
+                    self.__weather_data = data
+                    self.__build_day_index()
+                    for level, level_columns in (columns or {}).items():
+                        for element, column in level_columns.items():
+                            self.__cache_view((level, 'column', element), column)
+                timings['index'] = time.perf_counter() - decoded_at
+                return self.__weather_data
+        except Exception as e:
+            event['error'] = e
+            if reserved is not None:
+                self.budget.release(reserved)
+            raise
+        finally:
+            timings['total'] = time.perf_counter() - start
+            self.__call_fetch_hooks(event)
+
+    def add_fetch_hook(self, hook):
+        """
+        Register a callable called after each fetch, whether it succeeded or failed.
+
+        The hook receives an event dictionary with the 'location', 'from_date', 'to_date', the query
+        'params' (without the API key), 'started_at' (epoch seconds), the HTTP 'status', 'cache_hit',
+        'query_cost', 'compressed_bytes', 'decompressed_bytes', the raised 'error' (None on success)
+        and 'timings' in seconds: 'connect' (DNS resolution and connection setup, 0 on a reused
+        connection), 'ttfb' (time to the response headers), 'download', 'decode' (JSON parsing),
+        'index' (lookup index build) and 'total'. Phases not reached are missing from 'timings'.
+
+        Parameters:
+            hook (callable): The callable to register, e.g. an `instrumentation.OpenTelemetryHook`.
+        """
+        self.__fetch_hooks.append(hook)
+
+    def remove_fetch_hook(self, hook):
+        """
+        Unregister a fetch hook.
+
+        Parameters:
+            hook (callable): The callable registered with `add_fetch_hook`.
+        """
+        self.__fetch_hooks.remove(hook)
+
+    def __call_fetch_hooks(self, event):
+        for hook in self.__fetch_hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                print(f"An exception occured in a fetch hook: {type(e).__name__} -> {e}")
+
+    def __merge_days(self, data):
+        """
+        Merge weather data into the stored one: days replace the stored days with the same date
+        (new dates are appended) and the other values are updated.
+
+        Parameters:
+            data (dict): Weather data, typically the response to a request for some of the stored days.
+        """
+        days = self.__weather_data.setdefault(DAYS, [])
+        self.__build_day_index()
+        for day in data.get(DAYS, []):
+            i = self.__day_index.get(day.get(DATETIME))
+            if i is None:
+                self.__day_index[day.get(DATETIME)] = len(days)
+                days.append(day)
+            else:
+                days[i] = day
+        update_dictionary(self.__weather_data, data, [DAYS])
+
+    def __touch(self, level=None, element=None):
+        """
+        Record a change of the weather data, invalidating the cached views of it.
+
+        Parameters:
+            level (str): 'days' or 'hours' when only one element of the records of a level changes,
+                         so that the summaries of the other elements are kept.
+            element (str): The changed element.
+        """
+        self.__version += 1
+        self.__views.clear()
+        if level is None:
+            self.__summaries.clear()
+        else:
+            for key in [key for key in self.__summaries if key[:2] == (level, element)]:
+                del self.__summaries[key]
+
+    def mark_modified(self):
+        """
+        Signal that the weather data was modified in place, e.g. through the dictionaries returned by
+        `get_weather_data`, rather than through the methods of this class, so that the cached views
+        returned by `get_weather_daily_data` and `get_weather_hourly_data` are rebuilt.
+        """
+        self.__touch()
+
+    def get_data_version(self):
+        """
+        Get the version of the weather data, incremented by every change made through the methods of this class.
+
+        Returns:
+            int: The version number.
+        """
+        return self.__version
+
+    def __get_view(self, key, build):
+        """
+        Get a cached view of the weather data, building it on first use after each change.
+
+        Parameters:
+            key (tuple): The key of the view in the cache.
+            build (callable): Builds the view when it is not cached.
+        """
+        view = self.__views.get(key)
+        if view is None:
+            # built without the mutex, as views are built from other views
+            view = self.__cache_view(key, build())
+        return view
+
+    def __cache_view(self, key, view):
+        """
+        Add a view to the cache, evicting the oldest one when full. Readers share the cache, so it is
+        only changed under its mutex; of views built by several readers at once, the first one is kept.
+
+        Returns:
+            The cached view.
+        """
+        with self.__views_mutex:
+            if key in self.__views:
+                return self.__views[key]
+            if len(self.__views) >= MAX_CACHED_VIEWS:
+                del self.__views[next(iter(self.__views))]
+            self.__views[key] = view
+            return view
+
+    def __build_day_index(self):
+        """
+        Build the index of the days by date string, used by the lookups by date. Like a scan of the
+        days, the index finds the first day with a date when several have it.
+        """
+        self.__day_index = {}
+        for i, day in enumerate(self.__weather_data.get(DAYS, [])):
+            self.__day_index.setdefault(day.get(DATETIME), i)
+
+    def __filter_day(self, day_info):
+        """
+        Retrieves the day identified by a date string, through the day index, or by an index.
+
+        Parameters:
+            day_info (str|int): The day's date as a string ('YYYY-MM-DD') or index as an integer.
+
+        Returns:
+            dict: The day's data, or None if no day has this date.
+
+        Raises:
+            ValueError: If the input is not a string or integer.
+            IndexError: If the integer index is out of the range of the days list.
+        """
+        days = self.__weather_data[DAYS]
+        if isinstance(day_info, str):
+            i = self.__day_index.get(day_info)
+            if i is None or i >= len(days) or days[i].get(DATETIME) != day_info:
+                # the days changed since the index was built
+                self.__build_day_index()
+                i = self.__day_index.get(day_info)
+            return days[i] if i is not None else None
+        return Weather.filter_item_by_datetimeVal(days, day_info)
+
+    @staticmethod
+    def get_wire_bytes(response, content):
+        """
+        Returns the number of bytes of a fully read response body as transferred over the wire.
+
+        Parameters:
+            response (requests.Response): The response, requested with `stream=True` and already read.
+            content (bytes): The decoded body of the response.
+
+        Returns:
+            int: The compressed body size, or the decoded size if the transport does not report it.
+        """
+        try:
+            return response.raw.tell()
+        except Exception:
+            return len(content)
+
+    def get_response_stats(self):
+        """
+        Retrieves the transfer statistics of the last fetch.
+
+        Returns:
+        dict: The HTTP status, the `Content-Encoding` of the response and its body size in bytes
+              before ('compressed_bytes') and after ('decompressed_bytes') decoding. Empty before any fetch.
+        """
+        return self.__response_stats
+
     def get_weather_data(self, elements=[]):
         """
         Get the stored weather data.
@@ -64,13 +499,14 @@ class Weather:
             elements (list): List of elements to include in the returned data.
 
         Returns:
-            dict: The weather data as a dictionary, filtered by elements if specified.
+            dict: The weather data as a dictionary, filtered by elements if specified, with any hours
+                  still to be loaded from a snapshot loaded first.
         """
         try:
             if elements:
                 return extract_subdict_by_keys(self.__weather_data, elements)
             else:
-                return self.__weather_data
+                return materialize_weather_data(self.__weather_data)
         except Exception as e:
             return None
 
@@ -81,23 +517,33 @@ class Weather:
         Parameters:
             data (dict): Weather data to store.
         """
+        self.__touch()
         self.__weather_data = data
 
-    def get_weather_daily_data(self, elements=[]):
+    def get_weather_daily_data(self, elements=[], copy=False):
         """
         Get daily weather data, optionally filtered by elements.
 
+        The result is a view cached until the weather data changes, so repeated calls are free. Its
+        dictionaries are the stored days themselves, for speed, and changing them is not detected:
+        call `mark_modified()` after doing so, or the cached columns, summaries and query results
+        keep the previous values. Use `copy=True` to get data that can be changed freely.
+        Unlike earlier versions, the result is a tuple: `append` and slice assignment are not supported.
+
         Parameters:
             elements (list): List of elements to include in the returned data.
+            copy (bool): Whether to return a list of independent copies of the daily data.
 
         Returns:
-            list: List of daily data dictionaries, filtered by elements if specified.
+            tuple|list: Tuple of daily data dictionaries, filtered by elements if specified, or a list of copies.
+                        Only the tuple is read-only: without elements, its dictionaries are the stored days,
+                        to be changed only through the setters or followed by `mark_modified()`.
         """
         try:
-            if elements:
-                return [extract_subdict_by_keys(day, elements) for day in self.__weather_data.get('days', [])]
-            else:
-                return self.__weather_data.get('days', [])
+            view = self.__get_view((DAYS, tuple(elements)), lambda: tuple(
+                [extract_subdict_by_keys(day, elements) for day in self.__weather_data.get('days', [])] if elements
+                else self.__weather_data.get('days', [])))
+            return _copy.deepcopy(list(view)) if copy else view
         except Exception as e:
             return None
 
@@ -108,28 +554,476 @@ class Weather:
         Parameters:
             daily_data (list): List of daily weather data dictionaries.
         """
+        self.__touch()
         self.__weather_data['days'] = daily_data
 
-    def get_weather_hourly_data(self, elements=[]):
+    def get_weather_hourly_data(self, elements=[], copy=False):
         """
         Get hourly weather data for all days, optionally filtered by elements.
 
+        The result is a view cached until the weather data changes, so repeated calls do not flatten
+        the days again. Its dictionaries are the stored hours themselves, for speed, and changing them
+        is not detected: call `mark_modified()` after doing so, or the cached columns, summaries and
+        query results keep the previous values. Use `copy=True` to get data that can be changed freely.
+        Unlike earlier versions, the result is a tuple: `append` and slice assignment are not supported.
+
         Parameters:
             elements (list): List of elements to include in the returned data.
+            copy (bool): Whether to return a list of independent copies of the hourly data.
 
         Returns:
-            list: List of hourly data dictionaries, filtered by elements if specified.
+            tuple|list: Tuple of hourly data dictionaries, filtered by elements if specified, or a list of copies.
+                        Only the tuple is read-only: without elements, its dictionaries are the stored hours,
+                        to be changed only through the setters or followed by `mark_modified()`.
         """
         try:
-            hourly_data = [item for day in self.__weather_data.get('days', []) for item in day.get('hours', [])]   
-            if elements:
-                return [extract_subdict_by_keys(hour_dt, elements) for hour_dt in hourly_data]
-            else:
-                return hourly_data
+            view = self.__get_view((HOURS, tuple(elements)), lambda: tuple(
+                [extract_subdict_by_keys(hour_dt, elements) for hour_dt in self.__get_view((HOURS, ()), self.__flatten_hours)]
+                if elements else self.__flatten_hours()))
+            return _copy.deepcopy(list(view)) if copy else view
         except:
             return None
+
+    def __flatten_hours(self):
+        return tuple(item for day in self.__weather_data.get('days', []) for item in day.get('hours', []))
     
 
+    def get_weather_columns(self, level=HOURS, elements=[]):
+        """
+        Get the daily or hourly weather data in columnar form.
+
+        Parameters:
+            level (str): 'days' for the daily data, or 'hours' for the hourly data of all days.
+            elements (list): List of elements to convert, all the elements of the level if empty.
+
+        Returns:
+            dict: A dictionary mapping each element to its values across the records, as a float
+                  array (`array('d')`, NaN for missing values) for numeric elements or a list otherwise.
+        """
+        return {element: self.__get_column(level, element)[:] for element in elements or get_default_elements(level)}
+
+    def __get_column(self, level, element):
+        """
+        Get the cached column of an element (see `get_weather_columns`), not to be modified.
+        """
+        return self.__get_view((level, 'column', element), lambda: to_column(self.__get_records(level), element))
+
+    def __get_records(self, level):
+        """
+        Get the cached daily or hourly records (see `get_weather_daily_data`), not to be modified.
+        """
+        if level not in (DAYS, HOURS):
+            raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+        return self.get_weather_daily_data() if level == DAYS else self.get_weather_hourly_data()
+
+    def aggregate(self, level=HOURS, freq='D', reducers=None):
+        """
+        Aggregate the daily or hourly weather data by day, week or month.
+
+        Each element is reduced over the cached column of its values, one contiguous slice per
+        period; missing values are skipped.
+
+        Parameters:
+            level (str): 'days' to aggregate the daily data, or 'hours' for the hourly data.
+            freq (str): 'D' for days, 'W' for ISO weeks or 'M' for months.
+            reducers (dict): Reducer of each element: a name ('mean', 'sum', 'min', 'max', 'median',
+                             'count', 'first', 'last') or a callable taking the list of values of a period.
+                             The mean of every numeric element of the level by default.
+
+        Returns:
+            dict: A dictionary mapping each period, in order ('2024-01-01', '2024-W01' or '2024-01'), to a
+                  dictionary of the reduced value of each element. Periods without values give None, but
+                  0 with the 'sum' and 'count' reducers.
+
+        Raises:
+            ValueError: If the level, frequency or a reducer name is invalid.
+
+        Example:
+            weather.aggregate('hours', 'W', {'temp': 'mean', 'precip': 'sum', 'windgust': 'max'})
+        """
+        if level not in (DAYS, HOURS):
+            raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+        if reducers is None:
+            reducers = {element: 'mean' for element in get_default_elements(level)
+                        if element in NUMERIC_Keys and element not in INTEGER_Keys}
+        days = self.get_weather_daily_data()
+        groups = self.__get_view((level, 'groups', freq), lambda: group_ranges(
+            [day.get(DATETIME) for day in days], [1 if level == DAYS else len(day.get(HOURS, [])) for day in days], freq))
+        results = {key: {} for key in groups}
+        for element, reducer in reducers.items():
+            for key, value in reduce_column(self.__get_column(level, element), groups, reducer).items():
+                results[key][element] = value
+        return results
+
+    def query(self, level=HOURS, where='', elements=[]):
+        """
+        Find the days or hours matching a predicate, e.g. `windgust > 50` or
+        `temp > 30 and humidity > 70 or preciptype contains 'snow'`.
+
+        The predicate is evaluated over the cached columns of the elements it uses, comparison by
+        comparison, as masks of the matching records: the right side of `and` is only evaluated for
+        the records matching its left side, so put the most selective comparisons first. Only the
+        matching records are then read.
+
+        Parameters:
+            level (str): 'days' to query the daily data, or 'hours' for the hourly data.
+            where (str): The predicate: comparisons of elements to numbers, quoted strings, true, false,
+                         null or other elements (<, <=, >, >=, ==, !=), `contains` tests of list or text
+                         elements, combined with and, or, not and parentheses. All records if empty.
+            elements (list): List of elements of the returned records, whole records if empty.
+
+        Returns:
+            list: The matching records, in order. With elements, each is a new dictionary holding the
+                  'datetime' and the elements, plus the 'date' of the day for hours; otherwise the stored
+                  records, not to be modified.
+
+        Raises:
+            ValueError: If the level or the predicate is invalid, or the predicate uses an unknown element.
+
+        Example:
+            weather.query('hours', 'windgust > 50', ['windgust', 'winddir'])
+        """
+        records = self.__get_records(level)
+        if where:
+            node = parse_predicate(where)
+            known = set(get_default_elements(level)).union(*records[:1])
+            unknown = sorted(predicate_fields(node) - known)
+            if unknown:
+                raise ValueError(f"Unknown elements in the predicate: {', '.join(unknown)}")
+            positions = mask_positions(evaluate_predicate(node, lambda element: self.__get_column(level, element),
+                                                          len(records)), len(records))
+        else:
+            positions = range(len(records))
+        if not elements:
+            return [records[i] for i in positions]
+        if level == DAYS:
+            return [dict({DATETIME: records[i].get(DATETIME)}, **extract_subdict_by_keys(records[i], elements)) for i in positions]
+        dates = self.__get_hour_dates()
+        return [dict({export.DATE: dates[i], DATETIME: records[i].get(DATETIME)}, **extract_subdict_by_keys(records[i], elements))
+                for i in positions]
+
+    def get_summary(self, level=DAYS, elements=[], k=5, percentiles=DEFAULT_PERCENTILES):
+        """
+        Summarize numeric elements: their minimum and maximum with the records reaching them, their
+        k highest and lowest values, and percentiles, e.g. the hottest day, the wettest hour or the
+        strongest gust.
+
+        The summary of each element is computed over its column on first use and cached apart from
+        the other views. Setters are not applied to the summaries: setting an element of a record
+        discards the summaries of that element only, recomputed on the next call, while the other
+        changes discard them all.
+
+        Parameters:
+            level (str): 'days' to summarize the daily data, or 'hours' for the hourly data.
+            elements (list): List of numeric elements to summarize, all the numeric elements of the level if empty.
+            k (int): The number of highest and lowest values to list.
+            percentiles (tuple): The percentiles to compute, between 0 and 100.
+
+        Returns:
+            dict: A dictionary mapping each element to its summary: the 'count' of values, the 'min' and
+                  'max' records (None without values) and the lists of the 'top' and 'bottom' k records,
+                  each a dictionary of the 'datetime' (plus the 'date' for hours) and the value of the
+                  element, and a dictionary of the 'percentiles' values.
+
+        Raises:
+            ValueError: If the level or a percentile is invalid, or an element is not numeric.
+
+        Example:
+            weather.get_summary('days', ['tempmax', 'precip'])['tempmax']['max']
+        """
+        self.__get_records(level)
+        if not elements:
+            elements = [element for element in get_default_elements(level)
+                        if element in NUMERIC_Keys and element not in INTEGER_Keys]
+        percentiles = tuple(percentiles)
+        summaries = {}
+        for element in elements:
+            key = (level, element, k, percentiles)
+            summary = self.__summaries.get(key)
+            if summary is None:
+                summary = self.__summaries[key] = self.__summarize(level, element, k, percentiles)
+            summaries[element] = {
+                'count': summary['count'],
+                'min': dict(summary['min']) if summary['min'] else None,
+                'max': dict(summary['max']) if summary['max'] else None,
+                'top': [dict(record) for record in summary['top']],
+                'bottom': [dict(record) for record in summary['bottom']],
+                'percentiles': dict(summary['percentiles']),
+            }
+        return summaries
+
+    def __summarize(self, level, element, k, percentiles):
+        """
+        Summarize an element (see `get_summary`), with the records of its extremes.
+        """
+        records = self.__get_records(level)
+        dates = self.__get_hour_dates() if level == HOURS else None
+        column = self.__get_column(level, element)
+        summary = summarize_column(column, k, percentiles)
+
+        def record(i):
+            if i is None:
+                return None
+            if dates is None:
+                return {DATETIME: records[i].get(DATETIME), element: column[i]}
+            return {export.DATE: dates[i], DATETIME: records[i].get(DATETIME), element: column[i]}
+        return {
+            'count': summary['count'],
+            'min': record(summary['min']),
+            'max': record(summary['max']),
+            'top': [record(i) for i in summary['top']],
+            'bottom': [record(i) for i in summary['bottom']],
+            'percentiles': summary['percentiles'],
+        }
+
+    def __get_hour_dates(self):
+        """
+        Get the cached date of the day of each hour, aligned with `get_weather_hourly_data`.
+        """
+        return self.__get_view((HOURS, 'dates'), lambda: tuple(
+            day.get(DATETIME) for day in self.get_weather_daily_data() for _ in day.get(HOURS, [])))
+
+    def rolling(self, element, window, stat='mean', level=HOURS, min_periods=1, q=0.5):
+        """
+        Compute a rolling statistic of an element, e.g. the precipitation of the last 24 hours or the
+        maximum wind gust of the last 72 hours, at each hour (or day).
+
+        Windows cover the records whose `datetimeEpoch` falls within the window length up to and
+        including the current record, so that missing hours shorten a window instead of stretching it.
+        All windows are computed in a single pass over the cached columns.
+
+        Parameters:
+            element (str): The element name, e.g. 'precip'.
+            window (float): The length of the windows, in hours for hourly data or days for daily data.
+            stat (str): 'mean', 'sum', 'min', 'max', 'std', 'median' or 'quantile'.
+            level (str): 'hours' for the hourly data, or 'days' for the daily data.
+            min_periods (int): Minimum number of values in a window for a result, NaN otherwise.
+            q (float): The quantile computed by 'quantile', between 0 and 1.
+
+        Returns:
+            array: The statistic at each record, as a float array (`array('d')`) in the order of
+                   `get_weather_hourly_data` (or `get_weather_daily_data`), NaN where not available.
+
+        Raises:
+            ValueError: If a parameter is invalid or the records lack increasing `datetimeEpoch` values.
+
+        Example:
+            weather.rolling('precip', 24, 'sum')
+        """
+        if level not in (DAYS, HOURS):
+            raise ValueError(f"Invalid level value, expected 'days' or 'hours': {level}")
+        seconds = window * (3600 if level == HOURS else 86400)
+        return rolling(self.__get_column(level, element), self.__get_column(level, DATETIME_EPOCH), seconds, stat, min_periods, q)
+
+    def expanding(self, element, stat='mean', level=HOURS, min_periods=1, q=0.5):
+        """
+        Compute an expanding statistic of an element, over all the records up to each hour (or day).
+
+        Parameters:
+            element (str): The element name, e.g. 'precip'.
+            stat (str): 'mean', 'sum', 'min', 'max', 'std', 'median' or 'quantile'.
+            level (str): 'hours' for the hourly data, or 'days' for the daily data.
+            min_periods (int): Minimum number of values for a result, NaN otherwise.
+            q (float): The quantile computed by 'quantile', between 0 and 1.
+
+        Returns:
+            array: The statistic at each record, as a float array (`array('d')`), NaN where not available.
+
+        Raises:
+            ValueError: If a parameter is invalid.
+        """
+        return rolling(self.__get_column(level, element), None, None, stat, min_periods, q)
+
+    def find_gaps(self, step=3600):
+        """
+        Scan the `datetimeEpoch` values of the hourly data for gaps, duplicates and irregular records,
+        e.g. missing observations or hours repeated around daylight saving time transitions.
+
+        Parameters:
+            step (int): The expected interval between hours, in seconds.
+
+        Returns:
+            dict: The 'gaps' as (epoch before, epoch after, number of missing hours) tuples, and the
+                  positions (in `get_weather_hourly_data`) of the 'duplicates', 'unordered' and 'irregular' hours.
+        """
+        return gaps.find_gaps(self.__get_column(HOURS, DATETIME_EPOCH), step)
+
+    def regularize(self, elements=[], method='linear', step=3600, max_gap=None):
+        """
+        Resample the hourly data onto a regular grid of epochs, filling missing hours and values.
+
+        Hours missing from the data, and null values, are filled by linear interpolation or with the
+        nearest value in time; duplicated hours are collapsed into the last one.
+
+        Parameters:
+            elements (list): List of numeric elements to resample, all the numeric hourly elements if empty.
+            method (str): 'linear', 'nearest', or None to leave missing values as NaN.
+            step (int): The interval of the grid, in seconds.
+            max_gap (int): The maximum span in seconds filled by interpolation, unlimited if None.
+
+        Returns:
+            dict: The grid epochs under 'datetimeEpoch' (an `array('q')`) and the resampled values of each
+                  element, as float arrays (`array('d')`).
+
+        Raises:
+            ValueError: If the method is invalid.
+        """
+        elements = elements or [element for element in HOURS_Keys if element in NUMERIC_Keys and element != DATETIME_EPOCH]
+        grid, columns = gaps.regularize(self.__get_column(HOURS, DATETIME_EPOCH),
+                                        {element: self.__get_column(HOURS, element) for element in elements},
+                                        step, method, max_gap)
+        return dict({DATETIME_EPOCH: grid}, **columns)
+
+    def diff(self, other, elements=[], columnar=False):
+        """
+        Compare the weather data with another one for the same location, e.g. a newer forecast,
+        day by day and hour by hour.
+
+        Days and hours are matched by their datetime values and identical ones are skipped at once.
+        In columnar mode, for data holding the same days and hours, whole element columns are
+        compared at once instead.
+
+        Parameters:
+            other (Weather|dict): The other Weather object, or weather data dictionary.
+            elements (list): List of elements to compare, all the elements found if empty.
+            columnar (bool): Whether to compare column by column.
+
+        Returns:
+            list: The changes, each a dictionary with the 'day' date, the 'time' of the hour (None for
+                  daily values), the 'element' name and its 'old' (this object) and 'new' (other) values.
+                  Days or hours present on one side only have a None element and the whole record as
+                  old or new value.
+
+        Raises:
+            ValueError: If the columnar comparison is requested for data with different days or hours.
+        """
+        other_data = other.get_weather_data() if isinstance(other, Weather) else other
+        return diff_weather_data(self.__weather_data, other_data, elements, columnar)
+
+    def write_csv(self, path_or_file, level=HOURS, elements=[]):
+        """
+        Write the daily or hourly weather data as CSV, streaming the rows from the stored records.
+
+        Hourly rows start with a 'date' column holding the date of their day.
+
+        Parameters:
+            path_or_file (str|file): The path of the file to write, or a text file object.
+            level (str): 'days' for the daily data, or 'hours' for the hourly data of all days.
+            elements (list): List of elements to write as columns, all the elements of the level if empty.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return export.write_csv(self.__weather_data, path_or_file, level, elements)
+
+    def write_ndjson(self, path_or_file, level=HOURS, elements=[]):
+        """
+        Write the daily or hourly weather data as newline-delimited JSON, streaming the records.
+
+        Hourly objects get a 'date' key holding the date of their day.
+
+        Parameters:
+            path_or_file (str|file): The path of the file to write, or a text file object.
+            level (str): 'days' for the daily data, or 'hours' for the hourly data of all days.
+            elements (list): List of elements to write, all the elements of the records if empty.
+
+        Returns:
+            int: The number of records written.
+        """
+        return export.write_ndjson(self.__weather_data, path_or_file, level, elements)
+
+    def write_parquet(self, root_path, level=HOURS, elements=[]):
+        """
+        Write the daily or hourly weather data into a Parquet dataset partitioned by location, year and month.
+
+        Requires the optional `pyarrow` package; see `export.write_parquet_dataset` to write several locations at once.
+
+        Parameters:
+            root_path (str): The directory of the dataset; the partitions written are replaced.
+            level (str): 'days' for the daily data, or 'hours' for the hourly data of all days.
+            elements (list): List of elements to write as columns, all the elements of the level if empty.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return export.write_parquet_dataset(self.__weather_data, root_path, level, elements)
+
+    def save_snapshot(self, path):
+        """
+        Save the weather data to a compact binary snapshot file.
+
+        Numeric elements are stored as contiguous float64 columns, next to a small header holding
+        the top-level elements (timezone, tzoffset, resolvedAddress, stations, ...).
+
+        Parameters:
+            path (str): The path of the file to write.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return snapshot.save_snapshot(self.__weather_data, path)
+
+    def load_snapshot(self, path, mmap=True):
+        """
+        Replace the weather data by the content of a snapshot file written by `save_snapshot`.
+
+        With memory mapping, loading only reads the header and the daily columns: the hours of each
+        day are built from the mapped columns the first time they are accessed, so opening a large
+        archive is immediate and its pages are read as needed.
+
+        Parameters:
+            path (str): The path of the snapshot file.
+            mmap (bool): Whether to memory-map the file instead of reading it whole.
+
+        Raises:
+            ValueError: If the file is not a snapshot.
+        """
+        self.__touch()
+        self.__weather_data = snapshot.load_snapshot(path, mmap)
+        self.__build_day_index()
+
+    def share(self, name=None):
+        """
+        Copy the weather data into a shared memory block, for other processes to attach to with
+        `attach_shared` without copying or unpickling it.
+
+        Parameters:
+            name (str): The name of the block, a random one if None.
+
+        Returns:
+            SharedMemory: The shared memory block; pass its `name` to the other processes, then `close()`
+                          and `unlink()` it once they are done.
+
+        Example:
+            block = weather.share()
+            pool.map(analyze, [(block.name, element) for element in elements])
+        """
+        return shared.share_weather_data(self.get_weather_data(), name)
+
+    def attach_shared(self, name):
+        """
+        Replace the weather data by the weather data shared by another process with `share`, read
+        from the shared memory without copying it: the hours of each day are decoded from the shared
+        columns the first time they are accessed.
+
+        Parameters:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            SharedWeatherData: The attachment, to close once done with the weather data, which must not
+                               be used afterwards. Its `columns` method gives the numeric columns as views
+                               of the shared memory.
+
+        Raises:
+            FileNotFoundError: If there is no block with this name.
+            ValueError: If the block does not hold weather data.
+        """
+        attachment = shared.SharedWeatherData(name)
+        self.__touch()
+        self.__weather_data = attachment.get_weather_data()
+        self.__build_day_index()
+        return attachment
+
     def get_queryCost(self):
         """
         Retrieves the cost of the query from the weather data.
@@ -146,6 +1040,7 @@ class Weather:
         Parameters:
         value (float): The new cost to be set for the query.
         """
+        self.__touch()
         self.__weather_data['queryCost'] = value
     
     def get_latitude(self):
@@ -164,6 +1059,7 @@ class Weather:
         Parameters:
         value (float): The new latitude to be set.
         """
+        self.__touch()
         self.__weather_data['latitude'] = value
     
     def get_longitude(self):
@@ -182,6 +1078,7 @@ class Weather:
         Parameters:
         value (float): The new longitude to be set.
         """
+        self.__touch()
         self.__weather_data['longitude'] = value
     
     def get_resolvedAddress(self):
@@ -200,6 +1097,7 @@ class Weather:
         Parameters:
         value (str): The new resolved address to be set.
         """
+        self.__touch()
         self.__weather_data['resolvedAddress'] = value
     
     def get_address(self):
@@ -218,6 +1116,7 @@ class Weather:
         Parameters:
         value (str): The new address to be set.
         """
+        self.__touch()
         self.__weather_data['address'] = value
     
     def get_timezone(self):
@@ -236,6 +1135,7 @@ class Weather:
         Parameters:
         value (str): The new timezone to be set.
         """
+        self.__touch()
         self.__weather_data['timezone'] = value
     
     def get_tzoffset(self):
@@ -254,6 +1154,7 @@ class Weather:
         Parameters:
         value (float): The new timezone offset to be set.
         """
+        self.__touch()
         self.__weather_data['tzoffset'] = value
     
     def get_stations(self):
@@ -272,6 +1173,7 @@ class Weather:
         Parameters:
         value (list): The new list of weather stations to be set.
         """
+        self.__touch()
         self.__weather_data['stations'] = value
 
 
@@ -318,7 +1220,7 @@ class Weather:
         """
         try:
             if isinstance(day_info, str):
-                day_data = next(day for day in self.__weather_data.get('days', []) if day['datetime'] == day_info)
+                day_data = self.__filter_day(day_info)
             elif isinstance(day_info, int):
                 return self.__weather_data['days'][day_info]
             else:
@@ -343,6 +1245,7 @@ class Weather:
         ValueError: If the input day_info is neither a string nor an integer, or if data is not a dictionary.
         IndexError: If the integer index is out of the range of the days list.
         """
+        self.__touch()
         try:
             if isinstance(day_info, str):
                 for i, day in enumerate(self.__weather_data.get('days', [])):
@@ -393,6 +1296,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'temp')
         try:
             if isinstance(day_info, str):
                 day = next((day for day in self.__weather_data['days'] if day['datetime'] == day_info), None)
@@ -442,6 +1346,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'tempmax')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -492,6 +1397,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'tempmin')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -542,6 +1448,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'feelslike')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -592,6 +1499,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'feelslikemax')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -641,6 +1549,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'feelslikemin')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -691,6 +1600,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'dew')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -741,6 +1651,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'humidity')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -791,6 +1702,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'precip')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -841,6 +1753,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'precipprob')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -891,6 +1804,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'precipcover')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -941,6 +1855,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'preciptype')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -991,6 +1906,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'snow')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1041,6 +1957,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'snowdepth')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1091,6 +2008,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'windgust')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1140,6 +2058,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'windspeed')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1190,6 +2109,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'winddir')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1239,6 +2159,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'pressure')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1289,6 +2210,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'cloudcover')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1338,6 +2260,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'visibility')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1388,6 +2311,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'solarradiation')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1437,6 +2361,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'solarenergy')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1487,6 +2412,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'uvindex')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1537,6 +2463,7 @@ class Weather:
             ValueError: If the input is neither a string nor an integer.
             Exception: For other internal issues, such as index errors.
         """
+        self.__touch(DAYS, 'severerisk')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1587,6 +2514,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'sunrise')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1636,6 +2564,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'sunriseEpoch')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1686,6 +2615,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'sunset')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1735,6 +2665,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'sunsetEpoch')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1785,6 +2716,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'moonphase')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1834,6 +2766,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'conditions')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1884,6 +2817,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'description')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1934,6 +2868,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'icon')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -1983,6 +2918,7 @@ class Weather:
             ValueError: If the input is not a string or integer.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch(DAYS, 'stations')
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -2016,7 +2952,7 @@ class Weather:
         """
         try:
             if isinstance(day_info, str):
-                hourly_data = next((day['hours'] for day in self.__weather_data.get('days', []) if day['datetime'] == day_info), [])
+                hourly_data = (self.__filter_day(day_info) or {}).get('hours', [])
             elif isinstance(day_info, int):
                 hourly_data = self.__weather_data['days'][day_info].get('hours', [])
             else:
@@ -2040,6 +2976,7 @@ class Weather:
             ValueError: If the input is not a string or integer or if data is not a list.
             Exception: For other internal issues, including index errors.
         """
+        self.__touch()
         try:
             if isinstance(day_info, str):
                 for day in self.__weather_data.get('days', []):
@@ -2151,7 +3088,7 @@ class Weather:
             Exception: Propagates any exceptions that may occur during data retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             data = Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)
             if elements:
                 return extract_subdict_by_keys(data, elements)
@@ -2172,8 +3109,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during data setting.
         """
+        self.__touch()
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.set_item_by_datetimeVal(day_item['hours'], time_info, data)
         except Exception as e:
             raise e
@@ -2190,8 +3128,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during data setting.
         """
+        self.__touch()
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.update_item_by_datetimeVal(day_item['hours'], time_info, data)
         except Exception as e:
             raise e
@@ -2212,7 +3151,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['datetimeEpoch']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2229,8 +3168,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'datetimeEpoch')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['datetimeEpoch'] = value
         except Exception as e:
             raise e
@@ -2250,7 +3190,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['temp']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2267,8 +3207,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'temp')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['temp'] = value
         except Exception as e:
             raise e
@@ -2289,7 +3230,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['feelslike']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2306,8 +3247,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'feelslike')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['feelslike'] = value
         except Exception as e:
             raise e
@@ -2327,7 +3269,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['humidity']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2344,8 +3286,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'humidity')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['humidity'] = value
         except Exception as e:
             raise e
@@ -2366,7 +3309,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['dew']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2383,8 +3326,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'dew')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['dew'] = value
         except Exception as e:
             raise e
@@ -2404,7 +3348,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['precip']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2421,8 +3365,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'precip')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['precip'] = value
         except Exception as e:
             raise e
@@ -2443,7 +3388,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['precipprob']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2460,8 +3405,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'precipprob')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['precipprob'] = value
         except Exception as e:
             raise e
@@ -2481,7 +3427,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['snow']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2498,8 +3444,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'snow')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['snow'] = value
         except Exception as e:
             raise e
@@ -2520,7 +3467,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['snowdepth']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2537,8 +3484,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'snowdepth')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['snowdepth'] = value
         except Exception as e:
             raise e
@@ -2558,7 +3506,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['preciptype']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2575,8 +3523,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'preciptype')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['preciptype'] = value
         except Exception as e:
             raise e
@@ -2597,7 +3546,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['windgust']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2614,8 +3563,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'windgust')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['windgust'] = value
         except Exception as e:
             raise e
@@ -2635,7 +3585,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['windspeed']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2652,8 +3602,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'windspeed')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['windspeed'] = value
         except Exception as e:
             raise e
@@ -2674,7 +3625,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['winddir']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2691,8 +3642,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'winddir')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['winddir'] = value
         except Exception as e:
             raise e
@@ -2712,7 +3664,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['pressure']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2729,8 +3681,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'pressure')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['pressure'] = value
         except Exception as e:
             raise e
@@ -2751,7 +3704,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['visibility']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2768,8 +3721,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'visibility')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['visibility'] = value
         except Exception as e:
             raise e
@@ -2789,7 +3743,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['cloudcover']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2806,8 +3760,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'cloudcover')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['cloudcover'] = value
         except Exception as e:
             raise e
@@ -2828,7 +3783,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['solarradiation']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2845,8 +3800,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'solarradiation')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['solarradiation'] = value
         except Exception as e:
             raise e
@@ -2866,7 +3822,7 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['solarenergy']
         except Exception as e:
             print(f"An exception occurred: {type(e).__name__} -> {e}")
@@ -2883,8 +3839,9 @@ class Weather:
         Raises:
             Exception: Propagates any exceptions that may occur during the setting process.
         """
+        self.__touch(HOURS, 'solarenergy')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['solarenergy'] = value
         except Exception as e:
             raise e
@@ -2906,14 +3863,15 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['uvindex']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_uvindex_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'uvindex')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['uvindex'] = value
         except Exception as e:
             raise e
@@ -2934,14 +3892,15 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['severerisk']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_severerisk_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'severerisk')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['severerisk'] = value
         except Exception as e:
             raise e
@@ -2962,14 +3921,15 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['conditions']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_conditions_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'conditions')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['conditions'] = value
         except Exception as e:
             raise e
@@ -2990,14 +3950,15 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['icon']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_icon_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'icon')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['icon'] = value
         except Exception as e:
             raise e
@@ -3018,14 +3979,15 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['stations']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_stations_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'stations')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['stations'] = value
         except Exception as e:
             raise e
@@ -3048,20 +4010,22 @@ class Weather:
             Exception: Logs any exceptions that may occur during the retrieval.
         """
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             return Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['source']
         except Exception as e:
             print(f"An exception occured: {type(e).__name__} -> {e}")
         
     def set_source_at_datetime(self, day_info, time_info, value):
+        self.__touch(HOURS, 'source')
         try:
-            day_item = Weather.filter_item_by_datetimeVal(self.__weather_data['days'], day_info)
+            day_item = self.__filter_day(day_info)
             Weather.filter_item_by_datetimeVal(day_item['hours'], time_info)['source'] = value
         except Exception as e:
             raise e
     
 
     def clear_weather_data(self):
+        self.__touch()
         self.__weather_data.clear()
 
 